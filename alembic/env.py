@@ -4,6 +4,7 @@ from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 from app.database import Base
 from app import models
+from app.utils.schema_fingerprint import clear_fingerprint, store_fingerprint
 
 from alembic import context
 
@@ -89,6 +90,13 @@ def run_migrations_online() -> None:
 
         with context.begin_transaction():
             context.run_migrations()
+            # lets SCHEMA_STARTUP_MODE=fingerprint skip reflection at boot;
+            # only the head schema matches the models (downgrade, upgrade <rev>)
+            current = set(context.get_context().get_current_heads())
+            if current == set(context.get_head_revisions()):
+                store_fingerprint(connection, target_metadata)
+            else:
+                clear_fingerprint(connection)
 
 
 if context.is_offline_mode():
@@ -0,0 +1,37 @@
+"""jobs fulltext search index
+
+Revision ID: 1844d0f1745e
+Revises: 0531530a4287
+Create Date: 2026-10-18 14:05:12.431087
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1844d0f1745e'
+down_revision: Union[str, Sequence[str], None] = '0531530a4287'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # FULLTEXT is MySQL-only; other backends use the in-process index
+    if op.get_bind().dialect.name == 'mysql':
+        op.create_index(
+            'ft_jobs_search',
+            'jobs',
+            ['title', 'department', 'required_skills', 'roles_responsibilities'],
+            unique=False,
+            mysql_prefix='FULLTEXT',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'mysql':
+        op.drop_index('ft_jobs_search', table_name='jobs')
@@ -0,0 +1,30 @@
+"""application tracking id
+
+Revision ID: 1c5e7a9d3b60
+Revises: 0b8d4e6f2a17
+Create Date: 2026-10-18 19:02:17.553820
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1c5e7a9d3b60'
+down_revision: Union[str, Sequence[str], None] = '0b8d4e6f2a17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('job_applications', sa.Column('tracking_id', sa.String(length=36), nullable=True))
+    op.create_index('uq_job_applications_tracking_id', 'job_applications', ['tracking_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_job_applications_tracking_id', table_name='job_applications')
+    op.drop_column('job_applications', 'tracking_id')
@@ -0,0 +1,37 @@
+"""hot query indexes
+
+Revision ID: 2d6f8b0c4e71
+Revises: 1c5e7a9d3b60
+Create Date: 2026-10-18 20:11:42.306518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d6f8b0c4e71'
+down_revision: Union[str, Sequence[str], None] = '1c5e7a9d3b60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # proposed by python -m scripts.index_advisor
+    op.create_index('ix_job_applications_job_status_created', 'job_applications', ['job_id', 'status', 'created_at', 'id'], unique=False)
+    op.create_index('ix_job_applications_status_created', 'job_applications', ['status', 'created_at', 'id'], unique=False)
+    op.create_index('ix_job_applications_created', 'job_applications', ['created_at', 'id'], unique=False)
+    op.create_index(op.f('ix_admins_reset_token'), 'admins', ['reset_token'], unique=False)
+    op.create_index('ix_contacts_created', 'contacts', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_contacts_created', table_name='contacts')
+    op.drop_index(op.f('ix_admins_reset_token'), table_name='admins')
+    op.drop_index('ix_job_applications_created', table_name='job_applications')
+    op.drop_index('ix_job_applications_status_created', table_name='job_applications')
+    op.drop_index('ix_job_applications_job_status_created', table_name='job_applications')
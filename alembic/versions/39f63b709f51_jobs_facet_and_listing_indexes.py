@@ -0,0 +1,32 @@
+"""jobs facet and listing indexes
+
+Revision ID: 39f63b709f51
+Revises: 422f347fc677
+Create Date: 2026-10-18 14:21:07.508312
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '39f63b709f51'
+down_revision: Union[str, Sequence[str], None] = '422f347fc677'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_jobs_facets', 'jobs', ['is_active', 'department', 'job_location', 'work_mode', 'experience_min', 'experience_max', 'salary_min', 'salary_max'], unique=False)
+    op.create_index('ix_jobs_active_created', 'jobs', ['is_active', 'created_at', 'id'], unique=False)
+    op.create_index('ix_jobs_active_department_created', 'jobs', ['is_active', 'department', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_jobs_active_department_created', table_name='jobs')
+    op.drop_index('ix_jobs_active_created', table_name='jobs')
+    op.drop_index('ix_jobs_facets', table_name='jobs')
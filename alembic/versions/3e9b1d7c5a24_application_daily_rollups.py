@@ -0,0 +1,53 @@
+"""application daily rollups
+
+Revision ID: 3e9b1d7c5a24
+Revises: 2d6f8b0c4e71
+Create Date: 2026-10-18 21:03:58.114902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e9b1d7c5a24'
+down_revision: Union[str, Sequence[str], None] = '2d6f8b0c4e71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('application_daily_rollups',
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('applications', sa.Integer(), nullable=False),
+    sa.Column('transitions', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('job_id', 'day', 'status')
+    )
+    # backfill: per job from job_applications (received that day, by current
+    # status) and the audit trail (changes into a status that day) ...
+    op.execute(
+        "INSERT INTO application_daily_rollups (job_id, day, status, applications, transitions) "
+        "SELECT job_id, day, status, SUM(applications), SUM(transitions) FROM ("
+        "SELECT job_id, DATE(created_at) AS day, COALESCE(status, 'Pending') AS status, "
+        "1 AS applications, 0 AS transitions FROM job_applications "
+        "UNION ALL "
+        "SELECT job_id, DATE(created_at), new_status, 0, 1 FROM application_status_changes "
+        "WHERE job_id IS NOT NULL"
+        ") received GROUP BY job_id, day, status"
+    )
+    # ... then all jobs under job_id 0
+    op.execute(
+        "INSERT INTO application_daily_rollups (job_id, day, status, applications, transitions) "
+        "SELECT 0, day, status, SUM(applications), SUM(transitions) FROM application_daily_rollups "
+        "WHERE job_id > 0 GROUP BY day, status"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('application_daily_rollups')
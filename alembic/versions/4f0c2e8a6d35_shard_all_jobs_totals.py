@@ -0,0 +1,55 @@
+"""shard all-jobs totals
+
+Revision ID: 4f0c2e8a6d35
+Revises: 3e9b1d7c5a24
+Create Date: 2026-10-18 23:41:17.502318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f0c2e8a6d35'
+down_revision: Union[str, Sequence[str], None] = '3e9b1d7c5a24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# status_counters.ALL_JOBS_SHARDS when this revision was written
+SHARDS = 16
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # the single job_id 0 all-jobs rows become shards -1 .. -SHARDS
+    op.execute("DELETE FROM application_status_counts WHERE job_id <= 0")
+    op.execute(
+        "INSERT INTO application_status_counts (job_id, status, count) "
+        f"SELECT -1 - job_id % {SHARDS}, status, SUM(count) FROM application_status_counts "
+        f"WHERE job_id > 0 GROUP BY -1 - job_id % {SHARDS}, status"
+    )
+    op.execute("DELETE FROM application_daily_rollups WHERE job_id <= 0")
+    op.execute(
+        "INSERT INTO application_daily_rollups (job_id, day, status, applications, transitions) "
+        f"SELECT -1 - job_id % {SHARDS}, day, status, SUM(applications), SUM(transitions) "
+        "FROM application_daily_rollups "
+        f"WHERE job_id > 0 GROUP BY -1 - job_id % {SHARDS}, day, status"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM application_status_counts WHERE job_id < 0")
+    op.execute(
+        "INSERT INTO application_status_counts (job_id, status, count) "
+        "SELECT 0, status, SUM(count) FROM application_status_counts "
+        "WHERE job_id > 0 GROUP BY status"
+    )
+    op.execute("DELETE FROM application_daily_rollups WHERE job_id < 0")
+    op.execute(
+        "INSERT INTO application_daily_rollups (job_id, day, status, applications, transitions) "
+        "SELECT 0, day, status, SUM(applications), SUM(transitions) FROM application_daily_rollups "
+        "WHERE job_id > 0 GROUP BY day, status"
+    )
@@ -0,0 +1,114 @@
+"""dedup by person
+
+Revision ID: 5b7e3c9a1f48
+Revises: 4f0c2e8a6d35
+Create Date: 2026-10-19 00:26:51.337604
+
+"""
+import hashlib
+import hmac
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e3c9a1f48'
+down_revision: Union[str, Sequence[str], None] = '4f0c2e8a6d35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app/utils/application_dedup.py when this revision was written
+KEY_COLUMNS = ("email_key", "pan_key")
+_DOTLESS_DOMAINS = {"gmail.com", "googlemail.com"}
+
+applications = sa.table(
+    'job_applications',
+    sa.column('id', sa.Integer), sa.column('job_id', sa.Integer),
+    sa.column('email', sa.String), sa.column('pan_number', sa.String),
+    *(sa.column(column, sa.String) for column in KEY_COLUMNS),
+)
+
+
+def _normalize_email(email):
+    if not email or "@" not in email:
+        return None
+    local, _, domain = email.strip().lower().rpartition("@")
+    local = local.split("+", 1)[0]
+    if domain in _DOTLESS_DOMAINS:
+        local, domain = local.replace(".", ""), "gmail.com"
+    return f"{local}@{domain}" if local and domain else None
+
+
+def _normalize_pan(pan):
+    return re.sub(r"\s", "", pan or "").upper() or None
+
+
+def _hash(kind, value):
+    if value is None:
+        return None
+    secret = (settings.DEDUP_HASH_KEY or settings.SECRET_KEY).encode("utf-8")
+    return hmac.new(secret, f"{kind}:{value}".encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def _backfill_keys(connection, batch=1000):
+    """Key every application; when rows already share email and PAN, only the earliest keeps its keys."""
+    set_keys = (
+        applications.update()
+        .where(applications.c.id == sa.bindparam('row_id'))
+        .values({column: sa.bindparam(column) for column in KEY_COLUMNS})
+    )
+    connection.execute(applications.update().values(dict.fromkeys(KEY_COLUMNS)))
+    seen, last_id = set(), 0
+    while True:
+        rows = connection.execute(
+            sa.select(applications.c.id, applications.c.job_id, applications.c.email,
+                      applications.c.pan_number)
+            .where(applications.c.id > last_id)
+            .order_by(applications.c.id)
+            .limit(batch)
+        ).all()
+        if not rows:
+            return
+        params = []
+        for row in rows:
+            keys = {
+                "email_key": _hash("email", _normalize_email(row.email)),
+                "pan_key": _hash("pan", _normalize_pan(row.pan_number)),
+            }
+            person = (row.job_id, keys["email_key"], keys["pan_key"])
+            if all(person) and person in seen:
+                keys = dict.fromkeys(KEY_COLUMNS)
+            elif all(person):
+                seen.add(person)
+            params.append({"row_id": row.id, **keys})
+        connection.execute(set_keys, params)
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # a duplicate is the same email *and* PAN, no longer any one shared key
+    op.drop_index('uq_job_applications_job_pan_key', table_name='job_applications')
+    op.drop_index('uq_job_applications_job_phone_key', table_name='job_applications')
+    op.drop_index('uq_job_applications_job_email_key', table_name='job_applications')
+    op.drop_column('job_applications', 'phone_key')
+    # existing duplicates: only the earliest application keeps its keys
+    _backfill_keys(op.get_bind())
+    op.create_index('uq_job_applications_job_person', 'job_applications', ['job_id', 'email_key', 'pan_key'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_job_applications_job_person', table_name='job_applications')
+    op.add_column('job_applications', sa.Column('phone_key', sa.String(length=64), nullable=True))
+    # per-person keys may collide per column: clear them (scripts/rekey_applications
+    # of the older code recomputes them)
+    op.execute("UPDATE job_applications SET email_key = NULL, pan_key = NULL")
+    op.create_index('uq_job_applications_job_email_key', 'job_applications', ['job_id', 'email_key'], unique=True)
+    op.create_index('uq_job_applications_job_phone_key', 'job_applications', ['job_id', 'phone_key'], unique=True)
+    op.create_index('uq_job_applications_job_pan_key', 'job_applications', ['job_id', 'pan_key'], unique=True)
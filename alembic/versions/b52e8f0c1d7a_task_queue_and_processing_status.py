@@ -0,0 +1,59 @@
+"""task queue and application processing status
+
+Revision ID: b52e8f0c1d7a
+Revises: 7c1d5e2a9b40
+Create Date: 2026-10-18 15:31:47.118930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b52e8f0c1d7a'
+down_revision: Union[str, Sequence[str], None] = '7c1d5e2a9b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('task_queue',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=50), nullable=False),
+    sa.Column('application_id', sa.Integer(), nullable=True),
+    sa.Column('payload', sa.Text(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('run_after', sa.DateTime(), nullable=False),
+    sa.Column('locked_by', sa.String(length=100), nullable=True),
+    sa.Column('locked_at', sa.DateTime(), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('result', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_task_queue_id'), 'task_queue', ['id'], unique=False)
+    op.create_index(op.f('ix_task_queue_application_id'), 'task_queue', ['application_id'], unique=False)
+    op.create_index('ix_task_queue_status_run_after', 'task_queue', ['status', 'run_after'], unique=False)
+
+    op.add_column('job_applications', sa.Column('processing_status', sa.String(length=20), nullable=True))
+    op.add_column('job_applications', sa.Column('photo_thumbnail_file', sa.String(length=255), nullable=True))
+    op.add_column('job_applications', sa.Column('resume_text', sa.Text(), nullable=True))
+    op.add_column('job_applications', sa.Column('pan_card_valid', sa.Boolean(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('job_applications', 'pan_card_valid')
+    op.drop_column('job_applications', 'resume_text')
+    op.drop_column('job_applications', 'photo_thumbnail_file')
+    op.drop_column('job_applications', 'processing_status')
+
+    op.drop_index('ix_task_queue_status_run_after', table_name='task_queue')
+    op.drop_index(op.f('ix_task_queue_application_id'), table_name='task_queue')
+    op.drop_index(op.f('ix_task_queue_id'), table_name='task_queue')
+    op.drop_table('task_queue')
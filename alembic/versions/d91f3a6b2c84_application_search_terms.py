@@ -0,0 +1,36 @@
+"""application search terms
+
+Revision ID: d91f3a6b2c84
+Revises: b52e8f0c1d7a
+Create Date: 2026-10-18 16:05:32.640217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd91f3a6b2c84'
+down_revision: Union[str, Sequence[str], None] = 'b52e8f0c1d7a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('application_terms',
+    sa.Column('term', sa.String(length=64), nullable=False),
+    sa.Column('application_id', sa.Integer(), nullable=False),
+    sa.Column('weight', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('term', 'application_id')
+    )
+    op.create_index('ix_application_terms_application_id', 'application_terms', ['application_id'], unique=False)
+    # existing applications: python -m scripts.reindex_applications
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_application_terms_application_id', table_name='application_terms')
+    op.drop_table('application_terms')
@@ -0,0 +1,44 @@
+"""application status counts
+
+Revision ID: e3a7c4b19f25
+Revises: d91f3a6b2c84
+Create Date: 2026-10-18 17:12:08.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a7c4b19f25'
+down_revision: Union[str, Sequence[str], None] = 'd91f3a6b2c84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('application_status_counts',
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('job_id', 'status')
+    )
+    # backfill: per job, then all jobs under job_id 0
+    op.execute(
+        "INSERT INTO application_status_counts (job_id, status, count) "
+        "SELECT job_id, COALESCE(status, 'Pending'), COUNT(*) FROM job_applications "
+        "GROUP BY job_id, COALESCE(status, 'Pending')"
+    )
+    op.execute(
+        "INSERT INTO application_status_counts (job_id, status, count) "
+        "SELECT 0, COALESCE(status, 'Pending'), COUNT(*) FROM job_applications "
+        "GROUP BY COALESCE(status, 'Pending')"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('application_status_counts')
@@ -0,0 +1,41 @@
+"""application status changes
+
+Revision ID: f06b2d8e5a13
+Revises: e3a7c4b19f25
+Create Date: 2026-10-18 17:48:51.270644
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f06b2d8e5a13'
+down_revision: Union[str, Sequence[str], None] = 'e3a7c4b19f25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('application_status_changes',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('application_id', sa.Integer(), nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=True),
+    sa.Column('old_status', sa.String(length=50), nullable=True),
+    sa.Column('new_status', sa.String(length=50), nullable=False),
+    sa.Column('changed_by', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_application_status_changes_id'), 'application_status_changes', ['id'], unique=False)
+    op.create_index('ix_application_status_changes_application_id', 'application_status_changes', ['application_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_application_status_changes_application_id', table_name='application_status_changes')
+    op.drop_index(op.f('ix_application_status_changes_id'), table_name='application_status_changes')
+    op.drop_table('application_status_changes')
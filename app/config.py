@@ -1,8 +1,99 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Named SQLAlchemy engine profiles, selected with DB_PROFILE.
+# Pool sizes are per process: with gunicorn, every worker gets its own pool.
+ENGINE_PROFILES = {
+    "dev": {
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_recycle": 3600,
+        "pool_timeout": 30,
+        "echo": False,  # logs every statement and its parameters (applicant PII): DB_ECHO=true to opt in
+        "isolation_level": None,
+    },
+    "prod": {
+        "pool_size": 10,
+        "max_overflow": 5,
+        "pool_recycle": 1800,  # below MySQL wait_timeout
+        "pool_timeout": 10,
+        "echo": False,
+        "isolation_level": "READ COMMITTED",
+    },
+    "bench": {
+        "pool_size": 20,
+        "max_overflow": 0,
+        "pool_recycle": -1,
+        "pool_timeout": 30,
+        "echo": False,
+        "isolation_level": None,
+    },
+}
+
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
+    # Optional override for the async engine; derived from DATABASE_URL when unset
+    ASYNC_DATABASE_URL: str | None = None
+    # Optional read replica for read-only handlers (falls back to DATABASE_URL)
+    REPLICA_DATABASE_URL: str | None = None
+    # After a mutation, the client reads from the primary for this long
+    REPLICA_STICKY_SECONDS: int = 5
+
+    # Engine profile; any DB_* value set below overrides the profile default
+    DB_PROFILE: Literal["dev", "prod", "bench"] = "dev"
+    DB_POOL_SIZE: int | None = None
+    DB_MAX_OVERFLOW: int | None = None
+    DB_POOL_RECYCLE: int | None = None
+    DB_POOL_TIMEOUT: int | None = None
+    DB_ECHO: bool | None = None
+    DB_ISOLATION_LEVEL: str | None = None
+
+    # Startup schema check: "create_all" reflects and creates every table,
+    # "fingerprint" compares the alembic-maintained schema fingerprint only
+    SCHEMA_STARTUP_MODE: Literal["create_all", "fingerprint"] = "create_all"
+
+    # Public job catalogue cache (per worker, LRU + TTL)
+    JOB_CACHE_SIZE: int = 512
+    JOB_CACHE_TTL: int = 60
+    # How often a worker re-reads the shared cache version stamps
+    CACHE_VERSION_CHECK_SECONDS: float = 1.0
+
+    # POST /jobs/import: rows per executemany and rows per request
+    JOB_IMPORT_BATCH_SIZE: int = 500
+    JOB_IMPORT_MAX_ROWS: int = 50000
+
+    # Uploads are streamed to disk; larger files / requests get 413
+    UPLOAD_MAX_FILE_BYTES: int = 16 * 1024 * 1024
+    UPLOAD_MAX_REQUEST_BYTES: int = 40 * 1024 * 1024
+
+    # Background document tasks: process-pool size per app worker (0 = do
+    # not run tasks in this process; run `python -m scripts.run_task_worker`
+    # instead), poll interval, retries, lease
+    TASK_WORKERS: int = 0
+    TASK_POLL_SECONDS: float = 1.0
+    TASK_MAX_ATTEMPTS: int = 3
+    TASK_RETRY_BASE_SECONDS: int = 10
+    TASK_LEASE_SECONDS: int = 300
+
+    # POST /admin/applications/: "direct" commits every submission;
+    # "journal" answers 202 once the submission is in a local durable
+    # journal and a batcher writes it to the database in batches
+    # (app/utils/application_ingest.py)
+    APPLY_INGEST_MODE: Literal["direct", "journal"] = "direct"
+    INGEST_JOURNAL_PATH: str = "data/ingest_journal.sqlite3"  # outside the served uploads/
+    INGEST_BATCH_SIZE: int = 200
+    INGEST_FLUSH_SECONDS: float = 0.5
+    INGEST_LEASE_SECONDS: int = 120
+    INGEST_RETENTION_HOURS: int = 168
+
+    # HMAC key of the duplicate-application lookup keys (SECRET_KEY when
+    # unset); after changing it run python -m scripts.rekey_applications
+    DEDUP_HASH_KEY: str | None = None
+
+    # Log requests that issue the same statement shape this many times (N+1)
+    SQL_REPEAT_THRESHOLD: int = 5
 
     # JWT
     SECRET_KEY: str
@@ -21,4 +112,21 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8"
     )
 
+    def engine_options(self) -> dict:
+        """create_engine() keyword arguments for the active profile."""
+        options = dict(ENGINE_PROFILES[self.DB_PROFILE])
+        overrides = {
+            "pool_size": self.DB_POOL_SIZE,
+            "max_overflow": self.DB_MAX_OVERFLOW,
+            "pool_recycle": self.DB_POOL_RECYCLE,
+            "pool_timeout": self.DB_POOL_TIMEOUT,
+            "echo": self.DB_ECHO,
+            "isolation_level": self.DB_ISOLATION_LEVEL,
+        }
+        options.update({k: v for k, v in overrides.items() if v is not None})
+
+        if options["isolation_level"] is None:
+            del options["isolation_level"]  # keep the driver default
+        return options
+
 settings = Settings()
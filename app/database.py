@@ -1,18 +1,82 @@
+from fastapi import Request
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.config import settings
+from app.utils.pool_stats import InstrumentedQueuePool, InstrumentedAsyncQueuePool
+from app.utils.read_routing import prefers_primary
+from app.utils import sql_metrics
 
 # Ensure the database URL comes from Render env
 DATABASE_URL = settings.DATABASE_URL
 
+# Sync driver -> async driver used by the AsyncSession engine
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    scheme, sep, rest = url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL or to_async_url(DATABASE_URL)
+
+# Pool sizes, recycling, statement logging and isolation level (DB_PROFILE)
+ENGINE_OPTIONS = settings.engine_options()
+
 # MySQL engine
 engine = create_engine(
     DATABASE_URL,
-    echo=True,
     future=True,
     pool_pre_ping=True,  # ensures connection is alive
+    poolclass=InstrumentedQueuePool,
+    **ENGINE_OPTIONS,
+)
+
+# Async MySQL engine (used by the `async def` routes)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_pre_ping=True,
+    poolclass=InstrumentedAsyncQueuePool,
+    **ENGINE_OPTIONS,
 )
 
+# Pool telemetry (GET /admin/db/pool)
+engine.pool.stats.listen(engine)
+async_engine.pool.stats.listen(async_engine.sync_engine)
+
+# Read replica engines (the primary doubles as replica when none is configured)
+REPLICA_DATABASE_URL = settings.REPLICA_DATABASE_URL
+
+if REPLICA_DATABASE_URL:
+    replica_engine = create_engine(
+        REPLICA_DATABASE_URL,
+        future=True,
+        pool_pre_ping=True,
+        poolclass=InstrumentedQueuePool,
+        **ENGINE_OPTIONS,
+    )
+    async_replica_engine = create_async_engine(
+        to_async_url(REPLICA_DATABASE_URL),
+        pool_pre_ping=True,
+        poolclass=InstrumentedAsyncQueuePool,
+        **ENGINE_OPTIONS,
+    )
+    replica_engine.pool.stats.listen(replica_engine)
+    async_replica_engine.pool.stats.listen(async_replica_engine.sync_engine)
+else:
+    replica_engine = engine
+    async_replica_engine = async_engine
+
+# Per-request statement counts / timings (Server-Timing header)
+for _engine in {engine, async_engine.sync_engine, replica_engine, async_replica_engine.sync_engine}:
+    sql_metrics.instrument(_engine)
+
 # Session maker
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -20,6 +84,30 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# Async session maker
+# expire_on_commit=False so ORM objects can be serialized after commit
+# without an implicit (and forbidden) lazy load on the event loop
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# Read-only session makers
+ReplicaSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=replica_engine
+)
+
+AsyncReplicaSessionLocal = async_sessionmaker(
+    bind=async_replica_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Base class for models
 Base = declarative_base()
 
@@ -30,3 +118,29 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Async dependency
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Read-only dependencies: replica, or the primary inside the client's
+# read-your-writes window (see app/utils/read_routing.py)
+def get_read_db(request: Request):
+    factory = SessionLocal if prefers_primary(request) else ReplicaSessionLocal
+    db = factory()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def async_read_sessionmaker(request: Request):
+    return AsyncSessionLocal if prefers_primary(request) else AsyncReplicaSessionLocal
+
+
+async def get_async_read_db(request: Request):
+    async with async_read_sessionmaker(request)() as db:
+        yield db
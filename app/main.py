@@ -4,7 +4,14 @@ from fastapi.staticfiles import StaticFiles
 from dotenv import load_dotenv
 import os
 
+from app.config import settings
 from app.database import engine, Base
+from app.utils.schema_fingerprint import verify_fingerprint
+from app.utils.read_routing import read_your_writes
+from app.utils.sql_metrics import sql_timing
+from app.utils.file_upload import reject_oversized_uploads
+from app.utils.task_queue import worker as task_worker
+from app.utils.application_ingest import batcher as ingest_batcher, journal as ingest_journal
 from app.routes import (
     auth,
     admin_test,
@@ -15,6 +22,7 @@ from app.routes import (
     contact,
     csr,
     onboarding_admin,
+    db_stats,
 )
 
 load_dotenv()  # Loads .env file
@@ -40,19 +48,70 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # pagination cursors for list endpoints that return a bare JSON array
+    expose_headers=["X-Next-Cursor", "X-Prev-Cursor", "X-Total-Count"],
 )
 
+# -------------------------------------------------
+# Read-your-writes stickiness for replica routing
+# -------------------------------------------------
+app.middleware("http")(read_your_writes)
+
+# -------------------------------------------------
+# Per-request SQL count / time (Server-Timing) and N+1 logging
+# -------------------------------------------------
+app.middleware("http")(sql_timing)
+
+# -------------------------------------------------
+# 413 for oversized multipart bodies before they are parsed
+# -------------------------------------------------
+app.middleware("http")(reject_oversized_uploads)
+
 # -------------------------------------------------
 # Serve uploaded files (IMPORTANT 🔥)
 # -------------------------------------------------
 app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 
 # -------------------------------------------------
-# Create tables on startup
+# Create tables (or verify the schema fingerprint) on startup
 # -------------------------------------------------
 @app.on_event("startup")
 def on_startup():
-    Base.metadata.create_all(bind=engine)
+    if settings.SCHEMA_STARTUP_MODE == "fingerprint":
+        verify_fingerprint(engine, Base.metadata)  # fails fast on drift
+    else:
+        Base.metadata.create_all(bind=engine)
+
+
+# -------------------------------------------------
+# Background document tasks in this process (TASK_WORKERS > 0, e.g. a
+# single-process dev server); deployments run scripts/run_task_worker.py
+# -------------------------------------------------
+@app.on_event("startup")
+async def start_task_worker():
+    if settings.TASK_WORKERS > 0:
+        task_worker.start()
+
+
+@app.on_event("shutdown")
+async def stop_task_worker():
+    await task_worker.stop()
+
+
+# -------------------------------------------------
+# Write-behind application ingestion (APPLY_INGEST_MODE=journal);
+# submissions journaled before a crash are flushed on the next start
+# -------------------------------------------------
+@app.on_event("startup")
+async def start_ingest_batcher():
+    if settings.APPLY_INGEST_MODE == "journal":
+        ingest_batcher.start()
+
+
+@app.on_event("shutdown")
+async def stop_ingest_batcher():
+    await ingest_batcher.stop()
+    ingest_journal.close()
 
 # -------------------------------------------------
 # Routers
@@ -60,9 +119,11 @@ def on_startup():
 app.include_router(auth.router)
 app.include_router(admin_test.router)
 app.include_router(otp.router)
+# before public_jobs: its GET /jobs/{job_id} would otherwise catch /jobs/admin
 app.include_router(job.router)
 app.include_router(public_jobs.router)
 app.include_router(jobapplication.router)
 app.include_router(contact.router)
 app.include_router(csr.router)
 app.include_router(onboarding_admin.router)
+app.include_router(db_stats.router)
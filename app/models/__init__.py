@@ -7,4 +7,11 @@ from .onboarding_checklist import OnboardingChecklist
 from .onboarding_documents import OnboardingDocument
 from .onboarding_nominee import OnboardingNominee , OnboardingBank , OnboardingFamily , OnboardingReference
 from .onboarding import Onboarding
-from .otp import OTP
\ No newline at end of file
+from .otp import OTP
+from .cache_version import CacheVersion
+from .blob import Blob
+from .task_queue import QueuedTask
+from .application_term import ApplicationTerm
+from .application_status_count import ApplicationStatusCount
+from .application_status_change import ApplicationStatusChange
+from .application_daily_rollup import ApplicationDailyRollup
\ No newline at end of file
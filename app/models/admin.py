@@ -11,7 +11,7 @@ class Admin(Base):
     otp = Column(String(6), nullable=True)
     otp_expiry = Column(DateTime, nullable=True)
 
-    reset_token = Column(String(255), nullable=True)
+    reset_token = Column(String(255), nullable=True, index=True)
     reset_token_expiry = Column(DateTime, nullable=True)
     is_active = Column(Boolean, default=True)   
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, Date
+from app.database import Base
+
+class ApplicationDailyRollup(Base):
+    __tablename__ = "application_daily_rollups"
+
+    # Daily aggregates behind GET /admin/applications/analytics, kept in
+    # step by every write to job_applications (app/utils/application_rollups.py).
+    # job_ids below 0 are the shards of the totals over all jobs.
+    job_id = Column(Integer, primary_key=True)
+    day = Column(Date, primary_key=True)
+    status = Column(String(50), primary_key=True)
+    # applications received on `day` that are now in `status`
+    applications = Column(Integer, nullable=False, default=0)
+    # status changes into `status` made on `day`
+    transitions = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from sqlalchemy.sql import func
+from app.database import Base
+
+class ApplicationStatusChange(Base):
+    __tablename__ = "application_status_changes"
+    __table_args__ = (
+        # history of one application, oldest first
+        Index("ix_application_status_changes_application_id", "application_id", "id"),
+    )
+
+    # Audit trail of status transitions; kept after the application is
+    # deleted, hence no foreign key
+    id = Column(Integer, primary_key=True, index=True)
+    application_id = Column(Integer, nullable=False)
+    job_id = Column(Integer)
+    old_status = Column(String(50))
+    new_status = Column(String(50), nullable=False)
+    changed_by = Column(Integer)  # admins.id
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
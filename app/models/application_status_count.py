@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, String
+from app.database import Base
+
+class ApplicationStatusCount(Base):
+    __tablename__ = "application_status_counts"
+
+    # Applications per (job, status), kept in step by every write to
+    # job_applications (app/utils/status_counters.py). job_ids below 0 are
+    # the shards of the totals over all jobs.
+    job_id = Column(Integer, primary_key=True)
+    status = Column(String(50), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, Float, Index
+from app.database import Base
+
+class ApplicationTerm(Base):
+    __tablename__ = "application_terms"
+    __table_args__ = (
+        # unindexing a deleted application
+        Index("ix_application_terms_application_id", "application_id"),
+    )
+
+    # Inverted index for GET /admin/applications/search
+    # (app/utils/application_search.py); the PK serves term lookups
+    term = Column(String(64), primary_key=True)
+    application_id = Column(Integer, primary_key=True)
+    weight = Column(Float, nullable=False)
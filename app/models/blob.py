@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+class Blob(Base):
+    __tablename__ = "blobs"
+
+    # Content-addressed upload (app/utils/blob_store.py), shared by every
+    # row whose file column points at `path`
+    sha256 = Column(String(64), primary_key=True)
+    path = Column(String(255), nullable=False, unique=True)
+    size = Column(Integer, nullable=False)
+    content_type = Column(String(100))
+    refcount = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,9 @@
+from sqlalchemy import Column, Integer, String
+from app.database import Base
+
+class CacheVersion(Base):
+    __tablename__ = "cache_versions"
+
+    # One row per cached data set (e.g. "jobs"), bumped on every change
+    name = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
@@ -1,8 +1,25 @@
-from sqlalchemy import Column, Integer, String, Float, Text, Date, DateTime, func
+from sqlalchemy import Column, Integer, String, Float, Text, Date, DateTime, Boolean, Index, func
 from app.database import Base
 
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Relevance-ranked public search (app/utils/job_search.py), MySQL only
+        Index(
+            "ft_jobs_search",
+            "title", "department", "required_skills", "roles_responsibilities",
+            mysql_prefix="FULLTEXT",
+        ).ddl_if(dialect="mysql"),
+        # Covers the facet GROUP BY and its filters (index-only scan)
+        Index(
+            "ix_jobs_facets",
+            "is_active", "department", "job_location", "work_mode",
+            "experience_min", "experience_max", "salary_min", "salary_max",
+        ),
+        # Newest-first keyset listing, unfiltered and by department
+        Index("ix_jobs_active_created", "is_active", "created_at", "id"),
+        Index("ix_jobs_active_department_created", "is_active", "department", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -28,4 +45,5 @@ class Job(Base):
     openings = Column(Integer)
 
     application_deadline = Column(Date)
+    is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=func.now())
\ No newline at end of file
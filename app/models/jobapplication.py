@@ -1,9 +1,20 @@
-from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, Text, ForeignKey, Index
 from sqlalchemy.sql import func
 from app.database import Base
 
 class Application(Base):
     __tablename__ = "job_applications"
+    __table_args__ = (
+        # one application per person and job (app/utils/application_dedup.py)
+        Index("uq_job_applications_job_email_key", "job_id", "email_key", unique=True),
+        Index("uq_job_applications_job_phone_key", "job_id", "phone_key", unique=True),
+        Index("uq_job_applications_job_pan_key", "job_id", "pan_key", unique=True),
+        Index("uq_job_applications_tracking_id", "tracking_id", unique=True),
+        # admin listings: filters + newest-first sort (scripts/index_advisor.py)
+        Index("ix_job_applications_job_status_created", "job_id", "status", "created_at", "id"),
+        Index("ix_job_applications_status_created", "status", "created_at", "id"),
+        Index("ix_job_applications_created", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False)
@@ -44,4 +55,19 @@ class Application(Base):
 
     captcha_verified = Column(Boolean, default=False)
     status = Column(String(50), default="Pending")
+
+    # Post-upload document processing (app/utils/task_queue.py)
+    processing_status = Column(String(20), default="pending")  # pending | processing | done | failed
+    photo_thumbnail_file = Column(String(255))
+    resume_text = Column(Text)
+    pan_card_valid = Column(Boolean)
+
+    # HMAC-SHA256 of the normalized email / phone / PAN (NULL when absent)
+    email_key = Column(String(64))
+    phone_key = Column(String(64))
+    pan_key = Column(String(64))
+    # Ingestion journal id (app/utils/application_ingest.py); NULL when
+    # the application was committed directly
+    tracking_id = Column(String(36))
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
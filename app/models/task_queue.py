@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from sqlalchemy.sql import func
+from app.database import Base
+
+class QueuedTask(Base):
+    __tablename__ = "task_queue"
+    __table_args__ = (
+        # the worker's poll: due tasks oldest first
+        Index("ix_task_queue_status_run_after", "status", "run_after"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String(50), nullable=False)
+    # No FK: tasks of a deleted application just finish as no-ops
+    application_id = Column(Integer, index=True)
+    payload = Column(Text)  # JSON arguments for the handler
+
+    status = Column(String(20), nullable=False, default="queued")  # queued | running | done | failed
+    attempts = Column(Integer, nullable=False, default=0)
+    run_after = Column(DateTime, nullable=False)  # naive UTC, set by enqueue()
+    locked_by = Column(String(100))
+    locked_at = Column(DateTime)  # naive UTC
+    last_error = Column(Text)
+    result = Column(Text)  # JSON
+
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
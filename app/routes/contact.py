@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends,HTTPException
+from fastapi import APIRouter, Depends,HTTPException, Query, Response
 from sqlalchemy.orm import Session
+from typing import Optional
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.contact import Contact
 from app.schemas.contact import ContactCreate, ContactResponse,BulkDeleteRequest
+from app.utils import sparse_fields
 from app.utils.jwt_dependency import get_current_admin
+from app.utils.pagination import keyset, keyset_page, set_cursor_headers
 
 router = APIRouter(
     prefix="/contact",
@@ -28,19 +31,32 @@ def submit_contact(
 # 🔐 ADMIN – VIEW CONTACT MESSAGES
 @router.get("/admin/contacts", response_model=list[ContactResponse])
 def list_contacts(
-    db: Session = Depends(get_db),
+    response: Response,
+    limit: int = Query(default=100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor / X-Prev-Cursor of a previous page"),
+    include_total: bool = False,
+    fields: Optional[str] = Query(None, description=sparse_fields.FIELDS_DESCRIPTION),
+    db: Session = Depends(get_read_db),
     admin=Depends(get_current_admin)
 ):
-    return (
-        db.query(Contact)
-        .order_by(Contact.created_at.desc())
-        .all()
-    )
+    names = sparse_fields.parse_fields(fields, ContactResponse)
+    query = db.query(Contact)
+    if names:
+        query = query.options(*sparse_fields.columns(Contact, names))
+
+    query, token = keyset(query, Contact, cursor, limit)
+    contacts, next_cursor, prev_cursor = keyset_page(query.all(), token, limit)
+
+    total = db.query(Contact).count() if include_total else None
+    if names:
+        response = sparse_fields.json_response(contacts, ContactResponse, names)
+    set_cursor_headers(response, next_cursor, prev_cursor, total)
+    return response if names else contacts
 
 @router.get("/admin/contacts/{contact_id}", response_model=ContactResponse)
 def get_contact(
     contact_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     admin=Depends(get_current_admin)
 ):
     contact = db.query(Contact).filter(Contact.id == contact_id).first()
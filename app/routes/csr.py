@@ -7,19 +7,25 @@ from fastapi import (
 )
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.csr import CSR
 from app.schemas.csr import CSRCreate, CSRUpdate, CSRResponse
 from app.utils.jwt_dependency import get_current_admin
 from app.utils.file_upload import save_upload_file
+from app.utils.cache import version_stamp
+from app.utils.etag import conditional
 
 
 router = APIRouter( prefix="/csr",tags=["CSR"]
 )
 
 
-@router.get("", response_model=list[CSRResponse])
-def list_csr(db: Session = Depends(get_db)):
+# Bumped by every CSR write; drives the ETag of the public listing
+csr_version = version_stamp("csr")
+
+
+@router.get("", response_model=list[CSRResponse], dependencies=[Depends(conditional("csr"))])
+def list_csr(db: Session = Depends(get_read_db)):
     """
     Get all active CSR activities (Public)
     """
@@ -45,7 +51,7 @@ def upload_csr_image(
             detail="Only JPG or PNG images are allowed"
         )
 
-    file_path = save_upload_file("uploads/csr", file)
+    file_path = save_upload_file("uploads/csr", file, allowed={"image/jpeg", "image/png"})
 
     return {
         "file_path": file_path
@@ -63,6 +69,7 @@ def create_csr(
     """
     csr = CSR(**data.dict())
     db.add(csr)
+    csr_version.bump(db)
     db.commit()
     db.refresh(csr)
     return csr
@@ -85,6 +92,7 @@ def update_csr(
     for key, value in data.dict(exclude_unset=True).items():
         setattr(csr, key, value)
 
+    csr_version.bump(db)
     db.commit()
     db.refresh(csr)
     return csr
@@ -104,6 +112,7 @@ def delete_csr(
         raise HTTPException(status_code=404, detail="CSR not found")
 
     csr.is_active = False
+    csr_version.bump(db)
     db.commit()
 
     return {
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends
+
+from app.config import settings
+from app.database import (
+    engine,
+    async_engine,
+    replica_engine,
+    async_replica_engine,
+    ENGINE_OPTIONS,
+)
+from app.utils.jwt_dependency import get_current_admin
+from app.utils import job_cache
+
+router = APIRouter(prefix="/admin/db", tags=["Admin"])
+
+
+# -------------------- POOL TELEMETRY --------------------
+@router.get("/pool")
+def get_pool_stats(admin=Depends(get_current_admin)):
+    """
+    Live connection-pool usage per engine (Admin)
+    """
+    engines = {
+        "sync": engine,
+        "async": async_engine,
+    }
+    if settings.REPLICA_DATABASE_URL:
+        engines["replica"] = replica_engine
+        engines["async_replica"] = async_replica_engine
+
+    return {
+        "profile": settings.DB_PROFILE,
+        "options": ENGINE_OPTIONS,
+        "engines": {
+            name: e.pool.stats.snapshot(e.pool) for name, e in engines.items()
+        },
+    }
+
+
+# -------------------- CACHE TELEMETRY --------------------
+@router.get("/cache")
+def get_cache_stats(admin=Depends(get_current_admin)):
+    """
+    Hit / miss / eviction counters of this worker's caches (Admin)
+    """
+    return {
+        "jobs": {
+            **job_cache.cache.stats(),
+            "version": job_cache.version.last_seen,
+        },
+    }
@@ -1,10 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
-from typing import List
-from app.database import get_db
+from typing import List, Literal, Optional
+from app.database import get_db, get_read_db
 from app.utils.jwt_dependency import get_current_admin
 from app.models.job import Job
-from app.schemas.job import JobCreate, JobResponse, JobUpdate
+from app.schemas.job import (
+    JobBatchUpdate, JobBatchUpdateResult, JobCreate, JobImportResult, JobResponse, JobUpdate,
+)
+from app.utils import job_search, job_cache, job_import
+from app.utils.job_batch import batch_update
+from app.utils.pagination import keyset, keyset_page, set_cursor_headers
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
@@ -17,24 +22,51 @@ def create_job(
 ):
     new_job = Job(**request.dict())
     db.add(new_job)
+    job_cache.invalidate(db)
     db.commit()
     db.refresh(new_job)
+    job_search.index.add(new_job)
     return new_job
 
 
-# GET ALL JOBS
-@router.get("/", response_model=List[JobResponse])
-def get_all_jobs(
+# BULK IMPORT (CSV / NDJSON body, streamed)
+@router.post("/import", response_model=JobImportResult)
+async def import_jobs(
+    request: Request,
+    format: Optional[Literal["csv", "ndjson"]] = None,
+    atomic: bool = False,
+    current_user=Depends(get_current_admin),
     db: Session = Depends(get_db),
+):
+    fmt = format or job_import.detect_format(request.headers.get("content-type"))
+    return await job_import.import_jobs(db, request.stream(), fmt, atomic)
+
+
+# GET ALL JOBS (admin: inactive jobs included; the public listing is in public_jobs.py)
+@router.get("/admin", response_model=List[JobResponse])
+def get_all_jobs(
+    response: Response,
+    db: Session = Depends(get_read_db),
     skip: int = 0,
-    limit: int = Query(default=100, le=100)
+    limit: int = Query(default=100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor / X-Prev-Cursor of a previous page"),
+    include_total: bool = False,
+    current_user=Depends(get_current_admin),
 ):
-    return db.query(Job).offset(skip).limit(limit).all()
+    # newest first on (created_at, id); `skip` is kept for older clients
+    query, token = keyset(db.query(Job), Job, cursor, limit)
+    if skip and not cursor:
+        query, token = query.offset(skip), {"d": "next"}
+    jobs, next_cursor, prev_cursor = keyset_page(query.all(), token, limit)
 
+    total = db.query(Job).count() if include_total else None
+    set_cursor_headers(response, next_cursor, prev_cursor, total)
+    return jobs
 
-# GET JOB BY ID
-@router.get("/{job_id}", response_model=JobResponse)
-def get_job(job_id: int, db: Session = Depends(get_db)):
+
+# GET JOB BY ID (admin)
+@router.get("/admin/{job_id}", response_model=JobResponse)
+def get_job(job_id: int, db: Session = Depends(get_read_db), current_user=Depends(get_current_admin)):
     job = db.query(Job).filter(Job.id == job_id).first()
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -57,17 +89,32 @@ def update_job(
     update_data = request.dict(exclude_unset=True)
 
     # Apply only changed fields
+    changed = False
     for field, value in update_data.items():
         old_value = getattr(job, field)
         if value != old_value:
             setattr(job, field, value)
+            changed = True
 
-    # If nothing changed, no need to commit
+    # If nothing changed, the cached catalogue stays valid
+    if changed:
+        job_cache.invalidate(db)
     db.commit()
     db.refresh(job)
+    job_search.index.add(job)
     return job
 
 
+# BATCH UPDATE (per-id fields, or filter + fields)
+@router.patch("/", response_model=JobBatchUpdateResult)
+def batch_update_jobs(
+    request: JobBatchUpdate,
+    current_user=Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    return batch_update(db, request)
+
+
 # DELETE JOB
 @router.delete("/{job_id}")
 def delete_job(job_id: int, current_user=Depends(get_current_admin), db: Session = Depends(get_db)):
@@ -76,7 +123,9 @@ def delete_job(job_id: int, current_user=Depends(get_current_admin), db: Session
         raise HTTPException(status_code=404, detail="Job not found")
     
     db.delete(job)
+    job_cache.invalidate(db)
     db.commit()
+    job_search.index.remove([job_id])
     return {"message": "Job deleted successfully"}
 
 @router.delete("/bulk")
@@ -86,7 +135,10 @@ def bulk_delete_jobs(
     db: Session = Depends(get_db)
 ):
     deleted_count = db.query(Job).filter(Job.id.in_(job_ids)).delete(synchronize_session=False)
+    if deleted_count:
+        job_cache.invalidate(db)
     db.commit()
+    job_search.index.remove(job_ids)
     
     if deleted_count == 0:
         raise HTTPException(status_code=404, detail="No jobs found for the provided IDs")
@@ -98,5 +150,7 @@ def bulk_delete_jobs(
 @router.delete("/")
 def delete_all_jobs( current_user=Depends(get_current_admin),db: Session = Depends(get_db)):
     deleted = db.query(Job).delete()
+    job_cache.invalidate(db)
     db.commit()
+    job_search.index.clear()
     return {"message": f"Deleted {deleted} jobs"}
@@ -1,29 +1,57 @@
 from fastapi import (
     APIRouter, Depends, HTTPException,
-    UploadFile, File, Form, Query, Body
+    UploadFile, File, Form, Query, Body, Request, Response
 )
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import Optional, List
-from datetime import date
-import os
-
-from app.database import get_db
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.exc import IntegrityError
+from collections import Counter
+from typing import Literal, Optional, List
+from datetime import date, datetime, timezone
+
+from app.config import settings
+from app.database import async_read_sessionmaker, get_async_db, get_async_read_db
 from app.models.jobapplication import Application
-from app.schemas.jobapplication import ApplicationCreate, ApplicationResponse
+from app.models.task_queue import QueuedTask
+from app.schemas.jobapplication import (
+    ApplicationBulkDeleteResult, ApplicationBulkStatus, ApplicationBulkStatusResult,
+    ApplicationCreate, ApplicationDuplicate, ApplicationProcessing, ApplicationResponse,
+    ApplicationSearchResult, IngestAccepted, IngestStatus,
+)
 from app.utils.jwt_dependency import get_current_admin
-from app.utils.file_upload import save_upload_file
+from app.utils import (
+    application_dedup, application_export, application_ingest, application_rollups,
+    application_search, application_status, blob_store, sparse_fields, status_counters, task_queue,
+)
+from app.utils.file_upload import DOCUMENT_TYPES, IMAGE_TYPES, discard, save_uploads
+from app.utils.pagination import (
+    keyset, keyset_page, offset_from_cursor, offset_page, set_cursor_headers,
+)
 from app.models.admin import Admin as User
 
 router = APIRouter(prefix="/admin/applications", tags=["Job Applications"])
 
-UPLOAD_DIR = "uploads/job_applications"
+FILE_FIELDS = ("pan_card_file", "resume_file", "photo_file")
+
+
+def _duplicate(existing: Application) -> JSONResponse:
+    return JSONResponse(status_code=200, content=ApplicationDuplicate(application_id=existing.id).model_dump())
 
 
 # -------------------------------------------------------------------
 # CREATE APPLICATION
 # -------------------------------------------------------------------
-@router.post("/", response_model=ApplicationResponse, status_code=201)
+@router.post(
+    "/",
+    response_model=ApplicationResponse,
+    status_code=201,
+    responses={
+        200: {"model": ApplicationDuplicate, "description": "Already applied to this job"},
+        202: {"model": IngestAccepted, "description": "Journaled (APPLY_INGEST_MODE=journal)"},
+    },
+)
 async def apply_job(
     job_id: int = Form(...),
     first_name: str = Form(...),
@@ -61,8 +89,15 @@ async def apply_job(
     resume: UploadFile = File(...),
     photo: UploadFile = File(...),
 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
+    """
+    201 with the new application, or 200 with just the id of the one already
+    on file when the same email, phone or PAN has applied to this job (the
+    endpoint is public: a repeat submission never gets the stored applicant
+    data back). In journal mode, 202 with a tracking id (see
+    GET /admin/applications/ingest/{id}).
+    """
     # --------------------------------------------------
     # CAPTCHA CHECK
     # --------------------------------------------------
@@ -114,11 +149,43 @@ async def apply_job(
     )
 
     # --------------------------------------------------
-    # FILE UPLOADS (UTILITY FUNCTION)
+    # DUPLICATE CHECK (one index probe, before any file is stored)
     # --------------------------------------------------
-    pan_card_path = save_upload_file(UPLOAD_DIR, pan_card)
-    resume_path = save_upload_file(UPLOAD_DIR, resume)
-    photo_path = save_upload_file(UPLOAD_DIR, photo)
+    keys = application_dedup.lookup_keys(email, phone, pan_number)
+    existing = await application_dedup.find_duplicate(db, job_id, keys)
+    if existing is not None:
+        return _duplicate(existing)
+
+    # --------------------------------------------------
+    # WRITE-BEHIND MODE (repeats still in the journal are settled by the batcher)
+    # --------------------------------------------------
+    if settings.APPLY_INGEST_MODE == "journal":
+        stored = await save_uploads(blob_store.BLOB_DIR, {
+            "pan_card": (pan_card, IMAGE_TYPES | {"application/pdf"}),
+            "resume": (resume, DOCUMENT_TYPES),
+            "photo": (photo, IMAGE_TYPES),
+        }, content_addressed=True, durable=True)
+        try:
+            tracking_id = await application_ingest.submit(application_create, stored)
+        except BaseException:
+            for file in stored.values():
+                discard(file)
+            raise
+        return JSONResponse(status_code=202, content=IngestAccepted(
+            tracking_id=tracking_id,
+            status=application_ingest.QUEUED,
+            status_url=f"{router.prefix}/ingest/{tracking_id}",
+        ).model_dump())
+
+    # --------------------------------------------------
+    # FILE UPLOADS (streamed concurrently, off the event loop,
+    # deduplicated by content hash)
+    # --------------------------------------------------
+    stored = await save_uploads(blob_store.BLOB_DIR, {
+        "pan_card": (pan_card, IMAGE_TYPES | {"application/pdf"}),
+        "resume": (resume, DOCUMENT_TYPES),
+        "photo": (photo, IMAGE_TYPES),
+    }, content_addressed=True)
 
     # --------------------------------------------------
     # DATABASE SAVE
@@ -137,9 +204,9 @@ async def apply_job(
     location=location,
 
     pan_number=pan_number,
-    pan_card_file=pan_card_path,
-    resume_file=resume_path,
-    photo_file=photo_path,
+    pan_card_file=stored["pan_card"].path,
+    resume_file=stored["resume"].path,
+    photo_file=stored["photo"].path,
 
     linkedin_url=linkedin_url,
 
@@ -163,11 +230,39 @@ async def apply_job(
 
     captcha_verified=True,
     status="Pending",
+    **keys,
 )
     
-    db.add(db_application)
-    db.commit()
-    db.refresh(db_application)
+    try:
+        db.add(db_application)
+        try:
+            # inserted before the blobs are placed: a duplicate that raced
+            # past the probe fails here, with no file written
+            await db.flush()
+        except IntegrityError:
+            await db.rollback()
+            existing = await application_dedup.find_duplicate(db, job_id, keys)
+            if existing is None:
+                raise
+            return _duplicate(existing)
+        await blob_store.acquire(db, list(stored.values()))
+        # thumbnails, resume text, PAN check: run by the task worker
+        task_queue.enqueue_document_tasks(db, db_application)
+        # searchable by skills now, by resume text once it is extracted
+        await application_search.index_application(db, db_application)
+        await status_counters.adjust(db, Counter({(job_id, db_application.status): 1}))
+        # the day of the row's own created_at, which deletes and status changes decrement
+        await db.refresh(db_application, ["created_at"])
+        await application_rollups.created(
+            db, [(job_id, db_application.status, db_application.created_at)]
+        )
+        await db.commit()
+    finally:
+        # the partials (committed blobs are hard links of them)
+        for file in stored.values():
+            if file.partial:
+                discard(file)
+    await db.refresh(db_application)
 
     return db_application
 
@@ -176,87 +271,363 @@ async def apply_job(
 # -------------------------------------------------------------------
 @router.get("/getall", response_model=List[ApplicationResponse])
 async def get_all_applications(
-    db: Session = Depends(get_db),
+    response: Response,
+    db: AsyncSession = Depends(get_async_read_db),
     skip: int = 0,
-    limit: int = Query(default=100, le=100),
+    limit: int = Query(default=100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor / X-Prev-Cursor of a previous page"),
+    include_total: bool = False,
+    fields: Optional[str] = Query(None, description=sparse_fields.FIELDS_DESCRIPTION),
     current_user: User = Depends(get_current_admin),
 ):
-    applications = db.query(Application).offset(skip).limit(limit).all()
+    names = sparse_fields.parse_fields(fields, ApplicationResponse)
+    query = select(Application)
+    if names:
+        query = query.options(*sparse_fields.columns(Application, names))
+
+    # newest first on (created_at, id); `skip` is kept for older clients
+    query, token = keyset(query, Application, cursor, limit)
+    if skip and not cursor:
+        query, token = query.offset(skip), {"d": "next"}
+
+    rows = (await db.execute(query)).scalars().all()
+    applications, next_cursor, prev_cursor = keyset_page(rows, token, limit)
+
+    total = None
+    if include_total:
+        total = (await db.execute(select(func.count(Application.id)))).scalar_one()
+
+    if names:
+        response = sparse_fields.json_response(applications, ApplicationResponse, names)
+        set_cursor_headers(response, next_cursor, prev_cursor, total)
+        return response
+
+    set_cursor_headers(response, next_cursor, prev_cursor, total)
     return applications
 
 # -------------------------------------------------------------------
 # LIST APPLICATIONS
 # -------------------------------------------------------------------
+def _list_filters(job_id: Optional[int], status: Optional[str]) -> list:
+    filters = []
+    if job_id:
+        filters.append(Application.job_id == job_id)
+    if status:
+        filters.append(Application.status == status)
+    return filters
+
+
+# Sortable columns of the list; ties broken by id so pages never overlap
+LIST_SORT_COLUMNS = {
+    "created_at": Application.created_at,
+    "full_name": Application.full_name,
+    "expected_salary": Application.expected_salary,
+    "year_of_passing": Application.year_of_passing,
+    "status": Application.status,
+}
+
+
 @router.get("/", response_model=dict)
 async def list_applications(
     job_id: Optional[int] = Query(None),
     status: Optional[str] = Query(None),
-    db: Session = Depends(get_db),
+    page: int = Query(1, ge=1),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor / prev_cursor of a previous page"),
+    sort: Literal[tuple(LIST_SORT_COLUMNS)] = "created_at",
+    order: Literal["asc", "desc"] = "desc",
+    fields: Optional[str] = Query(None, description=sparse_fields.FIELDS_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(get_current_admin),
 ):
-    query = db.query(Application)
+    names = sparse_fields.parse_fields(fields, ApplicationResponse)
+    query = select(Application).where(*_list_filters(job_id, status))
+    if names:
+        query = query.options(*sparse_fields.columns(Application, names))
 
-    if job_id:
-        query = query.filter(Application.job_id == job_id)
-    if status:
-        query = query.filter(Application.status == status)
+    column = LIST_SORT_COLUMNS[sort]
+    if order == "desc":
+        query = query.order_by(column.desc(), Application.id.desc())
+    else:
+        query = query.order_by(column.asc(), Application.id.asc())
 
-    applications = query.all()
+    offset = offset_from_cursor(cursor) if cursor else (page - 1) * limit
+    rows = (await db.execute(query.offset(offset).limit(limit + 1))).scalars().all()
+    applications, next_cursor, prev_cursor = offset_page(rows, offset, limit)
 
-    stats_query = db.query(Application.status, func.count(Application.id))
-    if job_id:
-        stats_query = stats_query.filter(Application.job_id == job_id)
-    stats_query = stats_query.group_by(Application.status)
+    # maintained by every write to job_applications: no scan, no GROUP BY
+    by_status = await status_counters.counts(db, job_id)
+    stats = status_counters.dashboard(by_status)
+
+    return {
+        "total": by_status.get(status, 0) if status else stats["total"],
+        "page": offset // limit + 1,
+        "limit": limit,
+        "next_cursor": next_cursor,
+        "prev_cursor": prev_cursor,
+        "applications": (
+            sparse_fields.validate(applications, ApplicationResponse, names) if names
+            else [ApplicationResponse.model_validate(a) for a in applications]
+        ),
+        "stats": stats,
+    }
 
-    status_counts = dict(stats_query.all())
 
+# -------------------------------------------------------------------
+# EXPORT (CSV / XLSX)
+# -------------------------------------------------------------------
+@router.get("/export")
+async def export_applications(
+    request: Request,
+    job_id: Optional[int] = Query(None),
+    status: Optional[str] = Query(None),
+    format: Literal["csv", "xlsx"] = "csv",
+    columns: Optional[str] = Query(None, description="Comma-separated, e.g. 'full_name,email,status'"),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_admin),
+):
+    """
+    Every matching application, oldest first, streamed from a server-side
+    cursor: memory stays flat however many rows are exported.
+    """
+    names = application_export.parse_columns(columns)
+
+    if format == "xlsx":
+        by_status = await status_counters.counts(db, job_id)
+        rows = by_status.get(status, 0) if status else sum(by_status.values())
+        if rows + 1 > application_export.XLSX_MAX_ROWS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"{rows} rows exceed the XLSX sheet limit; export as CSV",
+            )
+
+    query = (
+        select(*application_export.select_columns(names))
+        .where(*_list_filters(job_id, status))
+        .order_by(Application.id)
+        .execution_options(yield_per=application_export.EXPORT_BATCH_SIZE)
+    )
+    # the dependency's session is closed before the body is sent,
+    # so the stream reads through a session of its own
+    factory = async_read_sessionmaker(request)
+
+    async def body():
+        encoder = application_export.ENCODERS[format](names)
+        async with factory() as stream_db:
+            result = await stream_db.stream(query)
+            async for batch in result.partitions():
+                yield await run_in_threadpool(encoder.rows, batch)
+        yield await run_in_threadpool(encoder.close)
+
+    filename = f"applications-{f'job-{job_id}-' if job_id else ''}{date.today().isoformat()}.{format}"
+    return StreamingResponse(
+        body(),
+        media_type=application_export.CONTENT_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+# -------------------------------------------------------------------
+# ANALYTICS (daily rollups)
+# -------------------------------------------------------------------
+@router.get("/analytics", response_model=dict)
+async def application_analytics(
+    start: Optional[date] = Query(None, description="First day (default: 30 days before end)"),
+    end: Optional[date] = Query(None, description="Last day, inclusive (default: today)"),
+    granularity: Literal[application_rollups.GRANULARITIES] = "day",
+    job_id: Optional[int] = Query(None),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_admin),
+):
+    """
+    Applications received per day / week / month with their status mix,
+    status changes made in each bucket and the range's conversion funnel,
+    read from the daily rollups (no scan of job_applications).
+    """
+    return await application_rollups.report(db, start, end, granularity, job_id)
+
+
+# -------------------------------------------------------------------
+# SEARCH (skills, role, resume text)
+# -------------------------------------------------------------------
+@router.get("/search", response_model=List[ApplicationSearchResult])
+async def search_applications(
+    response: Response,
+    q: str = Query(..., min_length=1, description="Skills or keywords, e.g. 'python react'"),
+    job_id: Optional[int] = Query(None),
+    status: Optional[str] = Query(None),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor / X-Prev-Cursor of a previous page"),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_admin),
+):
+    offset = offset_from_cursor(cursor)
+    hits = await application_search.search(db, q, _list_filters(job_id, status), offset, limit + 1)
+    hits, next_cursor, prev_cursor = offset_page(hits, offset, limit)
+
+    scores = dict(hits)
+    rows = (
+        await db.execute(select(Application).where(Application.id.in_(scores)))
+    ).scalars().all() if scores else []
+    by_id = {a.id: a for a in rows}
+
+    set_cursor_headers(response, next_cursor, prev_cursor)
+    return [
+        ApplicationSearchResult(
+            **ApplicationResponse.model_validate(by_id[app_id]).model_dump(), score=round(score, 4)
+        )
+        for app_id, score in hits
+        if app_id in by_id
+    ]
+
+
+# -------------------------------------------------------------------
+# INGESTION STATUS (journal mode)
+# -------------------------------------------------------------------
+def _timestamp(seconds):
+    return datetime.fromtimestamp(seconds, timezone.utc) if seconds else None
+
+
+@router.get("/ingest", response_model=dict)
+async def ingest_stats(current_user: User = Depends(get_current_admin)):
     return {
-        "applications": [ApplicationResponse.model_validate(a) for a in applications],
-        "stats": {
-            "total": len(applications),
-            "pending": status_counts.get("pending", 0),
-            "shortlisted": status_counts.get("shortlisted", 0),
-            "maybe": status_counts.get("maybe", 0),
-            "rejected": status_counts.get("rejected", 0),
-            "by_status": status_counts,
-        },
+        "mode": settings.APPLY_INGEST_MODE,
+        "journal": await run_in_threadpool(application_ingest.journal.counts),
+        "batcher": application_ingest.batcher.stats(),
     }
 
 
+@router.get("/ingest/{tracking_id}", response_model=IngestStatus)
+async def ingest_status(tracking_id: str, db: AsyncSession = Depends(get_async_read_db)):
+    """Where a 202-accepted submission is; public, like the submission itself."""
+    entry = await run_in_threadpool(application_ingest.journal.get, tracking_id)
+    if entry is not None:
+        return IngestStatus(
+            tracking_id=tracking_id,
+            status=entry["status"],
+            application_id=entry["application_id"],
+            error=entry["error"],
+            attempts=entry["attempts"],
+            submitted_at=_timestamp(entry["created_at"]),
+            updated_at=_timestamp(entry["updated_at"]),
+        )
+
+    # purged from the journal, or journaled on another host
+    application_id = (
+        await db.execute(select(Application.id).where(Application.tracking_id == tracking_id))
+    ).scalar_one_or_none()
+    if application_id is None:
+        raise HTTPException(status_code=404, detail="Unknown tracking id")
+    return IngestStatus(
+        tracking_id=tracking_id, status=application_ingest.STORED, application_id=application_id
+    )
+
+
 # -------------------------------------------------------------------
 # GET SINGLE APPLICATION
 # -------------------------------------------------------------------
 @router.get("/{application_id}", response_model=ApplicationResponse)
 async def get_application(
     application_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(get_current_admin),
 ):
-    application = db.query(Application).filter(Application.id == application_id).first()
+    application = await db.get(Application, application_id)
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
     return application
 
 
+# -------------------------------------------------------------------
+# DOCUMENT PROCESSING STATUS
+# -------------------------------------------------------------------
+async def _processing(db: AsyncSession, application: Application) -> ApplicationProcessing:
+    tasks = (
+        await db.execute(
+            select(QueuedTask)
+            .where(QueuedTask.application_id == application.id)
+            .order_by(QueuedTask.id)
+        )
+    ).scalars().all()
+    return ApplicationProcessing(
+        id=application.id,
+        processing_status=application.processing_status,
+        photo_thumbnail_file=application.photo_thumbnail_file,
+        pan_card_valid=application.pan_card_valid,
+        resume_text_chars=len(application.resume_text or ""),
+        tasks=tasks,
+    )
+
+
+@router.get("/{application_id}/processing", response_model=ApplicationProcessing)
+async def get_processing(
+    application_id: int,
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_admin),
+):
+    application = await db.get(Application, application_id)
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found")
+    return await _processing(db, application)
+
+
+@router.post("/{application_id}/processing/retry", response_model=ApplicationProcessing)
+async def retry_processing(
+    application_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_admin),
+):
+    """Requeue the application's failed tasks with a fresh retry budget."""
+    application = await db.get(Application, application_id)
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found")
+
+    await db.execute(
+        update(QueuedTask)
+        .where(QueuedTask.application_id == application_id, QueuedTask.status == "failed")
+        .values(status="queued", attempts=0, run_after=task_queue.utcnow())
+    )
+    await task_queue.refresh_processing_status(db, application_id)
+    await db.commit()
+    await db.refresh(application)
+    return await _processing(db, application)
+
+
 # -------------------------------------------------------------------
 # UPDATE STATUS
 # -------------------------------------------------------------------
+@router.patch("/status", response_model=ApplicationBulkStatusResult)
+async def update_status_bulk(
+    request: ApplicationBulkStatus,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_admin),
+):
+    """Shortlist / reject many applications at once, by id or by filter."""
+    return await application_status.bulk_transition(db, request, current_user.id)
+
+
 @router.patch("/{application_id}/status")
 async def update_status(
     application_id: int,
     status: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin),
 ):
-    application = db.query(Application).filter(Application.id == application_id).first()
+    # locked so concurrent status changes count the right old status
+    application = await db.get(Application, application_id, with_for_update=True)
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
 
     old_status = application.status
     application.status = status
+    if old_status != status:
+        await application_status.record_transitions(
+            db, [(application.id, application.job_id, old_status, application.created_at)],
+            status, current_user.id,
+        )
 
-    db.commit()
-    db.refresh(application)
+    await db.commit()
+    await db.refresh(application)
 
     return {
         "id": application.id,
@@ -267,50 +638,96 @@ async def update_status(
 
 
 # -------------------------------------------------------------------
-# DELETE SINGLE APPLICATION
+# BULK DELETE
 # -------------------------------------------------------------------
-@router.delete("/{application_id}")
-async def delete_application(
-    application_id: int,
-    db: Session = Depends(get_db),
+# Ids per DELETE ... WHERE id IN (...)
+BULK_DELETE_CHUNK = 500
+
+
+# declared before DELETE /{application_id}, which would otherwise match "/bulk"
+@router.delete("/bulk", response_model=ApplicationBulkDeleteResult)
+async def delete_applications_bulk(
+    application_ids: List[int] = Body(..., min_length=1, max_length=5000),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin),
 ):
-    application = db.query(Application).filter(Application.id == application_id).first()
-    if not application:
-        raise HTTPException(status_code=404, detail="Application not found")
-
-    for field in ["pan_card_file", "resume_file", "photo_file"]:
-        file_path = getattr(application, field)
-        if file_path and os.path.exists(file_path):
-            os.remove(file_path)
+    """
+    One locking SELECT for the rows' files and statuses, chunked
+    set-based DELETEs and one commit. Only then are the files that lost
+    their last reference removed, a chunk at a time in parallel worker
+    threads: a failed commit leaves every file in place. Files that cannot
+    be removed are reported; the rows are deleted anyway.
+    """
+    requested = list(dict.fromkeys(application_ids))
+    rows = (
+        await db.execute(
+            select(Application.id, Application.job_id, Application.status, Application.created_at,
+                   *(getattr(Application, field) for field in FILE_FIELDS))
+            .where(Application.id.in_(requested))
+            .order_by(Application.id)
+            .with_for_update()
+        )
+    ).all()
+    ids = [row.id for row in rows]
+
+    removed = Counter()
+    for row in rows:
+        removed[(row.job_id, row.status or "Pending")] -= 1
+
+    for i in range(0, len(ids), BULK_DELETE_CHUNK):
+        chunk = ids[i:i + BULK_DELETE_CHUNK]
+        await application_search.unindex_applications(db, chunk)
+        await db.execute(
+            delete(Application)
+            .where(Application.id.in_(chunk))
+            .execution_options(synchronize_session=False)
+        )
+    await status_counters.adjust(db, removed)
+    await application_rollups.deleted(db, [(row.job_id, row.status, row.created_at) for row in rows])
+    unreferenced = await blob_store.release(
+        db, [getattr(row, field) for row in rows for field in FILE_FIELDS]
+    )
+    await db.commit()
 
-    db.delete(application)
-    db.commit()
+    # one short locking transaction per chunk, so a large batch does not
+    # hold its blob locks (and block uploads of the same content) throughout
+    file_errors = []
+    for i in range(0, len(unreferenced), BULK_DELETE_CHUNK):
+        file_errors += await blob_store.remove_unreferenced(db, unreferenced[i:i + BULK_DELETE_CHUNK])
 
-    return {"message": "Application deleted successfully"}
+    found = set(ids)
+    return {
+        "message": f"Deleted {len(ids)} applications",
+        "deleted": len(ids),
+        "missing": [app_id for app_id in requested if app_id not in found],
+        "file_errors": [{"path": path, "error": error} for path, error in file_errors],
+    }
 
 
 # -------------------------------------------------------------------
-# BULK DELETE
+# DELETE SINGLE APPLICATION
 # -------------------------------------------------------------------
-@router.delete("/bulk")
-async def delete_applications_bulk(
-    application_ids: List[int] = Body(...),
-    db: Session = Depends(get_db),
+@router.delete("/{application_id}")
+async def delete_application(
+    application_id: int,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_admin),
 ):
-    deleted = 0
-
-    for app_id in application_ids:
-        app = db.query(Application).filter(Application.id == app_id).first()
-        if app:
-            for field in ["pan_card_file", "resume_file", "photo_file"]:
-                file_path = getattr(app, field)
-                if file_path and os.path.exists(file_path):
-                    os.remove(file_path)
+    # locked: a concurrent delete of the same row must not release its files twice
+    application = await db.get(Application, application_id, with_for_update=True)
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found")
 
-            db.delete(app)
-            deleted += 1
+    unreferenced = await blob_store.release(db, [getattr(application, field) for field in FILE_FIELDS])
+    await application_search.unindex_applications(db, [application_id])
+    await status_counters.adjust(
+        db, Counter({(application.job_id, application.status or "Pending"): -1})
+    )
+    await application_rollups.deleted(
+        db, [(application.job_id, application.status, application.created_at)]
+    )
+    await db.delete(application)
+    await db.commit()
+    await blob_store.remove_unreferenced(db, unreferenced)
 
-    db.commit()
-    return {"message": f"Deleted {deleted} applications"}
+    return {"message": "Application deleted successfully"}
@@ -1,14 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, File, UploadFile
 from sqlalchemy.orm import Session, joinedload
-from typing import List
+from typing import List, Optional
 import os, shutil, uuid
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.schemas.onboarding import OnboardingCreate, OnboardingResponse
 from app.models.onboarding import Onboarding
 from app.models.onboarding_documents import OnboardingDocument
 from app.models.onboarding_nominee import OnboardingNominee, OnboardingFamily, OnboardingBank, OnboardingReference
 from app.models.onboarding_checklist import OnboardingChecklist
+from app.utils import sparse_fields
 from app.utils.jwt_dependency import get_current_admin
 
 UPLOAD_DIR = "uploads/onboarding"
@@ -174,30 +175,34 @@ def create_onboarding(
 
 
 
+ONBOARDING_RELATIONSHIPS = ("documents", "nominees", "family", "bank", "references", "checklist")
+
+
 @router.get("/", response_model=List[OnboardingResponse])
 def list_onboardings(
-    db: Session = Depends(get_db),
+    fields: Optional[str] = Query(None, description=sparse_fields.FIELDS_DESCRIPTION),
+    db: Session = Depends(get_read_db),
     current_admin=Depends(get_current_admin)
 ):
-    onboardings = (
-        db.query(Onboarding)
-        .options(
-            joinedload(Onboarding.documents),
-            joinedload(Onboarding.nominees),
-            joinedload(Onboarding.family),
-            joinedload(Onboarding.bank),
-            joinedload(Onboarding.references),
-            joinedload(Onboarding.checklist),
-        )
-        .all()
-    )
+    names = sparse_fields.parse_fields(fields, OnboardingResponse)
+    if names is None:
+        options = [joinedload(getattr(Onboarding, r)) for r in ONBOARDING_RELATIONSHIPS]
+    else:
+        # only the columns and child tables that were asked for
+        options = sparse_fields.columns(Onboarding, names, always=("id",)) + [
+            joinedload(getattr(Onboarding, r)) for r in sparse_fields.relationships(Onboarding, names)
+        ]
+
+    onboardings = db.query(Onboarding).options(*options).all()
+    if names:
+        return sparse_fields.json_response(onboardings, OnboardingResponse, names)
     return onboardings
 
 
 @router.get("/{onboarding_id}", response_model=OnboardingResponse)
 def get_onboarding_by_id(
     onboarding_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_admin=Depends(get_current_admin)
 ):
     onboarding = (
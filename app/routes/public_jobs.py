@@ -1,36 +1,94 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from app.database import get_db
+from app.database import get_read_db
 from app.models.job import Job
-from app.schemas.job import JobResponse, PaginatedJobResponse
+from app.utils import job_search, job_cache
+from app.utils.etag import conditional
+from app.utils.job_facets import apply_filters, count_facets, job_filters
+from app.utils.pagination import keyset, keyset_page, offset_from_cursor, offset_page
+from app.schemas.job import JobFilters, JobResponse, PaginatedJobResponse
 
 router = APIRouter(prefix="/jobs", tags=["Public Jobs"])
 
 
-@router.get("/", response_model=PaginatedJobResponse)
+def load_jobs_page(
+    db: Session, q, filters: JobFilters, page, limit, cursor, include_total
+) -> PaginatedJobResponse:
+    query = apply_filters(db.query(Job).filter(Job.is_active == True), filters)
+
+    if q:
+        # relevance-ranked across title, department, skills, responsibilities
+        query = job_search.apply_search(db, query, q)
+
+    total = query.count() if include_total else None
+
+    if q:
+        # relevance order has no stable keyset: the cursor carries an offset
+        offset = offset_from_cursor(cursor) if cursor else (page - 1) * limit
+        rows = query.offset(offset).limit(limit + 1).all()
+        jobs, next_cursor, prev_cursor = offset_page(rows, offset, limit)
+    elif cursor or page == 1:
+        query, token = keyset(query, Job, cursor, limit)
+        jobs, next_cursor, prev_cursor = keyset_page(query.all(), token, limit)
+    else:
+        # legacy page numbers: one OFFSET read, then hand out keyset cursors
+        query, _ = keyset(query, Job, None, limit)
+        rows = query.offset((page - 1) * limit).all()
+        jobs, next_cursor, prev_cursor = keyset_page(rows, {"d": "next"}, limit)
+
+    return PaginatedJobResponse(
+        total=total,
+        page=page,
+        limit=limit,
+        data=[JobResponse.model_validate(job) for job in jobs],
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+    )
+
+
+@router.get("/", response_model=PaginatedJobResponse, dependencies=[Depends(conditional("jobs"))])
 def list_jobs(
     q: str | None = Query(None),
     page: int = 1,
-    limit: int = 10,
-    db: Session = Depends(get_db)
+    limit: int = Query(10, ge=1, le=100),
+    cursor: str | None = Query(None, description="next_cursor / prev_cursor of a previous page"),
+    include_total: bool | None = Query(None, description="Defaults to true only without a cursor"),
+    include_facets: bool = Query(False, description="Add department / location / work mode counts"),
+    filters: JobFilters = Depends(job_filters),
+    db: Session = Depends(get_read_db)
 ):
-    query = db.query(Job).filter(Job.is_active == True)
+    q = q.strip() if q else None
+    if include_total is None:
+        include_total = cursor is None
 
-    if q:
-        query = query.filter(
-            or_(
-                Job.title.ilike(f"%{q}%"),
-                Job.department.ilike(f"%{q}%")
-            )
-        )
+    # served from the job catalogue cache until a job changes
+    result = job_cache.get_or_load(
+        db,
+        ("list", q, filters, page, limit, cursor, include_total),
+        lambda: load_jobs_page(db, q, filters, page, limit, cursor, include_total),
+    )
 
-    total = query.count()
-    jobs = query.offset((page - 1) * limit).limit(limit).all()
+    if include_facets:
+        # cached separately so every page of a search shares one facet query
+        facets = job_cache.get_or_load(db, ("facets", q, filters), lambda: load_facets(db, q, filters))
+        result = result.model_copy(update={"facets": facets})
+    return result
+
+
+def load_facets(db: Session, q, filters: JobFilters):
+    query = apply_filters(db.query(Job).filter(Job.is_active == True), filters, with_facets=False)
+    if q:
+        query = job_search.apply_search(db, query, q)
+    return count_facets(query, filters)
 
-    return {"total": total, "page": page, "limit": limit, "data": jobs}
 
+@router.get("/{job_id}", response_model=JobResponse, dependencies=[Depends(conditional("jobs"))])
+def job_detail(job_id: int, db: Session = Depends(get_read_db)):
+    def load():
+        job = db.query(Job).filter(Job.id == job_id, Job.is_active == True).first()
+        return JobResponse.model_validate(job) if job else None
 
-@router.get("/{job_id}", response_model=JobResponse)
-def job_detail(job_id: int, db: Session = Depends(get_db)):
-    return db.query(Job).filter(Job.id == job_id, Job.is_active == True).first()
+    job = job_cache.get_or_load(db, ("detail", job_id), load)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
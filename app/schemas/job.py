@@ -1,6 +1,6 @@
 from datetime import datetime, date
-from typing import Optional, List
-from pydantic import BaseModel
+from typing import Optional, List, Dict, Tuple, get_args
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class JobBase(BaseModel):
@@ -32,14 +32,116 @@ class JobUpdate(JobBase):
 
 class JobResponse(JobBase):
     id: int
+    is_active: Optional[bool] = None
     created_at: datetime
 
     class Config:
         from_attributes = True
 
 
+class JobFilters(BaseModel):
+    # frozen + tuples so a filter set can be part of a cache key
+    model_config = ConfigDict(frozen=True)
+
+    department: Tuple[str, ...] = ()
+    work_mode: Tuple[str, ...] = ()
+    job_location: Tuple[str, ...] = ()
+    experience: Optional[int] = None  # candidate years, within min..max
+    salary_min: Optional[int] = None  # job salary range overlaps this range
+    salary_max: Optional[int] = None
+
+
+class JobFacets(BaseModel):
+    department: Dict[str, int] = {}
+    job_location: Dict[str, int] = {}
+    work_mode: Dict[str, int] = {}
+
+
 class PaginatedJobResponse(BaseModel):
-    total: int
+    total: Optional[int] = None
     page: int
     limit: int
     data: List[JobResponse]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    facets: Optional[JobFacets] = None
+
+
+class JobImportError(BaseModel):
+    row: int  # 1-based data row (CSV header not counted)
+    error: str
+
+
+class JobImportResult(BaseModel):
+    received: int
+    inserted: int
+    failed: int
+    errors: List[JobImportError]
+
+
+# JobBase fields JobResponse requires, plus is_active: a patch may not null them
+_NOT_NULL = frozenset(
+    name for name, field in JobBase.model_fields.items() if type(None) not in get_args(field.annotation)
+) | {"is_active"}
+
+
+class JobPatch(BaseModel):
+    """Partial update: only the fields sent are written."""
+    title: Optional[str] = None
+    department: Optional[str] = None
+    work_mode: Optional[str] = None
+    roles_responsibilities: Optional[str] = None
+    required_skills: Optional[str] = None
+    experience_min: Optional[int] = None
+    experience_max: Optional[int] = None
+    qualification_required: Optional[str] = None
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+    perks_benefits: Optional[str] = None
+    job_location: Optional[str] = None
+    job_locality: Optional[str] = None
+    openings: Optional[int] = None
+    application_deadline: Optional[date] = None
+    is_active: Optional[bool] = None
+
+    @model_validator(mode="after")
+    def check_fields(self):
+        if not self.model_fields_set:
+            raise ValueError("no fields to update")
+        for field in sorted(self.model_fields_set & _NOT_NULL):
+            if getattr(self, field) is None:
+                raise ValueError(f"{field} cannot be null")
+        return self
+
+
+class JobPatchItem(BaseModel):
+    id: int
+    fields: JobPatch
+
+
+class JobBatchUpdate(BaseModel):
+    """Either `updates` (per-id fields) or `filter` + `fields`."""
+    updates: Optional[List[JobPatchItem]] = Field(None, min_length=1, max_length=1000)
+    filter: Optional[JobFilters] = None
+    fields: Optional[JobPatch] = None
+
+    @model_validator(mode="after")
+    def check_mode(self):
+        if (self.updates is None) == (self.filter is None):
+            raise ValueError("send either updates or filter")
+        if self.filter is not None and self.fields is None:
+            raise ValueError("filter requires fields")
+        if self.filter is not None and self.filter == JobFilters():
+            raise ValueError("filter must set at least one criterion")
+        if self.updates is not None:
+            ids = [item.id for item in self.updates]
+            if len(ids) != len(set(ids)):
+                raise ValueError("duplicate job ids in updates")
+        return self
+
+
+class JobBatchUpdateResult(BaseModel):
+    matched: int
+    updated: int
+    missing: List[int] = []
+    data: List[JobResponse]
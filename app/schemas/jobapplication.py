@@ -1,6 +1,6 @@
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from datetime import date, datetime
-from typing import Optional
+from typing import List, Optional
 
 
 # -------------------------------------------------------------------
@@ -86,3 +86,111 @@ class ApplicationResponse(ApplicationBase):
 
     status: str
     created_at: datetime
+
+    # filled in by the background document tasks
+    processing_status: Optional[str] = None
+    photo_thumbnail_file: Optional[str] = None
+    pan_card_valid: Optional[bool] = None
+
+
+class ApplicationSearchResult(ApplicationResponse):
+    score: float
+
+
+class ApplicationDuplicate(BaseModel):
+    """Public answer to a repeat submission: no applicant data, no file paths."""
+    application_id: int  # the application already on file
+    status: str = "duplicate"
+
+
+class ProcessingTask(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    kind: str
+    status: str
+    attempts: int
+    run_after: datetime
+    last_error: Optional[str] = None
+
+
+class ApplicationProcessing(BaseModel):
+    id: int
+    processing_status: Optional[str] = None
+    photo_thumbnail_file: Optional[str] = None
+    pan_card_valid: Optional[bool] = None
+    resume_text_chars: int = 0
+    tasks: List[ProcessingTask]
+
+
+# -------------------------------------------------------------------
+# BULK STATUS
+# -------------------------------------------------------------------
+class ApplicationStatusFilter(BaseModel):
+    job_id: Optional[int] = None
+    status: Optional[str] = None  # current status
+
+
+class ApplicationBulkStatus(BaseModel):
+    """Either `ids` or `filter`; every selected application moves to `status`."""
+    status: str = Field(..., min_length=1, max_length=50)
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=1000)
+    filter: Optional[ApplicationStatusFilter] = None
+
+    @model_validator(mode="after")
+    def check_mode(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("send either ids or filter")
+        if self.filter is not None and self.filter == ApplicationStatusFilter():
+            raise ValueError("filter must set at least one criterion")
+        if self.ids is not None and len(self.ids) != len(set(self.ids)):
+            raise ValueError("duplicate application ids")
+        return self
+
+
+class ApplicationStatusTransition(BaseModel):
+    id: int
+    old_status: Optional[str] = None
+    new_status: str
+
+
+class ApplicationBulkStatusResult(BaseModel):
+    matched: int
+    updated: int
+    missing: List[int] = []
+    changes: List[ApplicationStatusTransition]
+
+
+# -------------------------------------------------------------------
+# BULK DELETE
+# -------------------------------------------------------------------
+class FileCleanupError(BaseModel):
+    path: str
+    error: str
+
+
+class ApplicationBulkDeleteResult(BaseModel):
+    message: str
+    deleted: int
+    missing: List[int] = []
+    # rows are deleted; these files could not be removed and are orphaned
+    file_errors: List[FileCleanupError] = []
+
+
+# -------------------------------------------------------------------
+# WRITE-BEHIND INGESTION
+# -------------------------------------------------------------------
+class IngestAccepted(BaseModel):
+    tracking_id: str
+    status: str
+    status_url: str
+
+
+class IngestStatus(BaseModel):
+    tracking_id: str
+    status: str  # queued | flushing | stored | duplicate | failed
+    application_id: Optional[int] = None  # the stored application, or the one a duplicate matched
+    error: Optional[str] = None
+    attempts: int = 0
+    submitted_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
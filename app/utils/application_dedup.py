@@ -0,0 +1,116 @@
+"""
+Duplicate-application detection.
+
+Each application carries HMAC-SHA256 lookup keys of its normalized email,
+phone and PAN, unique per job (see Application.__table_args__). apply_job
+probes them once before storing any file and returns the application
+already on file instead of creating another; the unique indexes catch the
+submissions that race past the probe.
+"""
+import hashlib
+import hmac
+import re
+
+from sqlalchemy import bindparam, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.jobapplication import Application
+
+KEY_COLUMNS = ("email_key", "phone_key", "pan_key")
+
+# Providers that ignore dots in the local part
+_DOTLESS_DOMAINS = {"gmail.com", "googlemail.com"}
+
+
+def normalize_email(email: str | None) -> str | None:
+    if not email or "@" not in email:
+        return None
+    local, _, domain = email.strip().lower().rpartition("@")
+    local = local.split("+", 1)[0]  # sub-address: same mailbox
+    if domain in _DOTLESS_DOMAINS:
+        local, domain = local.replace(".", ""), "gmail.com"
+    return f"{local}@{domain}" if local and domain else None
+
+
+def normalize_phone(phone: str | None) -> str | None:
+    digits = re.sub(r"\D", "", phone or "")
+    # national number: drop the +91 / 0 prefixes
+    return digits[-10:] if len(digits) >= 10 else None
+
+
+def normalize_pan(pan: str | None) -> str | None:
+    pan = re.sub(r"\s", "", pan or "").upper()
+    return pan or None
+
+
+def _hash(kind: str, value: str | None) -> str | None:
+    if value is None:
+        return None
+    secret = (settings.DEDUP_HASH_KEY or settings.SECRET_KEY).encode("utf-8")
+    return hmac.new(secret, f"{kind}:{value}".encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def lookup_keys(email: str | None, phone: str | None, pan_number: str | None) -> dict:
+    """{email_key, phone_key, pan_key} for an application's contact fields."""
+    return {
+        "email_key": _hash("email", normalize_email(email)),
+        "phone_key": _hash("phone", normalize_phone(phone)),
+        "pan_key": _hash("pan", normalize_pan(pan_number)),
+    }
+
+
+def _matches(job_id: int, keys: dict):
+    return [
+        Application.job_id == job_id,
+        or_(*(getattr(Application, column) == key for column, key in keys.items() if key)),
+    ]
+
+
+async def find_duplicate(db: AsyncSession, job_id: int, keys: dict) -> Application | None:
+    """The earliest application for job_id sharing any lookup key: one index probe."""
+    if not any(keys.values()):
+        return None
+    return (
+        await db.execute(
+            select(Application).where(*_matches(job_id, keys)).order_by(Application.id).limit(1)
+        )
+    ).scalars().first()
+
+
+def rekey(connection, batch: int = 1000) -> int:
+    """
+    (Re)compute the lookup keys of every application on a sync connection
+    (migration backfill, or after changing DEDUP_HASH_KEY). When existing
+    rows already collide, only the earliest keeps the key. Returns the
+    number of rows processed.
+    """
+    connection.execute(update(Application).values(email_key=None, phone_key=None, pan_key=None))
+    set_keys = (
+        update(Application)
+        .where(Application.id == bindparam("row_id"))
+        .values({column: bindparam(column) for column in KEY_COLUMNS})
+    )
+    seen: set[tuple] = set()
+    last_id, done = 0, 0
+    while True:
+        rows = connection.execute(
+            select(Application.id, Application.job_id, Application.email,
+                   Application.phone, Application.pan_number)
+            .where(Application.id > last_id)
+            .order_by(Application.id)
+            .limit(batch)
+        ).all()
+        if not rows:
+            return done
+        params = []
+        for row in rows:
+            keys = lookup_keys(row.email, row.phone, row.pan_number)
+            for column, key in keys.items():
+                if key and (row.job_id, column, key) in seen:
+                    keys[column] = None
+                elif key:
+                    seen.add((row.job_id, column, key))
+            params.append({"row_id": row.id, **keys})
+        connection.execute(set_keys, params)
+        last_id, done = rows[-1].id, done + len(rows)
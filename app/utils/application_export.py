@@ -0,0 +1,206 @@
+"""
+CSV / XLSX encoders for GET /admin/applications/export.
+
+Both take rows in batches (as they come off the database cursor) and return
+the bytes to send for that batch, so an export of any size is built with a
+constant amount of memory. XLSX is written with the standard library alone:
+a streamed ZIP (data descriptors, no seeking) holding one worksheet of
+inline strings, which Excel and LibreOffice open like any other workbook.
+"""
+import csv
+import io
+import re
+import zipfile
+from datetime import date, datetime
+from xml.sax.saxutils import escape
+
+from fastapi import HTTPException
+
+from app.models.jobapplication import Application
+
+# Exportable columns, in default order (no resume text, no internal flags)
+EXPORT_COLUMNS = (
+    "id", "job_id", "status", "created_at",
+    "first_name", "last_name", "full_name", "email", "phone",
+    "date_of_birth", "gender", "location", "pan_number", "linkedin_url",
+    "highest_qualification", "specialization", "university", "college", "year_of_passing",
+    "position_applied", "preferred_work_mode", "key_skills", "expected_salary", "why_hire_me",
+    "experience_level", "previous_company", "previous_role", "date_of_joining", "relieving_date",
+    "pan_card_file", "resume_file", "photo_file",
+    "processing_status", "pan_card_valid",
+)
+
+# Rows per database round trip / encoded chunk
+EXPORT_BATCH_SIZE = 1000
+
+# Excel's sheet limit, header row included
+XLSX_MAX_ROWS = 1_048_576
+
+CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+def parse_columns(columns: str | None) -> list[str]:
+    """'email,full_name' -> validated column names (all columns by default)."""
+    if not columns:
+        return list(EXPORT_COLUMNS)
+    names = list(dict.fromkeys(c.strip() for c in columns.split(",") if c.strip()))
+    unknown = [name for name in names if name not in EXPORT_COLUMNS]
+    if unknown or not names:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown export columns: {', '.join(unknown) or '(none given)'}",
+        )
+    return names
+
+
+def select_columns(names: list[str]):
+    return [getattr(Application, name) for name in names]
+
+
+def _text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+# -------------------------------------------------------------------
+# CSV
+# -------------------------------------------------------------------
+# A leading = + - @ makes spreadsheet apps evaluate a cell as a formula;
+# applicants fill these fields in, so such text is quoted with a '
+_FORMULA_START = ("=", "+", "-", "@", "\t", "\r")
+
+
+class CsvEncoder:
+    def __init__(self, columns: list[str]):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+        self._writer.writerow(columns)
+        self._header = "\ufeff"  # BOM: Excel otherwise reads UTF-8 as ANSI
+
+    def _cell(self, value):
+        if isinstance(value, str) and value.startswith(_FORMULA_START):
+            return "'" + value
+        return _text(value)
+
+    def rows(self, rows) -> bytes:
+        for row in rows:
+            self._writer.writerow([self._cell(value) for value in row])
+        data = self._header + self._buffer.getvalue()
+        self._header = ""
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data.encode("utf-8")
+
+    def close(self) -> bytes:
+        return self.rows(())
+
+
+# -------------------------------------------------------------------
+# XLSX
+# -------------------------------------------------------------------
+# Characters XML 1.0 cannot carry at all
+_XML_ILLEGAL = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+_PACKAGE = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Applications" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    ),
+}
+
+
+class _Sink(io.RawIOBase):
+    """Write-only, non-seekable: zipfile falls back to data descriptors."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data, self.chunks = b"".join(self.chunks), []
+        return data
+
+
+class XlsxEncoder:
+    def __init__(self, columns: list[str]):
+        self._sink = _Sink()
+        self._zip = zipfile.ZipFile(self._sink, "w", compression=zipfile.ZIP_DEFLATED)
+        for name, xml in _PACKAGE.items():
+            self._zip.writestr(name, xml)
+        self._sheet = self._zip.open("xl/worksheets/sheet1.xml", "w", force_zip64=True)
+        self._sheet.write(
+            b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            b'<sheetData>'
+        )
+        self._write_row(columns)
+
+    @staticmethod
+    def _cell(value) -> str:
+        if value is None:
+            return "<c/>"
+        if isinstance(value, bool):
+            return f'<c t="b"><v>{int(value)}</v></c>'
+        if isinstance(value, (int, float)):
+            return f"<c><v>{value}</v></c>"
+        text = escape(_XML_ILLEGAL.sub("", _text(value)))
+        return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+    def _write_row(self, row):
+        self._sheet.write(("<row>" + "".join(map(self._cell, row)) + "</row>").encode("utf-8"))
+
+    def rows(self, rows) -> bytes:
+        for row in rows:
+            self._write_row(row)
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        self._sheet.write(b"</sheetData></worksheet>")
+        self._sheet.close()
+        self._zip.close()
+        return self._sink.drain()
+
+
+ENCODERS = {"csv": CsvEncoder, "xlsx": XlsxEncoder}
@@ -0,0 +1,457 @@
+"""
+Write-behind ingestion of job applications (APPLY_INGEST_MODE=journal).
+
+apply_job validates the submission, stores its files (fsynced, still as
+partials) and appends it to a local journal: a SQLite database in WAL mode
+with synchronous=FULL, so a 202 means the submission survives a crash.
+The IngestBatcher then moves journaled submissions into the main database
+in batches: one transaction and one multi-row INSERT per batch, instead of
+a commit per request while a campaign is live.
+
+Crash recovery: a batch is claimed with a lease. If the process dies while
+flushing, the lease expires and the batch is claimed again (on restart, or
+by another worker sharing the journal). Applications carry the journal's
+tracking_id under a unique index, so a batch that was committed but not yet
+marked in the journal is recognised and never inserted twice.
+"""
+import asyncio
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import asdict
+from datetime import datetime, timezone
+
+from sqlalchemy import insert, or_, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.jobapplication import Application
+from app.schemas.jobapplication import ApplicationCreate
+from app.utils import (
+    application_dedup, application_rollups, application_search, blob_store, status_counters, task_queue,
+)
+from app.utils.file_upload import StoredFile, discard
+
+logger = logging.getLogger("app.ingest")
+
+# Journal statuses
+QUEUED = "queued"
+FLUSHING = "flushing"
+STORED = "stored"
+DUPLICATE = "duplicate"
+FAILED = "failed"
+
+# application file column -> apply_job upload field
+FILE_COLUMNS = {"pan_card_file": "pan_card", "resume_file": "resume", "photo_file": "photo"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS submissions (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    tracking_id TEXT NOT NULL UNIQUE,
+    job_id INTEGER NOT NULL,
+    record TEXT NOT NULL,
+    files TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    claimed_by TEXT,
+    claimed_at REAL,
+    application_id INTEGER,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_submissions_status ON submissions (status, seq);
+"""
+
+
+# -------------------------------------------------------------------
+# JOURNAL (blocking: call through run_in_threadpool)
+# -------------------------------------------------------------------
+class Journal:
+    """Append-only submission log with per-record status."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=FULL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def append(self, tracking_id: str, job_id: int, record: dict, files: dict[str, StoredFile]):
+        now = time.time()
+        with self._lock:
+            self._db().execute(
+                "INSERT INTO submissions (tracking_id, job_id, record, files, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    tracking_id, job_id, json.dumps(record),
+                    json.dumps({column: asdict(f) for column, f in files.items()}),
+                    QUEUED, now, now,
+                ),
+            )
+
+    def claim(self, owner: str, limit: int, lease_seconds: float) -> list[dict]:
+        """Up to `limit` queued (or lease-expired) submissions, oldest first."""
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                rows = db.execute(
+                    "SELECT * FROM submissions WHERE status = ? OR (status = ? AND claimed_at < ?) "
+                    "ORDER BY seq LIMIT ?",
+                    (QUEUED, FLUSHING, now - lease_seconds, limit),
+                ).fetchall()
+                db.executemany(
+                    "UPDATE submissions SET status = ?, claimed_by = ?, claimed_at = ?, "
+                    "attempts = attempts + 1, updated_at = ? WHERE seq = ?",
+                    [(FLUSHING, owner, now, now, row["seq"]) for row in rows],
+                )
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+        return [dict(row) for row in rows]
+
+    def finish(self, owner: str, outcomes: list[tuple]):
+        """outcomes: (tracking_id, status, application_id, error); only our own claims."""
+        now = time.time()
+        with self._lock:
+            self._db().executemany(
+                "UPDATE submissions SET status = ?, application_id = ?, error = ?, "
+                "claimed_by = NULL, claimed_at = NULL, updated_at = ? "
+                "WHERE tracking_id = ? AND status = ? AND claimed_by = ?",
+                [
+                    (status, application_id, error, now, tracking_id, FLUSHING, owner)
+                    for tracking_id, status, application_id, error in outcomes
+                ],
+            )
+
+    def requeue(self, owner: str, tracking_ids: list[str], error: str):
+        self.finish(owner, [(tid, QUEUED, None, error) for tid in tracking_ids])
+
+    def get(self, tracking_id: str) -> dict | None:
+        with self._lock:
+            row = self._db().execute(
+                "SELECT tracking_id, job_id, status, attempts, application_id, error, created_at, updated_at "
+                "FROM submissions WHERE tracking_id = ?",
+                (tracking_id,),
+            ).fetchone()
+        return dict(row) if row else None
+
+    def counts(self) -> dict[str, int]:
+        with self._lock:
+            rows = self._db().execute(
+                "SELECT status, COUNT(*) FROM submissions GROUP BY status"
+            ).fetchall()
+        return {status: n for status, n in rows}
+
+    def purge(self, older_than_seconds: float) -> int:
+        """Forget stored / duplicate submissions (failed ones are kept for inspection)."""
+        with self._lock:
+            return self._db().execute(
+                "DELETE FROM submissions WHERE status IN (?, ?) AND updated_at < ?",
+                (STORED, DUPLICATE, time.time() - older_than_seconds),
+            ).rowcount
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+journal = Journal(settings.INGEST_JOURNAL_PATH)
+
+
+# -------------------------------------------------------------------
+# PRODUCER (apply_job)
+# -------------------------------------------------------------------
+async def submit(application: ApplicationCreate, stored: dict[str, StoredFile]) -> str:
+    """Journal a validated submission whose files are stored durably; its tracking id."""
+    tracking_id = str(uuid.uuid4())
+    files = {column: stored[field] for column, field in FILE_COLUMNS.items()}
+    await run_in_threadpool(
+        journal.append, tracking_id, application.job_id, application.model_dump(mode="json"), files
+    )
+    batcher.notify()
+    return tracking_id
+
+
+# -------------------------------------------------------------------
+# BATCHER
+# -------------------------------------------------------------------
+def _files(record: dict) -> dict[str, StoredFile]:
+    return {column: StoredFile(**f) for column, f in json.loads(record["files"]).items()}
+
+
+def _ready(files: dict[str, StoredFile]) -> bool:
+    """
+    True when every file can be placed. A partial already moved into place
+    (by older code, before acquire() linked them) counts as placed.
+    """
+    for stored in files.values():
+        if stored.partial and not os.path.exists(stored.partial):
+            if not os.path.exists(stored.path):
+                return False
+            stored.partial = None
+    return True
+
+
+def _discard_all(files: dict[str, StoredFile]):
+    for stored in files.values():
+        if stored.partial:
+            discard(stored)
+
+
+def _values(record: dict, files: dict[str, StoredFile]) -> dict:
+    data = ApplicationCreate.model_validate(json.loads(record["record"]))
+    values = data.model_dump()
+    values.update(
+        {column: stored.path for column, stored in files.items()},
+        captcha_verified=True,
+        status="Pending",
+        processing_status="pending",
+        tracking_id=record["tracking_id"],
+        **application_dedup.lookup_keys(data.email, data.phone, data.pan_number),
+    )
+    return values
+
+
+class IngestBatcher:
+    """
+    Flushes the journal into the database, INGEST_BATCH_SIZE submissions
+    per transaction, every INGEST_FLUSH_SECONDS or as soon as a batch fills.
+    """
+
+    def __init__(self):
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self._poller = None
+        self._stopping = None
+        self._wakeup = None
+        self._last_purge = 0.0
+        self.flushed = Counter()
+        # health, for GET /admin/applications/ingest
+        self.last_flush_at = None
+        self.last_error = None
+        self.last_error_at = None
+        self.failures = 0  # consecutive
+
+    def start(self):
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self._stopping = asyncio.Event()
+        self._wakeup = asyncio.Event()
+        self._poller = asyncio.get_running_loop().create_task(self._poll())
+
+    async def stop(self):
+        """Journaled submissions not flushed yet are flushed on the next start."""
+        if self._poller is None:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        await self._poller
+        self._poller = None
+
+    def notify(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def stats(self) -> dict:
+        running = self._poller is not None and not self._poller.done()
+        return {
+            "name": self.name,
+            "running": running,
+            "healthy": running and self.failures == 0,
+            "consecutive_failures": self.failures,
+            "last_flush_at": self.last_flush_at,
+            "last_error": self.last_error,
+            "last_error_at": self.last_error_at,
+            "flushed": dict(self.flushed),
+        }
+
+    async def _poll(self):
+        while not self._stopping.is_set():
+            claimed = 0
+            try:
+                claimed = await self.flush_once()
+                if time.time() - self._last_purge > 3600:
+                    self._last_purge = time.time()
+                    await run_in_threadpool(journal.purge, settings.INGEST_RETENTION_HOURS * 3600)
+                self.last_flush_at, self.failures = datetime.now(timezone.utc), 0
+            except Exception as exc:
+                # whatever went wrong, keep polling: the journal would only fill up
+                logger.exception("ingest flush failed")
+                self.failures += 1
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                self.last_error_at = datetime.now(timezone.utc)
+            if claimed < settings.INGEST_BATCH_SIZE:
+                # a full batch means more are waiting: go again at once
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), settings.INGEST_FLUSH_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+    async def flush_once(self) -> int:
+        """Flush one batch; the number of submissions claimed."""
+        records = await run_in_threadpool(
+            journal.claim, self.name, settings.INGEST_BATCH_SIZE, settings.INGEST_LEASE_SECONDS
+        )
+        if not records:
+            return 0
+        try:
+            outcomes = await self._flush(records)
+        except IntegrityError:
+            # raced a direct submission or another batcher: settle one by one
+            outcomes = []
+            for record in records:
+                try:
+                    outcomes += await self._flush([record])
+                except IntegrityError as exc:
+                    outcomes += await self._settle_conflict(record, exc)
+        except SQLAlchemyError as exc:
+            await run_in_threadpool(
+                journal.requeue, self.name, [r["tracking_id"] for r in records], f"{type(exc).__name__}: {exc}"
+            )
+            raise
+
+        await run_in_threadpool(journal.finish, self.name, outcomes)
+        self.flushed.update(status for _, status, _, _ in outcomes)
+        return len(records)
+
+    async def _settle_conflict(self, record: dict, exc: IntegrityError) -> list[tuple]:
+        """A lone submission violated a unique index: a duplicate, or a hard failure."""
+        files = _files(record)
+        data = json.loads(record["record"])
+        keys = application_dedup.lookup_keys(data.get("email"), data.get("phone"), data.get("pan_number"))
+        async with AsyncSessionLocal() as db:
+            existing = await application_dedup.find_duplicate(db, record["job_id"], keys)
+        await run_in_threadpool(_discard_all, files)
+        if existing is not None:
+            return [(record["tracking_id"], DUPLICATE, existing.id, None)]
+        return [(record["tracking_id"], FAILED, None, f"IntegrityError: {exc.orig}")]
+
+    async def _flush(self, records: list[dict]) -> list[tuple]:
+        """
+        One transaction for the batch: committed-before-crash submissions
+        are recognised by tracking_id, duplicates (of the database or of
+        each other) are answered with the application on file, the rest go
+        in with one multi-row INSERT.
+        """
+        outcomes = []
+        async with AsyncSessionLocal() as db:
+            tracking_ids = [r["tracking_id"] for r in records]
+            already = dict(
+                (
+                    await db.execute(
+                        select(Application.tracking_id, Application.id)
+                        .where(Application.tracking_id.in_(tracking_ids))
+                    )
+                ).all()
+            )
+
+            pending = []
+            for record in records:
+                tid = record["tracking_id"]
+                if tid in already:
+                    await run_in_threadpool(_discard_all, _files(record))
+                    outcomes.append((tid, STORED, already[tid], None))
+                    continue
+                files = _files(record)
+                if not await run_in_threadpool(_ready, files):
+                    outcomes.append((tid, FAILED, None, "uploaded files are missing"))
+                    continue
+                try:
+                    values = _values(record, files)
+                except ValueError as exc:
+                    await run_in_threadpool(_discard_all, files)
+                    outcomes.append((tid, FAILED, None, str(exc)))
+                    continue
+                pending.append((tid, values, files))
+
+            # duplicates of applications already on file: one query for the batch
+            on_file = {}
+            if pending:
+                matches = [
+                    getattr(Application, column).in_(
+                        list({values[column] for _, values, _ in pending if values[column]})
+                    )
+                    for column in application_dedup.KEY_COLUMNS
+                ]
+                for row in (
+                    await db.execute(
+                        select(Application.id, Application.job_id, *(
+                            getattr(Application, c) for c in application_dedup.KEY_COLUMNS
+                        ))
+                        .where(or_(*matches))
+                        .order_by(Application.id.desc())
+                    )
+                ).all():
+                    for column in application_dedup.KEY_COLUMNS:
+                        if getattr(row, column):
+                            on_file[(row.job_id, column, getattr(row, column))] = row.id
+
+            to_insert, first_in_batch, duplicates = [], {}, []
+            for tid, values, files in pending:
+                keys = [
+                    (values["job_id"], column, values[column])
+                    for column in application_dedup.KEY_COLUMNS
+                    if values[column]
+                ]
+                hit = next((on_file[k] for k in keys if k in on_file), None)
+                twin = next((first_in_batch[k] for k in keys if k in first_in_batch), None)
+                if hit is not None or twin is not None:
+                    duplicates.append((tid, hit, twin, files))
+                    continue
+                first_in_batch.update((k, tid) for k in keys)
+                to_insert.append((tid, values, files))
+
+            inserted = {}
+            if to_insert:
+                await db.execute(insert(Application), [values for _, values, _ in to_insert])
+                applications = (
+                    await db.execute(
+                        select(Application)
+                        .where(Application.tracking_id.in_([tid for tid, _, _ in to_insert]))
+                    )
+                ).scalars().all()
+                inserted = {a.tracking_id: a for a in applications}
+
+                await blob_store.acquire(db, [f for _, _, files in to_insert for f in files.values()])
+                for application in applications:
+                    task_queue.enqueue_document_tasks(db, application)
+                    await application_search.index_application(db, application)
+                await status_counters.adjust(db, Counter((a.job_id, a.status) for a in applications))
+                await application_rollups.created(
+                    db, [(a.job_id, a.status, a.created_at) for a in applications]
+                )
+            await db.commit()
+
+        for tid, _, files in to_insert:
+            # placed as hard links: the partials can go
+            await run_in_threadpool(_discard_all, files)
+            outcomes.append((tid, STORED, inserted[tid].id, None))
+        for tid, hit, twin, files in duplicates:
+            await run_in_threadpool(_discard_all, files)
+            outcomes.append((tid, DUPLICATE, hit if hit is not None else inserted[twin].id, None))
+        return outcomes
+
+
+batcher = IngestBatcher()
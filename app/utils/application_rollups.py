@@ -0,0 +1,240 @@
+"""
+Daily application rollups behind GET /admin/applications/analytics.
+
+One row per (job, day, status), plus the all-jobs shards (job_id < 0, see
+status_counters.ALL_JOBS_SHARDS), summed on read:
+  applications  applications received that day, by their current status
+                (a cohort: a status change moves the count between statuses
+                of the day the application came in, a delete removes it)
+  transitions   status changes into `status` made that day
+
+Every write to job_applications updates the rollups in its own transaction,
+next to status_counters.adjust(). A report reads at most MAX_DAYS days x
+statuses rows of one job by primary-key range, however many applications
+there are. Days are the database server's dates (created_at / CURRENT_DATE),
+so the incremental rows and rebuild() agree.
+"""
+from collections import Counter
+from datetime import date, datetime, timedelta
+
+from fastapi import HTTPException
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.application_daily_rollup import ApplicationDailyRollup
+from app.models.application_status_change import ApplicationStatusChange
+from app.models.jobapplication import Application
+from app.utils.status_counters import all_jobs_shard, bump_rows, dashboard
+
+GRANULARITIES = ("day", "week", "month")
+
+# Longest report range; bounds the rows a report reads
+MAX_DAYS = 3 * 366
+
+# Default report range, ending today
+DEFAULT_DAYS = 30
+
+
+def _day(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])  # SQLite DATE() returns text
+
+
+async def today(db: AsyncSession) -> date:
+    return _day((await db.execute(select(func.current_date()))).scalar_one())
+
+
+# -------------------------------------------------------------------
+# INCREMENTAL MAINTENANCE (inside the caller's transaction)
+# -------------------------------------------------------------------
+def _with_all_jobs(deltas: Counter) -> Counter:
+    merged: Counter = Counter()
+    for (job_id, day, status), n in deltas.items():
+        merged[(job_id, day, status)] += n
+        merged[(all_jobs_shard(job_id), day, status)] += n
+    return merged
+
+
+async def adjust(db: AsyncSession, applications: Counter, transitions: Counter | None = None):
+    """
+    Apply {(job_id, day, status): +n / -n} to the applications and
+    transitions columns, for the job and for its all-jobs shard, in one
+    batched UPDATE (status_counters.bump_rows).
+    """
+    cohort, moved = _with_all_jobs(applications), _with_all_jobs(transitions or Counter())
+    await bump_rows(
+        db,
+        ApplicationDailyRollup,
+        ("job_id", "day", "status"),
+        {key: {"applications": cohort[key], "transitions": moved[key]} for key in set(cohort) | set(moved)},
+    )
+
+
+async def created(db: AsyncSession, rows):
+    """`rows`: (job_id, status, created_at or day) of new applications."""
+    await adjust(db, Counter((job_id, _day(c), status or "Pending") for job_id, status, c in rows))
+
+
+async def status_changed(db: AsyncSession, rows, new_status: str):
+    """`rows`: (job_id, old_status, created_at) of applications moving to new_status."""
+    on = await today(db)
+    cohort, moved = Counter(), Counter()
+    for job_id, old_status, created_at in rows:
+        cohort[(job_id, _day(created_at), old_status or "Pending")] -= 1
+        cohort[(job_id, _day(created_at), new_status)] += 1
+        moved[(job_id, on, new_status)] += 1
+    await adjust(db, cohort, moved)
+
+
+async def deleted(db: AsyncSession, rows):
+    """`rows`: (job_id, status, created_at) of deleted applications."""
+    deltas = Counter()
+    for job_id, status, created_at in rows:
+        deltas[(job_id, _day(created_at), status or "Pending")] -= 1
+    await adjust(db, deltas)
+
+
+def rebuild(connection) -> int:
+    """
+    Recompute every row from job_applications and the status audit trail
+    on a sync connection (migration backfill, or repair). Returns the
+    number of rows written.
+    """
+    status = func.coalesce(Application.status, "Pending")
+    received = func.date(Application.created_at)
+    cohort = Counter({
+        (job_id, _day(day), s): n
+        for job_id, day, s, n in connection.execute(
+            select(Application.job_id, received, status, func.count())
+            .group_by(Application.job_id, received, status)
+        )
+    })
+    changed = func.date(ApplicationStatusChange.created_at)
+    moved = Counter({
+        (job_id, _day(day), s): n
+        for job_id, day, s, n in connection.execute(
+            select(ApplicationStatusChange.job_id, changed, ApplicationStatusChange.new_status, func.count())
+            .where(ApplicationStatusChange.job_id.is_not(None))
+            .group_by(ApplicationStatusChange.job_id, changed, ApplicationStatusChange.new_status)
+        )
+    })
+
+    cohort, moved = _with_all_jobs(cohort), _with_all_jobs(moved)
+    connection.execute(delete(ApplicationDailyRollup))
+    rows = [
+        {
+            "job_id": job_id, "day": day, "status": s,
+            "applications": cohort[(job_id, day, s)], "transitions": moved[(job_id, day, s)],
+        }
+        for job_id, day, s in sorted(set(cohort) | set(moved))
+    ]
+    if rows:
+        connection.execute(insert(ApplicationDailyRollup), rows)
+    return len(rows)
+
+
+# -------------------------------------------------------------------
+# REPORTS
+# -------------------------------------------------------------------
+def bucket_start(day: date, granularity: str) -> date:
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())  # Monday
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+
+def _next_bucket(start: date, granularity: str) -> date:
+    if granularity == "week":
+        return start + timedelta(days=7)
+    if granularity == "month":
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def _totals(applications: Counter, transitions: Counter) -> dict:
+    by_status = {s: n for s, n in sorted(applications.items()) if n}
+    return {
+        "received": sum(by_status.values()),
+        "by_status": by_status,
+        "transitions": {s: n for s, n in sorted(transitions.items()) if n},
+    }
+
+
+async def report(
+    db: AsyncSession, start: date | None, end: date | None, granularity: str, job_id: int | None = None,
+) -> dict:
+    """
+    Received applications, current status mix and status changes per
+    bucket, plus range totals and the received -> reviewed -> shortlisted
+    funnel of the range's cohort.
+    """
+    if end is None:
+        end = await today(db)
+    if start is None:
+        start = end - timedelta(days=DEFAULT_DAYS - 1)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must not be after end")
+    if (end - start).days + 1 > MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"Range is limited to {MAX_DAYS} days")
+
+    rollup = ApplicationDailyRollup
+    rows = (
+        await db.execute(
+            select(rollup.day, rollup.status, func.sum(rollup.applications), func.sum(rollup.transitions))
+            .where(
+                rollup.job_id == job_id if job_id else rollup.job_id < 0,  # all jobs: the shards
+                rollup.day.between(start, end),
+            )
+            .group_by(rollup.day, rollup.status)
+        )
+    ).all()
+
+    # every bucket of the range, empty ones included, so charts need no gap filling
+    buckets = {}
+    cursor = bucket_start(start, granularity)
+    while cursor <= end:
+        buckets[cursor] = (Counter(), Counter())
+        cursor = _next_bucket(cursor, granularity)
+
+    applications, transitions = Counter(), Counter()
+    for day, status, a, t in rows:
+        cohort, moved = buckets[bucket_start(_day(day), granularity)]
+        a, t = int(a), int(t)  # SUM() is a Decimal on MySQL
+        cohort[status] += a
+        moved[status] += t
+        applications[status] += a
+        transitions[status] += t
+
+    totals = _totals(applications, transitions)
+    stats = dashboard(totals["by_status"])
+    received = stats["total"]
+    reviewed = received - stats["pending"]
+
+    def stage(name, n):
+        return {"stage": name, "count": n, "rate": round(n / received, 4) if received else 0.0}
+
+    return {
+        "job_id": job_id,
+        "start": start,
+        "end": end,
+        "granularity": granularity,
+        "buckets": [
+            {
+                "start": max(bucket, start),
+                "end": min(_next_bucket(bucket, granularity) - timedelta(days=1), end),
+                **_totals(cohort, moved),
+            }
+            for bucket, (cohort, moved) in buckets.items()
+        ],
+        "totals": totals,
+        "stats": stats,
+        "funnel": [
+            stage("received", received),
+            stage("reviewed", reviewed),
+            stage("shortlisted", stats["shortlisted"]),
+        ],
+    }
@@ -0,0 +1,196 @@
+import math
+import re
+from collections import Counter
+
+from sqlalchemy import case, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.application_term import ApplicationTerm
+from app.models.jobapplication import Application
+from app.utils.cache import MISSING, TTLCache
+
+# Field weights: a skill the candidate listed beats a word in the resume
+FIELD_WEIGHTS = {
+    "key_skills": 3.0,
+    "position_applied": 2.0,
+    "previous_role": 2.0,
+    "specialization": 1.0,
+}
+RESUME_WEIGHT = 1.0
+
+# Postings kept per resume (highest term frequency first)
+MAX_RESUME_TERMS = 150
+MAX_TERM_LENGTH = 64
+
+# Multi-word skills, matched before tokenizing
+PHRASES = {
+    "machine learning": "ml",
+    "deep learning": "deeplearning",
+    "artificial intelligence": "ai",
+    "natural language processing": "nlp",
+    "data science": "datascience",
+    "computer vision": "computervision",
+    "react native": "reactnative",
+    "spring boot": "springboot",
+    "ruby on rails": "rails",
+    "power bi": "powerbi",
+    "google cloud": "gcp",
+    "amazon web services": "aws",
+    "sql server": "mssql",
+    "visual basic": "vb",
+}
+
+# Spellings of the same skill -> one term
+ALIASES = {
+    "js": "javascript",
+    "ecmascript": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "python3": "python",
+    "golang": "go",
+    "reactjs": "react",
+    "react.js": "react",
+    "vuejs": "vue",
+    "vue.js": "vue",
+    "angularjs": "angular",
+    "node": "nodejs",
+    "node.js": "nodejs",
+    "next.js": "nextjs",
+    "express.js": "express",
+    "expressjs": "express",
+    "c++": "cpp",
+    "c#": "csharp",
+    ".net": "dotnet",
+    "asp.net": "dotnet",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "mongo": "mongodb",
+    "k8s": "kubernetes",
+    "tf": "tensorflow",
+    "sklearn": "scikit-learn",
+    "ms-excel": "excel",
+}
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have i in is it its me my of on or our "
+    "that the their this to was were will with you your we he she they them his her "
+    "also etc using used use work worked working experience years year".split()
+)
+
+_PHRASE = re.compile(r"\b(" + "|".join(re.escape(p) for p in PHRASES) + r")\b")
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.\-]*|\.net")
+
+
+def terms(text: str | None) -> list[str]:
+    """Normalized terms of `text`, in order, repeats kept."""
+    if not text:
+        return []
+    text = _PHRASE.sub(lambda m: f" {PHRASES[m.group(1)]} ", text.lower())
+    out = []
+    for token in _TOKEN.findall(text):
+        token = token.rstrip(".-")
+        token = ALIASES.get(token, token)
+        if len(token) < 2 and token not in ("c", "r"):
+            continue
+        if token in STOPWORDS or token.isdigit() or len(token) > MAX_TERM_LENGTH:
+            continue
+        out.append(token)
+    return out
+
+
+def normalize_skills(text: str | None) -> list[str]:
+    """Distinct normalized skills from a free-text skills list."""
+    return list(dict.fromkeys(terms(text)))
+
+
+def postings(application: Application) -> dict[str, float]:
+    """term -> weight for one application."""
+    weights: Counter = Counter()
+    for field, weight in FIELD_WEIGHTS.items():
+        for term in set(terms(getattr(application, field))):
+            weights[term] += weight
+
+    tf = Counter(terms(application.resume_text))
+    for term, count in tf.most_common(MAX_RESUME_TERMS):
+        weights[term] += RESUME_WEIGHT * (1 + math.log(count))
+    return dict(weights)
+
+
+# -------------------------------------------------------------------
+# INCREMENTAL MAINTENANCE (inside the caller's transaction)
+# -------------------------------------------------------------------
+async def index_application(db: AsyncSession, application: Application):
+    """(Re)write the postings of one flushed application."""
+    await db.execute(delete(ApplicationTerm).where(ApplicationTerm.application_id == application.id))
+    rows = [
+        {"term": term, "application_id": application.id, "weight": weight}
+        for term, weight in postings(application).items()
+    ]
+    if rows:
+        await db.execute(insert(ApplicationTerm), rows)
+
+
+async def unindex_applications(db: AsyncSession, application_ids):
+    if application_ids:
+        await db.execute(
+            delete(ApplicationTerm).where(ApplicationTerm.application_id.in_(application_ids))
+        )
+
+
+# -------------------------------------------------------------------
+# SEARCH
+# -------------------------------------------------------------------
+# Application count for idf; exact enough when a minute old
+_doc_count = TTLCache(maxsize=1, ttl=60)
+
+
+async def _total_applications(db: AsyncSession) -> int:
+    total = _doc_count.get("n")
+    if total is MISSING:
+        total = (await db.execute(select(func.count(Application.id)))).scalar_one()
+        _doc_count.set("n", total)
+    return max(total, 1)
+
+
+async def search(db: AsyncSession, q: str, filters=(), offset: int = 0, limit: int = 20):
+    """
+    [(application_id, score)] ranked by weighted tf-idf over the postings
+    table: one GROUP BY over the query terms' postings, no table scan.
+    `filters` are extra WHERE clauses on Application.
+    """
+    query_terms = list(dict.fromkeys(terms(q)))
+    if not query_terms:
+        return []
+
+    df = dict(
+        (
+            await db.execute(
+                select(ApplicationTerm.term, func.count())
+                .where(ApplicationTerm.term.in_(query_terms))
+                .group_by(ApplicationTerm.term)
+            )
+        ).all()
+    )
+    if not df:
+        return []
+
+    total = await _total_applications(db)
+    idf = case(
+        {term: math.log(1 + total / n) for term, n in df.items()},
+        value=ApplicationTerm.term,
+        else_=0.0,
+    )
+    score = func.sum(ApplicationTerm.weight * idf).label("score")
+
+    query = (
+        select(ApplicationTerm.application_id, score)
+        .where(ApplicationTerm.term.in_(list(df)))
+        .group_by(ApplicationTerm.application_id)
+        .order_by(score.desc(), ApplicationTerm.application_id.desc())
+        .offset(offset)
+        .limit(limit)
+    )
+    if filters:
+        query = query.join(Application, Application.id == ApplicationTerm.application_id).where(*filters)
+
+    return [(row.application_id, float(row.score)) for row in (await db.execute(query)).all()]
@@ -0,0 +1,89 @@
+from collections import Counter
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.application_status_change import ApplicationStatusChange
+from app.models.jobapplication import Application
+from app.schemas.jobapplication import ApplicationBulkStatus
+from app.utils import application_rollups, status_counters
+
+
+async def record_transitions(db: AsyncSession, rows, new_status: str, admin_id: int | None):
+    """
+    Audit rows, counter and rollup updates for applications moving to
+    new_status, within db's transaction. `rows` are (id, job_id, old_status,
+    created_at) of rows whose status really changes.
+    """
+    if not rows:
+        return
+    await db.execute(
+        insert(ApplicationStatusChange),
+        [
+            {
+                "application_id": app_id,
+                "job_id": job_id,
+                "old_status": old_status,
+                "new_status": new_status,
+                "changed_by": admin_id,
+            }
+            for app_id, job_id, old_status, _ in rows
+        ],
+    )
+    deltas = Counter()
+    for _, job_id, old_status, _ in rows:
+        deltas[(job_id, old_status or "Pending")] -= 1
+        deltas[(job_id, new_status)] += 1
+    await status_counters.adjust(db, deltas)
+    await application_rollups.status_changed(
+        db, [(job_id, old_status, created_at) for _, job_id, old_status, created_at in rows], new_status
+    )
+
+
+async def bulk_transition(db: AsyncSession, request: ApplicationBulkStatus, admin_id: int | None) -> dict:
+    """
+    Move the selected applications to request.status in one transaction:
+    one locking SELECT gives the old statuses (and the rollup days), one
+    UPDATE changes every row, one batched INSERT writes the audit trail.
+    """
+    new_status = request.status
+    if request.ids is not None:
+        selected = [Application.id.in_(request.ids)]
+    else:
+        selected = []
+        if request.filter.job_id:
+            selected.append(Application.job_id == request.filter.job_id)
+        if request.filter.status:
+            selected.append(Application.status == request.filter.status)
+
+    locked = (
+        await db.execute(
+            select(Application.id, Application.job_id, Application.status, Application.created_at)
+            .where(*selected)
+            .order_by(Application.id)
+            .with_for_update()
+        )
+    ).all()
+    changing = [row for row in locked if row.status != new_status]
+
+    if changing:
+        # the rows are locked, so this matches exactly `changing`
+        await db.execute(
+            update(Application)
+            .where(*selected, Application.status.is_distinct_from(new_status))
+            .values(status=new_status)
+            .execution_options(synchronize_session=False)
+        )
+        await record_transitions(db, changing, new_status, admin_id)
+    await db.commit()
+
+    found = {row.id for row in locked}
+    return {
+        "matched": len(locked),
+        "updated": len(changing),
+        "missing": sorted(set(request.ids or ()) - found),
+        "changes": [
+            {"id": row.id, "old_status": row.status, "new_status": new_status}
+            for row in changing
+        ],
+    }
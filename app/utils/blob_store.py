@@ -0,0 +1,201 @@
+import asyncio
+import logging
+import os
+import uuid
+from collections import Counter
+
+from sqlalchemy import delete, event, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.models.blob import Blob
+from app.utils.document_tasks import thumbnail_path
+from app.utils.file_upload import StoredFile
+
+logger = logging.getLogger("app.blobs")
+
+# Uploaded documents, one file per distinct content (see file_upload.content_path)
+BLOB_DIR = "uploads/blobs"
+
+# Paths unlinked per worker thread; batches run in parallel
+UNLINK_BATCH = 64
+
+
+def _place(stored: StoredFile):
+    os.makedirs(os.path.dirname(stored.path), exist_ok=True)
+    # a hard link: the partial stays until the caller is done with it, so an
+    # acquire() whose transaction rolls back can be retried from it
+    link = f"{stored.partial}.{uuid.uuid4().hex}"
+    os.link(stored.partial, link)
+    # identical bytes may already be there: replacing them costs no extra disk
+    os.replace(link, stored.path)
+
+
+def _unlink(paths) -> list[tuple[str, str]]:
+    failed = []
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            failed.append((path, f"{type(exc).__name__}: {exc.strerror or exc}"))
+    return failed
+
+
+async def unlink_all(paths) -> list[tuple[str, str]]:
+    """Remove files in parallel worker threads; [(path, error)] of those left behind."""
+    paths = list(paths)
+    batches = [paths[i:i + UNLINK_BATCH] for i in range(0, len(paths), UNLINK_BATCH)]
+    results = await asyncio.gather(*(run_in_threadpool(_unlink, batch) for batch in batches))
+    failed = [failure for batch in results for failure in batch]
+    for path, error in failed:
+        logger.warning("could not remove %s: %s", path, error)
+    return failed
+
+
+async def acquire(db: AsyncSession, files: list[StoredFile]):
+    """
+    Add one reference per file within db's transaction, then link the
+    content-addressed uploads into place. The partials are left for the
+    caller to discard.
+
+    The files are placed only once their blob rows are written (and, on
+    MySQL, locked until commit), so a concurrent remove_unreferenced() of
+    the same content cannot unlink a file this transaction is about to
+    reference. If the transaction does not commit, the files of the blob
+    rows it inserted are unlinked again (_unlink_unless_committed()).
+    """
+    counts = Counter(f.sha256 for f in files)
+    by_hash = {f.sha256: f for f in files}
+    inserted = []
+
+    for sha256 in sorted(counts):  # fixed order: no lock-order deadlocks
+        stored, n = by_hash[sha256], counts[sha256]
+        bump = update(Blob).where(Blob.sha256 == sha256).values(refcount=Blob.refcount + n)
+        if (await db.execute(bump)).rowcount:
+            continue
+        try:
+            async with db.begin_nested():
+                db.add(Blob(
+                    sha256=sha256,
+                    path=stored.path,
+                    size=stored.size,
+                    content_type=stored.content_type,
+                    refcount=n,
+                ))
+            if stored.partial:
+                inserted.append(stored.path)
+        except IntegrityError:
+            # another request inserted the same content first
+            await db.execute(bump)
+
+    _unlink_unless_committed(db, inserted)
+    for stored in files:
+        if stored.partial:
+            await run_in_threadpool(_place, stored)
+
+
+def _unlink_unless_committed(db: AsyncSession, paths: list[str]):
+    """
+    Unlink `paths` when db's current transaction ends without a commit
+    (rollback, failed commit, or the session closed): their blob rows were
+    never written, so remove_unreferenced() would never find them.
+    """
+    if paths:
+        db.sync_session.info.setdefault(_UNCOMMITTED, []).extend(paths)
+
+
+_UNCOMMITTED = "blob_store.uncommitted"
+
+
+@event.listens_for(Session, "after_commit")
+def _committed(session):
+    session.info.pop(_UNCOMMITTED, None)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _not_committed(session, transaction):
+    if transaction.parent is not None:
+        return  # a savepoint
+    for path, error in _unlink(session.info.pop(_UNCOMMITTED, ())):
+        logger.warning("could not remove %s: %s", path, error)
+
+
+async def release(db: AsyncSession, paths: list[str]) -> list[str]:
+    """
+    Drop one reference per path within db's transaction and delete the
+    blob rows nobody references any more.
+
+    Nothing is unlinked here: returns the files to remove once the caller
+    has committed (remove_unreferenced()), i.e. the orphaned blobs and the
+    paths without a blob row (uploads stored before deduplication). A
+    failed commit leaves every file in place; a crash after it can only
+    leave unreferenced files behind, never rows without their files.
+    """
+    counts = Counter(p for p in paths if p)
+    if not counts:
+        return []
+
+    blobs = (
+        await db.execute(
+            select(Blob.sha256, Blob.path, Blob.refcount)
+            .where(Blob.path.in_(counts))
+            .order_by(Blob.sha256)
+            .with_for_update()
+        )
+    ).all()
+    known = {blob.path for blob in blobs}
+
+    orphaned = []
+    by_decrement: dict[int, list[str]] = {}
+    for blob in blobs:
+        n = counts[blob.path]
+        if blob.refcount > n:
+            by_decrement.setdefault(n, []).append(blob.sha256)
+        else:
+            orphaned.append(blob.sha256)
+
+    # one UPDATE per distinct decrement (almost always just n = 1)
+    for n, hashes in by_decrement.items():
+        await db.execute(
+            update(Blob).where(Blob.sha256.in_(hashes)).values(refcount=Blob.refcount - n)
+        )
+
+    if orphaned:
+        await db.execute(delete(Blob).where(Blob.sha256.in_(orphaned)))
+    unlink = [blob.path for blob in blobs if blob.sha256 in orphaned]
+    return unlink + [path for path in counts if path not in known]
+
+
+async def remove_unreferenced(db: AsyncSession, paths: list[str]) -> list[tuple[str, str]]:
+    """
+    Unlink the files release() returned, after the caller has committed,
+    together with their derived files (photo thumbnails).
+
+    Runs in a transaction of its own that locks the paths' blob rows (on
+    MySQL also the index gaps where they would be inserted): content
+    acquire()d again since the release keeps its file, and a concurrent
+    acquire() of it waits until the unlink is done before placing its copy.
+
+    A file that cannot be removed is logged and [(path, error)] of the
+    files left behind is returned; the deleted rows stay deleted.
+    """
+    paths = list(dict.fromkeys(paths))
+    if not paths:
+        return []
+    try:
+        referenced = set(
+            (
+                await db.execute(
+                    select(Blob.path).where(Blob.path.in_(paths)).order_by(Blob.path).with_for_update()
+                )
+            ).scalars()
+        )
+        unlink = [path for path in paths if path not in referenced]
+        unlink += [thumbnail_path(path) for path in list(unlink)]
+        return await unlink_all(unlink)
+    finally:
+        await db.commit()
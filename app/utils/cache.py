@@ -0,0 +1,139 @@
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import event, select, update, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.cache_version import CacheVersion
+
+MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key, MISSING)
+            if entry is MISSING:
+                self.misses += 1
+                return MISSING
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return MISSING
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+class VersionStamp:
+    """
+    A named counter in the cache_versions table, shared by every worker.
+
+    Writers bump it in the same transaction as their change; readers fold it
+    into their cache keys, re-reading it at most every
+    CACHE_VERSION_CHECK_SECONDS, so other workers stop serving stale entries
+    within that window.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._version = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def last_seen(self) -> int | None:
+        return self._version
+
+    def current(self, db: Session) -> int:
+        now = time.monotonic()
+        with self._lock:
+            if self._version is not None and now - self._checked_at < settings.CACHE_VERSION_CHECK_SECONDS:
+                return self._version
+
+        version = db.execute(
+            select(CacheVersion.version).where(CacheVersion.name == self.name)
+        ).scalar() or 0
+
+        with self._lock:
+            self._version, self._checked_at = version, now
+        return version
+
+    def bump(self, db: Session, on_commit=None):
+        """Increment within db's transaction; local state resets on commit."""
+        bump = (
+            update(CacheVersion)
+            .where(CacheVersion.name == self.name)
+            .values(version=CacheVersion.version + 1)
+        )
+        if db.execute(bump).rowcount == 0:
+            try:
+                with db.begin_nested():
+                    db.execute(insert(CacheVersion).values(name=self.name, version=1))
+            except IntegrityError:
+                # another transaction's first bump inserted the row first
+                db.execute(bump)
+
+        @event.listens_for(db, "after_commit", once=True)
+        def _reset(session):
+            with self._lock:
+                self._version = None
+            if on_commit:
+                on_commit()
+
+
+_stamps: dict[str, VersionStamp] = {}
+_stamps_lock = threading.Lock()
+
+
+def version_stamp(name: str) -> VersionStamp:
+    """The process-wide VersionStamp for `name` (shared by caches and ETags)."""
+    with _stamps_lock:
+        if name not in _stamps:
+            _stamps[name] = VersionStamp(name)
+        return _stamps[name]
@@ -0,0 +1,184 @@
+"""
+CPU-bound document processing, run in the task queue's process pool.
+
+Everything here is a plain function of file paths to a JSON-able dict: no
+database, no settings, no FastAPI, so child processes start quickly and the
+functions can be called directly from a shell or a test.
+"""
+import os
+import re
+import struct
+import zipfile
+from xml.etree import ElementTree
+
+THUMBNAIL_SIZE = (256, 256)
+# Resume text kept on the application row
+MAX_RESUME_CHARS = 60000
+# Smallest scan of a PAN card we accept, in pixels
+MIN_PAN_SIDE = 300
+
+PAN_NUMBER = re.compile(r"^[A-Z]{5}[0-9]{4}[A-Z]$")
+
+_WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+class PermanentError(Exception):
+    """Retrying cannot help (bad input, missing optional dependency)."""
+
+
+def _require(path: str):
+    if not path or not os.path.exists(path):
+        raise PermanentError(f"file not found: {path}")
+
+
+def thumbnail_path(path: str) -> str:
+    """Derived file next to the blob; removed with it by blob_store.remove_unreferenced()."""
+    return os.path.splitext(path)[0] + ".thumb.jpg"
+
+
+# -------------------------------------------------------------------
+# PHOTO THUMBNAIL
+# -------------------------------------------------------------------
+def make_thumbnail(path: str) -> dict:
+    _require(path)
+    try:
+        from PIL import Image, UnidentifiedImageError
+    except ImportError:
+        raise PermanentError("Pillow is not installed")
+
+    target = thumbnail_path(path)
+    partial = f"{target}.{os.getpid()}.part"
+    try:
+        with Image.open(path) as image:
+            image.thumbnail(THUMBNAIL_SIZE)
+            image.convert("RGB").save(partial, "JPEG", quality=85)
+        os.replace(partial, target)
+    except UnidentifiedImageError as exc:
+        raise PermanentError(f"not an image: {exc}")
+    finally:
+        # left behind by a failed save (disk full, truncated image)
+        if os.path.exists(partial):
+            os.remove(partial)
+    return {"thumbnail": target.replace("\\", "/")}
+
+
+# -------------------------------------------------------------------
+# RESUME TEXT
+# -------------------------------------------------------------------
+def _docx_text(path: str) -> str:
+    try:
+        with zipfile.ZipFile(path) as archive:
+            root = ElementTree.fromstring(archive.read("word/document.xml"))
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as exc:
+        raise PermanentError(f"unreadable DOCX: {exc}")
+    paragraphs = []
+    for paragraph in root.iter(f"{_WORD_NS}p"):
+        text = "".join(node.text or "" for node in paragraph.iter(f"{_WORD_NS}t"))
+        if text:
+            paragraphs.append(text)
+    return "\n".join(paragraphs)
+
+
+def _pdf_text(path: str) -> str:
+    try:
+        from pypdf import PdfReader
+        from pypdf.errors import PdfReadError
+    except ImportError:
+        raise PermanentError("pypdf is not installed")
+    try:
+        reader = PdfReader(path)
+        return "\n".join(page.extract_text() or "" for page in reader.pages)
+    except PdfReadError as exc:
+        raise PermanentError(f"unreadable PDF: {exc}")
+
+
+def extract_resume_text(path: str) -> dict:
+    _require(path)
+    with open(path, "rb") as f:
+        head = f.read(8)
+
+    if head.startswith(b"%PDF-"):
+        text = _pdf_text(path)
+    elif head.startswith(b"PK\x03\x04"):
+        text = _docx_text(path)
+    else:
+        raise PermanentError("only PDF and DOCX resumes can be read")
+
+    text = re.sub(r"[ \t]+", " ", text).strip()
+    return {"text": text[:MAX_RESUME_CHARS], "chars": len(text)}
+
+
+# -------------------------------------------------------------------
+# PAN CARD
+# -------------------------------------------------------------------
+def _webp_size(head: bytes):
+    chunk = head[12:16]
+    if chunk == b"VP8 " and head[23:26] == b"\x9d\x01\x2a":  # lossy: key frame header
+        width, height = struct.unpack("<HH", head[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L" and head[20] == 0x2F:  # lossless: 14-bit sizes minus one
+        bits = int.from_bytes(head[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":  # extended: 24-bit canvas sizes minus one
+        return int.from_bytes(head[24:27], "little") + 1, int.from_bytes(head[27:30], "little") + 1
+    return None
+
+
+def _image_size(path: str):
+    """(width, height) from the PNG / JPEG / WebP header, or None."""
+    with open(path, "rb") as f:
+        head = f.read(30)
+        if head.startswith(b"\x89PNG\r\n\x1a\n"):
+            return struct.unpack(">II", head[16:24])
+        if head[:4] == b"RIFF" and head[8:12] == b"WEBP" and len(head) == 30:
+            return _webp_size(head)
+        if not head.startswith(b"\xff\xd8"):
+            return None
+
+        # walk JPEG segments up to the start-of-frame marker
+        f.seek(2)
+        while True:
+            marker = f.read(2)
+            if len(marker) < 2 or marker[0] != 0xFF:
+                return None
+            if marker[1] in (0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF):
+                frame = f.read(7)
+                if len(frame) < 7:
+                    return None
+                height, width = struct.unpack(">HH", frame[3:7])
+                return width, height
+            length = f.read(2)
+            if len(length) < 2:
+                return None
+            f.seek(struct.unpack(">H", length)[0] - 2, os.SEEK_CUR)
+
+
+def validate_pan_card(path: str, pan_number: str | None = None) -> dict:
+    _require(path)
+    problems = []
+
+    if pan_number is not None and not PAN_NUMBER.match(pan_number.strip().upper()):
+        problems.append("PAN number is not in AAAAA9999A format")
+
+    with open(path, "rb") as f:
+        is_pdf = f.read(5) == b"%PDF-"
+    if not is_pdf:
+        size = _image_size(path)
+        if size is None:
+            problems.append("PAN card is not a readable PNG, JPEG or WebP image")
+        elif min(size) < MIN_PAN_SIDE:
+            problems.append(f"PAN card image is too small ({size[0]}x{size[1]})")
+
+    return {"valid": not problems, "problems": problems}
+
+
+HANDLERS = {
+    "photo_thumbnail": make_thumbnail,
+    "resume_text": extract_resume_text,
+    "pan_card_check": validate_pan_card,
+}
+
+
+def run(kind: str, payload: dict) -> dict:
+    """Process-pool entry point."""
+    return HANDLERS[kind](**payload)
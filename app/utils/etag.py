@@ -0,0 +1,48 @@
+import hashlib
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy.orm import Session
+
+from app.database import get_read_db
+from app.utils.cache import version_stamp
+
+
+def _matches(if_none_match: str, tag: str) -> bool:
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    # If-None-Match uses weak comparison: W/"x" matches "x"
+    return "*" in candidates or tag in (c.removeprefix("W/") for c in candidates)
+
+
+def conditional(name: str, max_age: int = 0):
+    """
+    Dependency: strong ETag / If-None-Match handling for a read endpoint.
+
+    The ETag is derived from the `name` version stamp (bumped by every write
+    to that data set) plus the request path and query, so an unchanged
+    resource answers 304 before the handler runs any query or serializes
+    anything. Opt in per route:
+
+        @router.get("/", dependencies=[Depends(conditional("jobs"))])
+    """
+    stamp = version_stamp(name)
+    cache_control = f"public, max-age={max_age}" if max_age else "public, no-cache"
+
+    def dependency(
+        request: Request,
+        response: Response,
+        db: Session = Depends(get_read_db),
+    ):
+        version = stamp.current(db)
+        digest = hashlib.sha1(
+            f"{name}:{version}:{request.url.path}?{request.url.query}".encode("utf-8")
+        ).hexdigest()
+        tag = f'"{digest}"'
+        headers = {"ETag": tag, "Cache-Control": cache_control}
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _matches(if_none_match, tag):
+            raise HTTPException(status_code=304, headers=headers)
+
+        response.headers.update(headers)
+
+    return dependency
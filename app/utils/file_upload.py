@@ -1,15 +1,245 @@
+import asyncio
+import hashlib
 import os
+import threading
 import uuid
-from fastapi import UploadFile
+from dataclasses import dataclass
 
-def save_upload_file(upload_dir: str, file: UploadFile) -> str:
-    os.makedirs(upload_dir, exist_ok=True)
+from fastapi import HTTPException, Request, UploadFile
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+
+# Bytes per read/hash/write step: an upload never sits in memory whole
+CHUNK_SIZE = 256 * 1024
+
+# Leading bytes -> MIME type; checked against the first chunk
+_SIGNATURES = [
+    (b"%PDF-", "application/pdf"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", "application/msword"),
+    (b"PK\x03\x04", "application/zip"),
+]
+
+DOCX = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+EXTENSIONS = {
+    "application/pdf": ".pdf",
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "application/msword": ".doc",
+    DOCX: ".docx",
+    "application/zip": ".zip",
+}
+
+IMAGE_TYPES = {"image/jpeg", "image/png", "image/webp"}
+DOCUMENT_TYPES = {"application/pdf", "application/msword", DOCX}
+
+
+@dataclass
+class StoredFile:
+    path: str
+    size: int
+    sha256: str
+    content_type: str
+    # content-addressed uploads wait here until blob_store.acquire() places them
+    partial: str | None = None
+
+
+def sniff_mime(head: bytes, filename: str | None = None) -> str:
+    """MIME type from the file's magic bytes (the client's claim is ignored)."""
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    for signature, content_type in _SIGNATURES:
+        if head.startswith(signature):
+            if content_type == "application/zip" and (filename or "").lower().endswith(".docx"):
+                return DOCX
+            return content_type
+    return "application/octet-stream"
+
+
+class UploadBudget:
+    """Bytes left for one request, shared by its concurrently written files."""
+
+    def __init__(self, max_bytes: int):
+        self.remaining = max_bytes
+        self._lock = threading.Lock()
+
+    def take(self, size: int):
+        with self._lock:
+            self.remaining -= size
+            if self.remaining < 0:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Upload exceeds {settings.UPLOAD_MAX_REQUEST_BYTES} bytes per request",
+                )
+
+
+def content_path(upload_dir: str, sha256: str, content_type: str) -> str:
+    """<upload_dir>/ab/abcdef....pdf: fanned out, extension kept for serving."""
+    ext = EXTENSIONS.get(content_type, "")
+    return f"{upload_dir.rstrip('/')}/{sha256[:2]}/{sha256}{ext}".replace("\\", "/")
+
+
+def _safe_name(filename: str | None) -> str:
+    return os.path.basename((filename or "").replace("\\", "/")) or "upload"
 
-    filename = f"{uuid.uuid4()}_{file.filename}"
-    path = os.path.join(upload_dir, filename)
 
-    with open(path, "wb") as f:
-        f.write(file.file.read())
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def store_stream(
+    src,
+    upload_dir: str,
+    filename: str | None,
+    *,
+    allowed: set[str] | None = None,
+    budget: UploadBudget | None = None,
+    content_addressed: bool = False,
+    durable: bool = False,
+) -> StoredFile:
+    """
+    Copy a file object to `upload_dir` in CHUNK_SIZE steps, hashing and
+    sniffing it in the same pass. Blocking: call it from a worker thread.
+
+    Data is written to a temporary name and renamed into place once
+    complete, so readers never see a partial file. Raises 413 past
+    UPLOAD_MAX_FILE_BYTES or the request budget and 415 when the sniffed
+    type is not in `allowed`.
+
+    With `content_addressed` the path is derived from the hash and the
+    file is left at `partial` for blob_store.acquire() to move. With
+    `durable` the data is fsynced before returning.
+    """
+    os.makedirs(upload_dir, exist_ok=True)
+    name = _safe_name(filename)
+    path = os.path.join(upload_dir, f"{uuid.uuid4()}_{name}")
+    partial = f"{path}.{uuid.uuid4().hex}.part"
+    if content_addressed:
+        partial = os.path.join(upload_dir, f"{uuid.uuid4().hex}.part")
+
+    digest = hashlib.sha256()
+    size = 0
+    content_type = None
+    try:
+        with open(partial, "wb") as out:
+            while chunk := src.read(CHUNK_SIZE):
+                if content_type is None:
+                    content_type = sniff_mime(chunk, name)
+                    if allowed is not None and content_type not in allowed:
+                        raise HTTPException(
+                            status_code=415,
+                            detail=f"{name}: {content_type} is not an accepted file type",
+                        )
+                size += len(chunk)
+                if size > settings.UPLOAD_MAX_FILE_BYTES:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"{name}: larger than {settings.UPLOAD_MAX_FILE_BYTES} bytes",
+                    )
+                if budget is not None:
+                    budget.take(len(chunk))
+                digest.update(chunk)
+                out.write(chunk)
+            if durable:
+                out.flush()
+                os.fsync(out.fileno())
+        if size == 0:
+            raise HTTPException(status_code=400, detail=f"{name}: empty file")
+        if content_addressed:
+            sha256 = digest.hexdigest()
+            path = content_path(upload_dir, sha256, content_type)
+            return StoredFile(path, size, sha256, content_type, partial=partial)
+        os.replace(partial, path)
+    except BaseException:
+        _remove(partial)
+        raise
 
     # return URL-safe path
-    return path.replace("\\", "/")
+    return StoredFile(path.replace("\\", "/"), size, digest.hexdigest(), content_type)
+
+
+def save_upload_file(upload_dir: str, file: UploadFile, allowed: set[str] | None = None) -> str:
+    """For sync handlers, which already run on FastAPI's threadpool."""
+    return store_stream(file.file, upload_dir, file.filename, allowed=allowed).path
+
+
+async def save_upload(
+    upload_dir: str,
+    file: UploadFile,
+    allowed: set[str] | None = None,
+    budget: UploadBudget | None = None,
+    content_addressed: bool = False,
+    durable: bool = False,
+) -> StoredFile:
+    """store_stream() off the event loop."""
+    await file.seek(0)
+    return await run_in_threadpool(
+        store_stream, file.file, upload_dir, file.filename,
+        allowed=allowed, budget=budget, content_addressed=content_addressed, durable=durable,
+    )
+
+
+def discard(stored: StoredFile):
+    """Undo a store that will not be used (never touches a shared blob)."""
+    _remove(stored.partial or stored.path)
+
+
+async def save_uploads(
+    upload_dir: str, files: dict, content_addressed: bool = False, durable: bool = False
+) -> dict[str, StoredFile]:
+    """
+    Write several uploads of one request concurrently, under a shared
+    UPLOAD_MAX_REQUEST_BYTES budget.
+
+    `files` maps a name to (UploadFile, allowed types). Returns name ->
+    StoredFile; if any file fails, the ones already written are removed.
+    """
+    budget = UploadBudget(settings.UPLOAD_MAX_REQUEST_BYTES)
+    names = list(files)
+    results = await asyncio.gather(
+        *(
+            save_upload(upload_dir, file, allowed, budget, content_addressed, durable)
+            for file, allowed in files.values()
+        ),
+        return_exceptions=True,
+    )
+
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        for result in results:
+            if isinstance(result, StoredFile):
+                await run_in_threadpool(discard, result)
+        raise errors[0]
+    return dict(zip(names, results))
+
+
+async def reject_oversized_uploads(request: Request, call_next):
+    """
+    Refuse multipart bodies whose Content-Length is over
+    UPLOAD_MAX_REQUEST_BYTES before Starlette spools them to disk.
+    """
+    content_type = request.headers.get("content-type", "")
+    length = request.headers.get("content-length")
+    if (
+        content_type.startswith("multipart/form-data")
+        and length
+        and length.isdigit()
+        # allowance for the form fields and part headers
+        and int(length) > settings.UPLOAD_MAX_REQUEST_BYTES + 64 * 1024
+    ):
+        return JSONResponse(
+            status_code=413,
+            content={"detail": f"Upload exceeds {settings.UPLOAD_MAX_REQUEST_BYTES} bytes per request"},
+        )
+    return await call_next(request)
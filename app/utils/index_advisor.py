@@ -0,0 +1,270 @@
+"""
+Index advisor: record the statement shapes an engine issues, EXPLAIN one
+sample of each and propose the composite indexes the plans are missing.
+
+    recorder = ShapeRecorder()
+    with recorder.recording(engine, async_engine.sync_engine):
+        ...  # exercise the routes
+    with engine.connect() as conn:
+        for advice in advise(conn, recorder.samples()):
+            print(advice)
+
+A plan is flagged when it reads a whole table (SQLite "SCAN t", MySQL
+type=ALL) or sorts after reading (SQLite "USE TEMP B-TREE FOR ORDER BY",
+MySQL "Using filesort"). The proposed index takes its columns from the
+statement text in equality -> sort -> range order, and is dropped when an
+existing index (or the primary key) already starts with those columns.
+This is a heuristic over SQLAlchemy-compiled SQL, run against a test
+database seeded like production; it does not replace reading the plans.
+"""
+import re
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from sqlalchemy import event, inspect
+
+from app.utils.sql_metrics import statement_shape
+
+_EXPLAINABLE = ("SELECT", "UPDATE", "DELETE")
+
+_KEYWORDS = {"WHERE", "JOIN", "ON", "SET", "ORDER", "GROUP", "LIMIT", "LEFT", "INNER", "FOR", "OFFSET"}
+_TABLE = re.compile(r"\b(?:FROM|JOIN|UPDATE)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?", re.I)
+_WHERE = re.compile(r"\sWHERE\s(.*?)(?:\sGROUP BY\s|\sORDER BY\s|\sLIMIT\s|\sFOR UPDATE|$)", re.I | re.S)
+_ORDER_BY = re.compile(r"\sORDER BY\s(.*?)(?:\sLIMIT\s|\sOFFSET\s|\sFOR UPDATE|$)", re.I | re.S)
+_PREDICATE = re.compile(
+    r"(\w+)\.(\w+)\s*(<=|>=|!=|<>|=|<|>|\bNOT\s+IN\b|\bIN\b|\bIS\b|\bLIKE\b|\bBETWEEN\b)", re.I
+)
+_ORDER_TERM = re.compile(r"^(\w+)\.(\w+)(?:\s+(?:ASC|DESC))?$", re.I)
+
+_EQUALITY = {"=", "IN", "IS"}
+_RANGE = {"<", ">", "<=", ">=", "BETWEEN", "LIKE"}
+
+_SQLITE_STEP = re.compile(r"^(SCAN|SEARCH) (?:TABLE )?(\w+)(?: AS (\w+))?(.*)$")
+
+
+@dataclass
+class Sample:
+    shape: str
+    statement: str
+    parameters: object
+    count: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class Advice:
+    table: str
+    columns: tuple[str, ...]
+    problems: list[str] = field(default_factory=list)
+    shapes: list[str] = field(default_factory=list)
+    calls: int = 0
+    seconds: float = 0.0
+
+    @property
+    def name(self) -> str:
+        return f"ix_{self.table}_{'_'.join(self.columns)}"
+
+    def __str__(self) -> str:
+        return (
+            f"CREATE INDEX {self.name} ON {self.table} ({', '.join(self.columns)})"
+            f"  -- {', '.join(sorted(set(self.problems)))}; {len(self.shapes)} shape(s),"
+            f" {self.calls} call(s), {self.seconds * 1000:.1f} ms"
+        )
+
+
+# -------------------------------------------------------------------
+# RECORDING
+# -------------------------------------------------------------------
+class ShapeRecorder:
+    """Call count, time and one sample (statement + parameters) per shape."""
+
+    def __init__(self):
+        self._samples: dict[str, Sample] = {}
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("advisor_start_time", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        seconds = time.perf_counter() - conn.info["advisor_start_time"].pop()
+        if executemany or not statement.lstrip().upper().startswith(_EXPLAINABLE):
+            return
+        shape = statement_shape(statement)
+        sample = self._samples.get(shape)
+        if sample is None:
+            sample = self._samples[shape] = Sample(shape, statement, parameters)
+        sample.count += 1
+        sample.seconds += seconds
+
+    @contextmanager
+    def recording(self, *engines):
+        """Record on the given sync Engines (use async_engine.sync_engine)."""
+        for engine in engines:
+            event.listen(engine, "before_cursor_execute", self._before)
+            event.listen(engine, "after_cursor_execute", self._after)
+        try:
+            yield self
+        finally:
+            for engine in engines:
+                event.remove(engine, "before_cursor_execute", self._before)
+                event.remove(engine, "after_cursor_execute", self._after)
+
+    def samples(self) -> list[Sample]:
+        """Most expensive shapes first."""
+        return sorted(self._samples.values(), key=lambda s: s.seconds, reverse=True)
+
+
+# -------------------------------------------------------------------
+# PLANS
+# -------------------------------------------------------------------
+def explain(connection, statement: str, parameters) -> list[tuple[str, str]]:
+    """[(table or alias, problem)] for the plan of one statement."""
+    if connection.dialect.name == "sqlite":
+        return _explain_sqlite(connection, statement, parameters)
+    if connection.dialect.name == "mysql":
+        return _explain_mysql(connection, statement, parameters)
+    raise NotImplementedError(f"EXPLAIN is not parsed for {connection.dialect.name}")
+
+
+def _explain_sqlite(connection, statement, parameters):
+    problems = []
+    rows = connection.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+    for row in rows:
+        detail = row[-1]
+        step = _SQLITE_STEP.match(detail)
+        if step:
+            kind, table, alias, rest = step.groups()
+            if kind == "SCAN" and "USING" not in rest:
+                problems.append((alias or table, "full scan"))
+        elif detail.startswith("USE TEMP B-TREE FOR") and "ORDER BY" in detail:
+            # not tied to a table in the plan; the caller resolves it
+            problems.append((None, "sort"))
+    return problems
+
+
+def _explain_mysql(connection, statement, parameters):
+    problems = []
+    for row in connection.exec_driver_sql("EXPLAIN " + statement, parameters).mappings():
+        table, extra = row["table"], row.get("Extra") or ""
+        if table is None or table.startswith("<"):
+            continue  # derived tables, unions
+        if row["type"] == "ALL":
+            problems.append((table, "full scan"))
+        if "Using filesort" in extra:
+            problems.append((table, "sort"))
+    return problems
+
+
+# -------------------------------------------------------------------
+# PROPOSALS
+# -------------------------------------------------------------------
+def _aliases(statement: str) -> dict[str, str]:
+    aliases = {}
+    for table, alias in _TABLE.findall(statement):
+        aliases[table] = table
+        if alias and alias.upper() not in _KEYWORDS:
+            aliases[alias] = table
+    return aliases
+
+
+def _predicates(statement: str) -> list[tuple[str, str, str]]:
+    """[(table or alias, column, operator)] in the top WHERE clause."""
+    where = _WHERE.search(statement)
+    if not where:
+        return []
+    return [(t, c, " ".join(op.upper().split())) for t, c, op in _PREDICATE.findall(where.group(1))]
+
+
+def _order_by(statement: str) -> list[tuple[str, str]] | None:
+    """[(table or alias, column)], or None when some term is an expression."""
+    order = _ORDER_BY.search(statement)
+    if not order:
+        return []
+    terms = []
+    for term in order.group(1).split(","):
+        match = _ORDER_TERM.match(term.strip())
+        if not match:
+            return None
+        terms.append(match.groups())
+    return terms
+
+
+def propose(statement: str, alias: str) -> tuple[str, ...]:
+    """Equality, then sort, then (one) range column of `alias` in `statement`."""
+    predicates = [(c, op) for t, c, op in _predicates(statement) if t == alias]
+    ranged = [c for c, op in predicates if op in _RANGE]
+    equality = [c for c, op in predicates if op in _EQUALITY and c not in ranged]
+
+    order = _order_by(statement) or []
+    sort = [c for t, c in order] if order and all(t == alias for t, c in order) else []
+
+    columns = list(dict.fromkeys(equality))
+    columns += [c for c in sort if c not in columns]
+    columns += [c for c in ranged if c not in columns][:1]
+    return tuple(columns)
+
+
+def existing_indexes(connection, table: str) -> list[tuple[str, ...]]:
+    """Column lists of the table's indexes, unique constraints and primary key."""
+    inspector = inspect(connection)
+    pk = tuple(inspector.get_pk_constraint(table).get("constrained_columns") or ())
+    lists = [pk] if pk else []
+    lists += [tuple(ix["column_names"]) for ix in inspector.get_indexes(table)]
+    lists += [tuple(uc["column_names"]) for uc in inspector.get_unique_constraints(table)]
+    # secondary indexes end with the primary key (InnoDB stores it; SQLite rowid)
+    return [cols + tuple(c for c in pk if c not in cols) for cols in lists]
+
+
+def _covered(columns: tuple[str, ...], indexes: list[tuple[str, ...]]) -> bool:
+    return any(ix[:len(columns)] == columns for ix in indexes)
+
+
+def advise(connection, samples) -> list[Advice]:
+    """Index proposals for the recorded samples, most expensive first."""
+    advice: dict[tuple, Advice] = {}
+    indexes: dict[str, list] = {}
+
+    for sample in samples:
+        problems = explain(connection, sample.statement, sample.parameters)
+        if not problems:
+            continue
+        aliases = _aliases(sample.statement)
+        order = _order_by(sample.statement) or []
+        for alias, problem in problems:
+            if alias is None:
+                # the sort belongs to the table of the ORDER BY columns
+                owners = {t for t, c in order}
+                if len(owners) != 1:
+                    continue
+                alias = owners.pop()
+            table = aliases.get(alias, alias)
+            columns = propose(sample.statement, alias)
+            if not columns:
+                continue
+            if table not in indexes:
+                indexes[table] = existing_indexes(connection, table)
+            if _covered(columns, indexes[table]):
+                continue
+
+            entry = advice.setdefault((table, columns), Advice(table, columns))
+            entry.problems.append(problem)
+            if sample.shape not in entry.shapes:
+                entry.shapes.append(sample.shape)
+                entry.calls += sample.count
+                entry.seconds += sample.seconds
+
+    # a proposal that is a prefix of another one on the table is served by it
+    kept = []
+    for entry in sorted(advice.values(), key=lambda a: len(a.columns), reverse=True):
+        wider = next(
+            (k for k in kept if k.table == entry.table and k.columns[:len(entry.columns)] == entry.columns),
+            None,
+        )
+        if wider is None:
+            kept.append(entry)
+            continue
+        wider.problems += entry.problems
+        wider.shapes += [s for s in entry.shapes if s not in wider.shapes]
+        wider.calls += entry.calls
+        wider.seconds += entry.seconds
+    return sorted(kept, key=lambda a: a.seconds, reverse=True)
@@ -0,0 +1,89 @@
+from sqlalchemy import or_, update
+from sqlalchemy.orm import Session
+
+from app.models.job import Job
+from app.schemas.job import JobBatchUpdate
+from app.utils import job_cache, job_search
+from app.utils.job_facets import apply_filters
+
+
+def _changes(values: dict):
+    # rows where at least one column would really change (NULL-safe)
+    return or_(*(getattr(Job, field).is_distinct_from(value) for field, value in values.items()))
+
+
+def _groups(db: Session, request: JobBatchUpdate):
+    """
+    (query of candidate ids, values) pairs, one UPDATE each. Per-id updates
+    sharing the same field values collapse into one `WHERE id IN (...)`.
+    """
+    if request.filter is not None:
+        query = apply_filters(db.query(Job.id), request.filter)
+        return [(query, request.fields.model_dump(exclude_unset=True))]
+
+    by_values: dict[tuple, list[int]] = {}
+    for item in request.updates:
+        values = item.fields.model_dump(exclude_unset=True)
+        by_values.setdefault(tuple(sorted(values.items())), []).append(item.id)
+    return [
+        (db.query(Job.id).filter(Job.id.in_(ids)), dict(values))
+        for values, ids in by_values.items()
+    ]
+
+
+def batch_update(db: Session, request: JobBatchUpdate) -> dict:
+    """
+    Apply a batch of job updates in one transaction.
+
+    Each group locks the rows it would actually change (SELECT ... FOR
+    UPDATE) and changes them with one set-based UPDATE. Cache invalidation
+    and search reindexing happen once for the whole batch.
+    """
+    missing: list[int] = []
+    changed_ids: list[int] = []
+    search_touched = False
+
+    if request.filter is not None:
+        matched = apply_filters(db.query(Job.id), request.filter).count()
+    else:
+        requested = [item.id for item in request.updates]
+        found = {row.id for row in db.query(Job.id).filter(Job.id.in_(requested))}
+        matched = len(found)
+        missing = [job_id for job_id in requested if job_id not in found]
+
+    for query, values in _groups(db, request):
+        ids = [row.id for row in query.filter(_changes(values)).with_for_update()]
+        if not ids:
+            continue
+
+        db.execute(
+            update(Job)
+            .where(Job.id.in_(ids))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        changed_ids.extend(ids)
+        search_touched = search_touched or bool(values.keys() & job_search.FIELD_WEIGHTS.keys())
+
+    if changed_ids:
+        job_cache.invalidate(db)
+    db.commit()
+
+    jobs = []
+    if changed_ids:
+        jobs = (
+            db.query(Job)
+            .filter(Job.id.in_(changed_ids))
+            .order_by(Job.id)
+            .populate_existing()
+            .all()
+        )
+        if search_touched:
+            job_search.index.add_many(jobs)
+
+    return {
+        "matched": matched,
+        "updated": len(changed_ids),
+        "missing": sorted(missing),
+        "data": jobs,
+    }
@@ -0,0 +1,23 @@
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.utils.cache import MISSING, TTLCache, version_stamp
+
+# Public job catalogue: GET /jobs/ pages and GET /jobs/{id}
+cache = TTLCache(maxsize=settings.JOB_CACHE_SIZE, ttl=settings.JOB_CACHE_TTL)
+version = version_stamp("jobs")
+
+
+def get_or_load(db: Session, key: tuple, loader):
+    """Return the cached value for `key`, calling `loader()` on a miss."""
+    full_key = (version.current(db), *key)
+    value = cache.get(full_key)
+    if value is MISSING:
+        value = loader()
+        cache.set(full_key, value)
+    return value
+
+
+def invalidate(db: Session):
+    """Call before commit in every handler that changes jobs."""
+    version.bump(db, on_commit=cache.clear)
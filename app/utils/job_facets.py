@@ -0,0 +1,82 @@
+from collections import Counter
+from typing import List, Optional
+
+from fastapi import Query
+from sqlalchemy import func
+
+from app.models.job import Job
+from app.schemas.job import JobFacets, JobFilters
+
+# Columns that get facet counts (and multi-value filters)
+FACETS = ("department", "job_location", "work_mode")
+
+
+def job_filters(
+    department: List[str] = Query([]),
+    work_mode: List[str] = Query([]),
+    job_location: List[str] = Query([]),
+    experience: Optional[int] = Query(None, ge=0, description="Candidate years of experience"),
+    salary_min: Optional[int] = Query(None, ge=0),
+    salary_max: Optional[int] = Query(None, ge=0),
+) -> JobFilters:
+    """Dependency: structured /jobs filters, normalized for cache keys."""
+    return JobFilters(
+        department=tuple(sorted(set(department))),
+        work_mode=tuple(sorted(set(work_mode))),
+        job_location=tuple(sorted(set(job_location))),
+        experience=experience,
+        salary_min=salary_min,
+        salary_max=salary_max,
+    )
+
+
+def apply_filters(query, filters: JobFilters, with_facets: bool = True):
+    if filters.experience is not None:
+        query = query.filter(
+            Job.experience_min <= filters.experience,
+            Job.experience_max >= filters.experience,
+        )
+    # salary: the job's range overlaps the requested range
+    if filters.salary_min is not None:
+        query = query.filter(Job.salary_max >= filters.salary_min)
+    if filters.salary_max is not None:
+        query = query.filter(Job.salary_min <= filters.salary_max)
+
+    if with_facets:
+        for facet in FACETS:
+            values = getattr(filters, facet)
+            if values:
+                query = query.filter(getattr(Job, facet).in_(values))
+    return query
+
+
+def count_facets(query, filters: JobFilters) -> JobFacets:
+    """
+    Facet counts from one GROUP BY over (department, job_location, work_mode).
+
+    `query` must carry every filter except the facet selections. Each
+    facet's counts then honour the other facets' selections but not its
+    own, so the UI can show the alternatives to a selected value.
+    """
+    columns = [getattr(Job, facet) for facet in FACETS]
+    rows = (
+        query.order_by(None)
+        .with_entities(*columns, func.count())
+        .group_by(*columns)
+        .all()
+    )
+
+    counts = {facet: Counter() for facet in FACETS}
+    for *values, n in rows:
+        row = dict(zip(FACETS, values))
+        for facet in FACETS:
+            if row[facet] is None:
+                continue
+            if all(
+                not getattr(filters, other) or row[other] in getattr(filters, other)
+                for other in FACETS
+                if other != facet
+            ):
+                counts[facet][row[facet]] += n
+
+    return JobFacets(**{facet: dict(c.most_common()) for facet, c in counts.items()})
@@ -0,0 +1,207 @@
+import codecs
+import csv
+import json
+from typing import get_args
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.models.job import Job
+from app.schemas.job import JobCreate
+from app.utils import job_cache, job_search
+
+CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonlines": "ndjson",
+}
+
+# Only the first errors are returned; `failed` still counts every bad row
+MAX_REPORTED_ERRORS = 1000
+
+# A CSV may leave out the Optional[...] columns; they import as NULL
+OPTIONAL_COLUMNS = {
+    name for name, field in JobCreate.model_fields.items()
+    if type(None) in get_args(field.annotation)
+}
+REQUIRED_COLUMNS = set(JobCreate.model_fields) - OPTIONAL_COLUMNS
+
+
+def detect_format(content_type: str | None) -> str:
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type not in CONTENT_TYPES:
+        raise HTTPException(
+            status_code=415,
+            detail="Send text/csv or application/x-ndjson, or pass ?format=csv|ndjson",
+        )
+    return CONTENT_TYPES[media_type]
+
+
+# -------------------------------------------------------------------
+# INCREMENTAL PARSING
+# -------------------------------------------------------------------
+async def _lines(chunks):
+    """Decoded lines from a byte stream, one chunk in memory at a time."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    try:
+        async for chunk in chunks:
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line.rstrip("\r")
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Body is not valid UTF-8")
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def _csv_records(lines):
+    """
+    Rows as {column: value}, header taken from the first record.
+
+    A record ends on a line that leaves its quotes balanced, so quoted
+    values may span lines. Empty cells and absent optional columns
+    become None.
+    """
+    header = None
+    pending, quotes = [], 0
+    row = 0
+
+    async for line in lines:
+        pending.append(line)
+        quotes += line.count('"')
+        if quotes % 2:
+            continue
+        record = "\n".join(pending)
+        pending, quotes = [], 0
+        if not record.strip():
+            continue
+
+        values = next(csv.reader([record]))
+        if header is None:
+            header = [name.strip() for name in values]
+            missing = REQUIRED_COLUMNS - set(header)
+            if missing:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"CSV header is missing columns: {', '.join(sorted(missing))}",
+                )
+            continue
+
+        row += 1
+        if len(values) != len(header):
+            yield row, None, f"expected {len(header)} columns, got {len(values)}"
+            continue
+        fields = dict.fromkeys(OPTIONAL_COLUMNS)
+        fields.update((k, v if v != "" else None) for k, v in zip(header, values))
+        yield row, fields, None
+
+    if pending:
+        yield row + 1, None, "unterminated quoted value"
+
+
+async def _ndjson_records(lines):
+    row = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            fields = json.loads(line)
+        except ValueError as exc:
+            yield row, None, f"invalid JSON: {exc}"
+            continue
+        if not isinstance(fields, dict):
+            yield row, None, "expected a JSON object"
+            continue
+        yield row, fields, None
+
+
+def _validation_messages(exc: ValidationError) -> list[str]:
+    return [
+        f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}"
+        for error in exc.errors()
+    ]
+
+
+# -------------------------------------------------------------------
+# IMPORT
+# -------------------------------------------------------------------
+def _insert_batch(db: Session, batch: list[dict]):
+    # list of parameter sets -> one executemany
+    db.execute(insert(Job), batch)
+
+
+def _commit(db: Session):
+    job_cache.invalidate(db)
+    db.commit()
+    job_search.index.invalidate()
+
+
+async def import_jobs(db: Session, chunks, fmt: str, atomic: bool = False) -> dict:
+    """
+    Validate rows from a CSV / NDJSON byte stream against JobCreate and insert
+    them in executemany batches of JOB_IMPORT_BATCH_SIZE, all in one
+    transaction committed at the end.
+
+    Invalid rows are reported and skipped; with `atomic` any invalid row
+    rolls the whole import back.
+    """
+    records = _csv_records(_lines(chunks)) if fmt == "csv" else _ndjson_records(_lines(chunks))
+    batch: list[dict] = []
+    received = inserted = failed = 0
+    errors = []
+
+    try:
+        async for row, fields, error in records:
+            received += 1
+            if received > settings.JOB_IMPORT_MAX_ROWS:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Import is limited to {settings.JOB_IMPORT_MAX_ROWS} rows",
+                )
+
+            if error is None:
+                try:
+                    batch.append(JobCreate.model_validate(fields).model_dump())
+                except ValidationError as exc:
+                    error = "; ".join(_validation_messages(exc))
+
+            if error is not None:
+                failed += 1
+                if len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append({"row": row, "error": error})
+                continue
+
+            if len(batch) >= settings.JOB_IMPORT_BATCH_SIZE:
+                await run_in_threadpool(_insert_batch, db, batch)
+                inserted += len(batch)
+                batch = []
+
+        if batch:
+            await run_in_threadpool(_insert_batch, db, batch)
+            inserted += len(batch)
+
+        if atomic and failed:
+            await run_in_threadpool(db.rollback)
+            inserted = 0
+        elif inserted:
+            await run_in_threadpool(_commit, db)
+    except Exception:
+        await run_in_threadpool(db.rollback)
+        raise
+
+    return {
+        "received": received,
+        "inserted": inserted,
+        "failed": failed,
+        "errors": errors,
+    }
@@ -0,0 +1,172 @@
+import math
+import re
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+
+from sqlalchemy import case, false
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Session
+
+from app.models.job import Job
+from app.utils.cache import version_stamp
+
+# Searchable columns and their relevance weight
+FIELD_WEIGHTS = {
+    "title": 4.0,
+    "department": 3.0,
+    "required_skills": 2.0,
+    "roles_responsibilities": 1.0,
+}
+
+# Upper bound on ranked ids handed back to SQL by the in-process index
+MAX_RESULTS = 1000
+
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+
+
+def tokenize(text: str | None) -> list[str]:
+    return _TOKEN.findall(text.lower()) if text else []
+
+
+class JobSearchIndex:
+    """
+    In-process inverted index over Job (SQLite / tests fallback).
+
+    Built lazily from the database on first search, tagged with the shared
+    "jobs" VersionStamp it was built at. The job create / update / delete
+    handlers of this worker patch it in place; a write from any worker bumps
+    the stamp, and the next search here rebuilds once it sees the new
+    version (within CACHE_VERSION_CHECK_SECONDS).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._built_version: int | None = None
+        self._postings: dict[str, dict[int, float]] = defaultdict(dict)
+        self._terms_by_job: dict[int, set[str]] = {}
+        self._vocabulary: list[str] = []
+
+    def _index(self, job_id: int, fields: dict):
+        self._unindex(job_id)
+        terms = set()
+        for field, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(fields.get(field)):
+                postings = self._postings[token]
+                postings[job_id] = postings.get(job_id, 0.0) + weight
+                terms.add(token)
+        self._terms_by_job[job_id] = terms
+
+    def _unindex(self, job_id: int):
+        for token in self._terms_by_job.pop(job_id, ()):
+            postings = self._postings[token]
+            postings.pop(job_id, None)
+            if not postings:
+                del self._postings[token]
+
+    def _ensure_built(self, db: Session, version: int):
+        if self._built_version == version:
+            return
+        self._postings.clear()
+        self._terms_by_job.clear()
+        rows = db.query(Job.id, *(getattr(Job, f) for f in FIELD_WEIGHTS)).all()
+        for row in rows:
+            self._index(row.id, row._asdict())
+        self._vocabulary = sorted(self._postings)
+        self._built_version = version
+
+    def add(self, job: Job):
+        self.add_many([job])
+
+    def add_many(self, jobs):
+        with self._lock:
+            if self._built_version is not None:
+                for job in jobs:
+                    self._index(job.id, {f: getattr(job, f) for f in FIELD_WEIGHTS})
+                self._vocabulary = sorted(self._postings)
+
+    def remove(self, job_ids):
+        with self._lock:
+            if self._built_version is not None:
+                for job_id in job_ids:
+                    self._unindex(job_id)
+                self._vocabulary = sorted(self._postings)
+
+    def clear(self):
+        with self._lock:
+            self._postings.clear()
+            self._terms_by_job.clear()
+            self._vocabulary = []
+
+    def invalidate(self):
+        """Drop everything; rebuilt from the database on the next search."""
+        with self._lock:
+            self._postings.clear()
+            self._terms_by_job.clear()
+            self._vocabulary = []
+            self._built_version = None
+
+    def _expand(self, token: str) -> list[str]:
+        """All indexed terms starting with `token` (search-as-you-type)."""
+        start = bisect_left(self._vocabulary, token)
+        terms = []
+        for term in self._vocabulary[start:]:
+            if not term.startswith(token):
+                break
+            terms.append(term)
+        return terms
+
+    def search(self, db: Session, q: str) -> list[int]:
+        """Job ids ranked by weighted tf-idf relevance to `q`."""
+        version = _jobs_version.current(db)
+        with self._lock:
+            self._ensure_built(db, version)
+            total = max(len(self._terms_by_job), 1)
+            scores: dict[int, float] = defaultdict(float)
+
+            for token in set(tokenize(q)):
+                for term in self._expand(token):
+                    postings = self._postings[term]
+                    idf = math.log(1 + total / len(postings))
+                    for job_id, weight in postings.items():
+                        scores[job_id] += weight * idf
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], -item[0]))
+        return [job_id for job_id, _ in ranked[:MAX_RESULTS]]
+
+
+_jobs_version = version_stamp("jobs")
+
+index = JobSearchIndex()
+
+
+def _boolean_query(q: str) -> str:
+    # prefix-match every term; operators (+ - etc.) are stripped so ranking
+    # stays relevance-based and user input cannot change the query syntax
+    words = (re.sub(r"[^a-z0-9]", "", token) for token in tokenize(q))
+    return " ".join(f"{word}*" for word in words if word)
+
+
+def apply_search(db: Session, query, q: str):
+    """
+    Filter a Job query down to matches for `q`, ordered by relevance.
+
+    MySQL uses the ft_jobs_search FULLTEXT index; other databases use the
+    in-process inverted index.
+    """
+    if not tokenize(q):
+        return query
+
+    if db.get_bind().dialect.name == "mysql":
+        relevance = match(
+            *(getattr(Job, f) for f in FIELD_WEIGHTS),
+            against=_boolean_query(q),
+        ).in_boolean_mode()
+        return query.filter(relevance > 0).order_by(relevance.desc(), Job.id.desc())
+
+    job_ids = index.search(db, q)
+    if not job_ids:
+        return query.filter(false())
+
+    rank = case({job_id: pos for pos, job_id in enumerate(job_ids)}, value=Job.id)
+    return query.filter(Job.id.in_(job_ids)).order_by(rank)
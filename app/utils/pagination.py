@@ -0,0 +1,121 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy import String, and_, literal, or_
+
+
+# -------------------------------------------------------------------
+# OPAQUE CURSORS
+# -------------------------------------------------------------------
+def encode_cursor(payload: dict) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return payload
+
+
+# -------------------------------------------------------------------
+# KEYSET (created_at DESC, id DESC)
+# -------------------------------------------------------------------
+def _row_cursor(row, direction: str) -> str:
+    return encode_cursor({"c": row.created_at.isoformat(), "i": row.id, "d": direction})
+
+
+def keyset(query, model, cursor: str | None, limit: int):
+    """
+    Newest-first keyset pagination on (created_at, id).
+
+    Works on both a legacy Query and a 2.0 select(). Fetches limit + 1 rows
+    so keyset_page() can tell whether another page exists. Returns the
+    paginated query and the decoded cursor (or None).
+    """
+    token = decode_cursor(cursor) if cursor else None
+    created, pk = model.created_at, model.id
+
+    if token:
+        try:
+            c, i = datetime.fromisoformat(token["c"]), int(token["i"])
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        # Bound as text in the server's own format: SQLite stores
+        # CURRENT_TIMESTAMP without microseconds and compares as strings,
+        # MySQL converts the constant to DATETIME once (index still used)
+        c = literal(c.isoformat(sep=" "), String)
+
+        # the redundant created >= c / <= c lets the planner seek the
+        # (created_at, id) index instead of walking it down to the cursor
+        if token.get("d") == "prev":
+            query = query.where(created >= c, or_(created > c, and_(created == c, pk > i)))
+        else:
+            query = query.where(created <= c, or_(created < c, and_(created == c, pk < i)))
+
+    if token and token.get("d") == "prev":
+        query = query.order_by(created.asc(), pk.asc())
+    else:
+        query = query.order_by(created.desc(), pk.desc())
+
+    return query.limit(limit + 1), token
+
+
+def keyset_page(rows, token: dict | None, limit: int):
+    """Trim the extra row and build (rows, next_cursor, prev_cursor)."""
+    rows = list(rows)
+    more = len(rows) > limit
+    rows = rows[:limit]
+    backwards = bool(token and token.get("d") == "prev")
+
+    if backwards:
+        rows.reverse()
+        has_next, has_prev = True, more
+    else:
+        has_next, has_prev = more, token is not None
+
+    if not rows:
+        return rows, None, None
+
+    next_cursor = _row_cursor(rows[-1], "next") if has_next else None
+    prev_cursor = _row_cursor(rows[0], "prev") if has_prev else None
+    return rows, next_cursor, prev_cursor
+
+
+# -------------------------------------------------------------------
+# OFFSET CURSORS (relevance-ranked results have no stable keyset)
+# -------------------------------------------------------------------
+def offset_from_cursor(cursor: str | None) -> int:
+    if not cursor:
+        return 0
+    try:
+        return max(int(decode_cursor(cursor)["o"]), 0)
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def offset_page(rows, offset: int, limit: int):
+    rows = list(rows)
+    more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor({"o": offset + limit}) if more else None
+    prev_cursor = encode_cursor({"o": max(offset - limit, 0)}) if offset > 0 else None
+    return rows, next_cursor, prev_cursor
+
+
+def set_cursor_headers(response, next_cursor, prev_cursor, total=None):
+    """For endpoints whose body is a bare list."""
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    if prev_cursor:
+        response.headers["X-Prev-Cursor"] = prev_cursor
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
@@ -0,0 +1,86 @@
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolStats:
+    """Cumulative connection-pool counters for one engine."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.disconnects = 0
+        self.invalidations = 0
+        self.wait_count = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _incr(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def record_wait(self, seconds: float):
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def listen(self, engine):
+        """Register pool event hooks on a (sync) Engine."""
+        event.listen(engine, "checkout", lambda *a: self._incr("checkouts"))
+        event.listen(engine, "checkin", lambda *a: self._incr("checkins"))
+        event.listen(engine, "connect", lambda *a: self._incr("connects"))
+        event.listen(engine, "close", lambda *a: self._incr("disconnects"))
+        event.listen(engine, "close_detached", lambda *a: self._incr("disconnects"))
+        event.listen(engine, "invalidate", lambda *a: self._incr("invalidations"))
+
+    def snapshot(self, pool) -> dict:
+        with self._lock:
+            wait_avg = self.wait_total / self.wait_count if self.wait_count else 0.0
+            return {
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                # connection churn: physical connections opened / closed
+                "connects": self.connects,
+                "disconnects": self.disconnects,
+                "invalidations": self.invalidations,
+                "wait_ms_avg": round(wait_avg * 1000, 3),
+                "wait_ms_max": round(self.wait_max * 1000, 3),
+                "wait_ms_total": round(self.wait_total * 1000, 3),
+            }
+
+
+class _TimedCheckoutMixin:
+    """Times every pool checkout; the PoolStats survive engine.dispose()."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            self.stats.record_wait(time.perf_counter() - start)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
@@ -0,0 +1,45 @@
+import time
+
+from fastapi import Request
+
+from app.config import settings
+
+# Expiry timestamp (epoch seconds) of the client's read-your-writes window
+PRIMARY_STICKY_COOKIE = "db_primary_until"
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def prefers_primary(request: Request) -> bool:
+    """True while the client is inside its read-your-writes window."""
+    value = request.cookies.get(PRIMARY_STICKY_COOKIE)
+    if not value:
+        return False
+    try:
+        return float(value) > time.time()
+    except ValueError:
+        return False
+
+
+async def read_your_writes(request: Request, call_next):
+    """
+    After a successful admin mutation, pin the client's reads to the
+    primary for REPLICA_STICKY_SECONDS so it never sees replica lag.
+    """
+    response = await call_next(request)
+
+    if (
+        settings.REPLICA_DATABASE_URL
+        and request.method not in SAFE_METHODS
+        and response.status_code < 400
+        and "authorization" in request.headers
+    ):
+        ttl = settings.REPLICA_STICKY_SECONDS
+        response.set_cookie(
+            PRIMARY_STICKY_COOKIE,
+            str(int(time.time()) + ttl),
+            max_age=ttl,
+            httponly=True,
+            samesite="lax",
+        )
+    return response
@@ -0,0 +1,91 @@
+import hashlib
+import json
+
+from sqlalchemy import (
+    Column, DateTime, MetaData, String, Table, UniqueConstraint,
+    delete, func, insert, select,
+)
+from sqlalchemy.exc import SQLAlchemyError
+
+# Kept out of Base.metadata: it is bookkeeping, not part of the fingerprint
+fingerprint_metadata = MetaData()
+
+schema_fingerprint = Table(
+    "schema_fingerprint",
+    fingerprint_metadata,
+    Column("fingerprint", String(64), primary_key=True),
+    Column("updated_at", DateTime, server_default=func.now()),
+)
+
+
+class SchemaDriftError(RuntimeError):
+    pass
+
+
+def compute_fingerprint(metadata) -> str:
+    """SHA-256 over the tables, columns, indexes and constraints in `metadata`."""
+    tables = []
+    for table in sorted(metadata.tables.values(), key=lambda t: t.name):
+        tables.append({
+            "name": table.name,
+            "columns": [
+                [
+                    col.name,
+                    repr(col.type),
+                    col.nullable,
+                    col.primary_key,
+                    str(getattr(col.server_default, "arg", None)),
+                    sorted(fk.target_fullname for fk in col.foreign_keys),
+                ]
+                for col in table.columns
+            ],
+            "indexes": sorted(
+                [idx.name, idx.unique, [str(c) for c in idx.expressions]]
+                for idx in table.indexes
+            ),
+            "unique": sorted(
+                sorted(c.name for c in uc.columns)
+                for uc in table.constraints
+                if isinstance(uc, UniqueConstraint)
+            ),
+        })
+    payload = json.dumps(tables, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def store_fingerprint(connection, metadata):
+    """Record the models' fingerprint; called by alembic after migrating to head."""
+    clear_fingerprint(connection)
+    connection.execute(
+        insert(schema_fingerprint).values(fingerprint=compute_fingerprint(metadata))
+    )
+
+
+def clear_fingerprint(connection):
+    """
+    Forget the stored fingerprint; called by alembic after migrating to any
+    revision other than head, whose schema the models do not describe.
+    """
+    fingerprint_metadata.create_all(bind=connection, checkfirst=True)
+    connection.execute(delete(schema_fingerprint))
+
+
+def verify_fingerprint(engine, metadata):
+    """
+    One primary-key read instead of reflecting every table.
+    Raises SchemaDriftError when the database was migrated for other models.
+    """
+    expected = compute_fingerprint(metadata)
+    try:
+        with engine.connect() as conn:
+            stored = conn.execute(select(schema_fingerprint.c.fingerprint)).scalars().all()
+    except SQLAlchemyError as exc:
+        raise SchemaDriftError(
+            "No schema fingerprint found; run `alembic upgrade head`"
+        ) from exc
+
+    if stored != [expected]:
+        raise SchemaDriftError(
+            f"Schema drift: database fingerprint {stored[:1]} does not match "
+            f"models ({expected}); run `alembic upgrade head`"
+        )
@@ -0,0 +1,78 @@
+"""
+Sparse fieldsets for admin listings: `?fields=id,full_name,status`.
+
+Only the requested columns are loaded (load_only) and only the requested
+fields are validated and serialized, through a partial copy of the
+endpoint's response schema built once per field set.
+"""
+from functools import lru_cache
+from typing import List
+
+from fastapi import HTTPException
+from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only
+
+FIELDS_DESCRIPTION = "Comma-separated response fields to return (default: all), e.g. 'id,full_name,status'"
+
+
+def parse_fields(fields: str | None, schema: type[BaseModel]) -> tuple[str, ...] | None:
+    """Requested field names, validated against `schema`; None means every field."""
+    if fields is None:
+        return None
+    names = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [name for name in names if name not in schema.model_fields]
+    if unknown or not names:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown) or '(none given)'}",
+        )
+    if "id" in schema.model_fields and "id" not in names:
+        names.insert(0, "id")
+    return tuple(names)
+
+
+def columns(model, names, always=("id", "created_at")) -> list:
+    """
+    load_only() option for `names`, plus the columns the listing itself
+    needs (pagination keys); relationship names are left to the caller.
+    """
+    mapper = inspect(model)
+    wanted = [n for n in dict.fromkeys((*always, *names)) if n in mapper.column_attrs]
+    return [load_only(*(getattr(model, name) for name in wanted))]
+
+
+def relationships(model, names) -> list[str]:
+    mapper = inspect(model)
+    return [name for name in names if name in mapper.relationships]
+
+
+@lru_cache(maxsize=256)
+def partial_model(schema: type[BaseModel], names: tuple[str, ...]) -> type[BaseModel]:
+    """`schema` cut down to `names`, same types and defaults, no validators."""
+    fields = {name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in names}
+    return create_model(
+        f"{schema.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **fields,
+    )
+
+
+@lru_cache(maxsize=256)
+def _list_adapter(schema: type[BaseModel], names: tuple[str, ...]) -> TypeAdapter:
+    return TypeAdapter(List[partial_model(schema, names)])
+
+
+def validate(rows, schema: type[BaseModel], names: tuple[str, ...]) -> list[BaseModel]:
+    return _list_adapter(schema, names).validate_python(list(rows), from_attributes=True)
+
+
+def json_response(rows, schema: type[BaseModel], names: tuple[str, ...]) -> Response:
+    """
+    JSON array of the projected rows. Returned directly, so FastAPI's
+    response_model (the full schema) is not applied to it.
+    """
+    adapter = _list_adapter(schema, names)
+    body = adapter.dump_json(adapter.validate_python(list(rows), from_attributes=True))
+    return Response(content=body, media_type="application/json")
@@ -0,0 +1,98 @@
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from fastapi import Request
+from sqlalchemy import event
+
+from app.config import settings
+
+logger = logging.getLogger("app.sql")
+
+# Collapse literals and IN-lists so "same query, different ids" share a shape
+_IN_LIST = re.compile(r"\(\s*(?:\?|%s|:\w+)(?:\s*,\s*(?:\?|%s|:\w+))*\s*\)")
+_LITERAL = re.compile(r"'[^']*'|\b\d+\b")
+_SPACES = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    shape = _LITERAL.sub("?", statement)
+    shape = _IN_LIST.sub("(?)", shape)
+    return _SPACES.sub(" ", shape).strip()
+
+
+class RequestQueries:
+    """SQL statements issued while serving one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+
+    def record(self, statement: str, seconds: float, executemany: bool = False):
+        self.count += 1
+        self.duration += seconds
+        # executemany batches are already set-based, not an N+1
+        if not executemany:
+            self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        return [(s, n) for s, n in self.shapes.most_common() if n >= threshold]
+
+
+_current: ContextVar[RequestQueries | None] = ContextVar("sql_request_queries", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = conn.info["query_start_time"].pop()
+    queries = _current.get()
+    if queries is not None:
+        queries.record(statement, time.perf_counter() - start, executemany)
+
+
+def instrument(engine):
+    """Count and time every statement on a (sync) Engine."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+async def sql_timing(request: Request, call_next):
+    """
+    Adds a Server-Timing header with the request's query count and DB time,
+    and logs requests that repeat one statement shape SQL_REPEAT_THRESHOLD
+    times or more (the N+1 pattern).
+    """
+    queries = RequestQueries()
+    token = _current.set(queries)
+    start = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        _current.reset(token)
+    total_ms = (time.perf_counter() - start) * 1000
+    db_ms = queries.duration * 1000
+
+    response.headers["Server-Timing"] = (
+        f'db;dur={db_ms:.1f};desc="{queries.count} queries", app;dur={total_ms:.1f}'
+    )
+
+    repeated = queries.repeated(settings.SQL_REPEAT_THRESHOLD)
+    if repeated:
+        logger.warning(json.dumps({
+            "event": "sql_repeated_statement",
+            "method": request.method,
+            "path": request.url.path,
+            "route": getattr(request.scope.get("route"), "path", None),
+            "status": response.status_code,
+            "queries": queries.count,
+            "db_ms": round(db_ms, 2),
+            "repeated": [{"shape": s, "count": n} for s, n in repeated],
+        }))
+    return response
@@ -0,0 +1,114 @@
+from collections import Counter
+
+from sqlalchemy import and_, case, delete, func, insert, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.application_status_count import ApplicationStatusCount
+from app.models.jobapplication import Application
+
+# All-jobs totals are spread over this many rows (job_ids -1 .. -N, picked
+# by job) and summed on read: a single shared row would serialize every
+# application write across all jobs
+ALL_JOBS_SHARDS = 16
+
+# Named buckets of the dashboard stats
+DASHBOARD_STATUSES = ("pending", "shortlisted", "maybe", "rejected")
+
+
+def all_jobs_shard(job_id: int) -> int:
+    """job_id of the all-jobs row that `job_id`'s applications count towards."""
+    return -1 - job_id % ALL_JOBS_SHARDS
+
+
+async def bump_rows(db: AsyncSession, model, key_names: tuple[str, ...], deltas: dict[tuple, dict[str, int]]):
+    """
+    Add {key: {column: +n / -n}} to the counter rows of `model` keyed by
+    `key_names`, within db's transaction, inserting the rows that do not
+    exist yet. One UPDATE ... SET column = column + CASE ... END covers
+    every key; only when some rows are new does it take one SELECT and one
+    multi-row INSERT more, however many keys there are.
+    """
+    deltas = {key: values for key, values in deltas.items() if any(values.values())}
+    if not deltas:
+        return
+    keys = sorted(deltas)
+    key_columns = tuple_(*(getattr(model, name) for name in key_names))
+    value_names = sorted({name for values in deltas.values() for name in values})
+
+    changes = {}
+    for name in value_names:
+        whens = [
+            (and_(*(getattr(model, k) == v for k, v in zip(key_names, key))), deltas[key][name])
+            for key in keys if deltas[key].get(name)
+        ]
+        if whens:
+            changes[name] = getattr(model, name) + case(*whens, else_=0)
+    bumped = await db.execute(update(model).where(key_columns.in_(keys)).values(**changes))
+    if bumped.rowcount == len(keys):
+        return
+
+    existing = set((await db.execute(select(*key_columns.clauses).where(key_columns.in_(keys)))).tuples())
+    missing = {key: deltas[key] for key in keys if key not in existing}
+    try:
+        async with db.begin_nested():
+            await db.execute(
+                insert(model),
+                [
+                    {**dict(zip(key_names, key)), **{name: values.get(name, 0) for name in value_names}}
+                    for key, values in missing.items()
+                ],
+            )
+    except IntegrityError:
+        # another transaction inserted some of them first: their rows take an UPDATE now
+        await bump_rows(db, model, key_names, missing)
+
+
+async def adjust(db: AsyncSession, deltas: Counter):
+    """
+    Apply {(job_id, status): +n / -n} within db's transaction, to the job's
+    row and to its all-jobs shard. Call it in the same transaction as the
+    application insert / status change / delete it accounts for.
+    """
+    merged: Counter = Counter()
+    for (job_id, status), n in deltas.items():
+        merged[(job_id, status)] += n
+        merged[(all_jobs_shard(job_id), status)] += n
+    await bump_rows(
+        db, ApplicationStatusCount, ("job_id", "status"), {key: {"count": n} for key, n in merged.items()}
+    )
+
+
+async def counts(db: AsyncSession, job_id: int | None = None) -> dict[str, int]:
+    """{status: applications} for one job, or all jobs summed over the shards: primary-key range reads."""
+    rows = await db.execute(
+        select(ApplicationStatusCount.status, func.sum(ApplicationStatusCount.count))
+        .where(ApplicationStatusCount.job_id == job_id if job_id else ApplicationStatusCount.job_id < 0)
+        .group_by(ApplicationStatusCount.status)
+    )
+    return {status: int(n) for status, n in rows.all() if n}
+
+
+def dashboard(by_status: dict[str, int]) -> dict:
+    lowered: Counter = Counter()
+    for status, n in by_status.items():
+        lowered[status.lower()] += n
+    return {
+        "total": sum(by_status.values()),
+        **{name: lowered[name] for name in DASHBOARD_STATUSES},
+        "by_status": by_status,
+    }
+
+
+async def rebuild(db: AsyncSession):
+    """Recount from job_applications (backfill or repair)."""
+    status = func.coalesce(Application.status, "Pending")
+    rows = (
+        await db.execute(
+            select(Application.job_id, status, func.count()).group_by(Application.job_id, status)
+        )
+    ).all()
+    deltas = Counter({(job_id, s): n for job_id, s, n in rows})
+
+    await db.execute(delete(ApplicationStatusCount))
+    await adjust(db, deltas)
@@ -0,0 +1,284 @@
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import socket
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import and_, or_, select, update
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.jobapplication import Application
+from app.models.task_queue import QueuedTask
+from app.utils import application_search, document_tasks
+
+logger = logging.getLogger("app.tasks")
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# -------------------------------------------------------------------
+# PRODUCERS (run inside the caller's transaction)
+# -------------------------------------------------------------------
+def enqueue(db, kind: str, application_id: int | None = None, **payload) -> QueuedTask:
+    task = QueuedTask(
+        kind=kind,
+        application_id=application_id,
+        payload=json.dumps(payload),
+        status="queued",
+        attempts=0,
+        run_after=utcnow(),
+    )
+    db.add(task)
+    return task
+
+
+def enqueue_document_tasks(db, application: Application):
+    """Thumbnail, resume text and PAN check for a flushed application."""
+    application.processing_status = "pending"
+    enqueue(db, "photo_thumbnail", application.id, path=application.photo_file)
+    enqueue(db, "resume_text", application.id, path=application.resume_file)
+    enqueue(
+        db, "pan_card_check", application.id,
+        path=application.pan_card_file, pan_number=application.pan_number,
+    )
+
+
+# -------------------------------------------------------------------
+# RESULTS (copied onto the application by the parent process)
+# -------------------------------------------------------------------
+async def _set_thumbnail(db, application, result):
+    application.photo_thumbnail_file = result["thumbnail"]
+
+
+async def _set_resume_text(db, application, result):
+    application.resume_text = result["text"]
+    # resume terms join the application's search postings
+    await application_search.index_application(db, application)
+
+
+async def _set_pan_card_valid(db, application, result):
+    application.pan_card_valid = result["valid"]
+
+
+RESULT_HANDLERS = {
+    "photo_thumbnail": _set_thumbnail,
+    "resume_text": _set_resume_text,
+    "pan_card_check": _set_pan_card_valid,
+}
+
+
+def processing_status(statuses) -> str:
+    statuses = set(statuses)
+    if not statuses or statuses == {"queued"}:
+        return "pending"
+    if statuses <= {"done"}:
+        return "done"
+    if statuses <= {"done", "failed"}:
+        return "failed"
+    return "processing"
+
+
+async def refresh_processing_status(db, application_id: int):
+    statuses = (
+        await db.execute(
+            select(QueuedTask.status).where(QueuedTask.application_id == application_id)
+        )
+    ).scalars().all()
+    await db.execute(
+        update(Application)
+        .where(Application.id == application_id)
+        .values(processing_status=processing_status(statuses))
+    )
+
+
+# -------------------------------------------------------------------
+# WORKER
+# -------------------------------------------------------------------
+class TaskWorker:
+    """
+    Polls task_queue and runs due tasks in a process pool, so CPU-heavy
+    document work never runs in the uvicorn worker itself.
+
+    Tasks are claimed with a conditional UPDATE, so several app processes
+    (or hosts) can poll the same table. A claim is a lease: a task left
+    'running' for TASK_LEASE_SECONDS (its worker crashed or was stopped)
+    is claimed again. Failures retry with exponential backoff up to
+    TASK_MAX_ATTEMPTS; document_tasks.PermanentError fails at once.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self._pool = None
+        self._poller = None
+        self._stopping = None
+        self._running: set[asyncio.Task] = set()
+
+    def start(self):
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self._pool = self._new_pool()
+        self._stopping = asyncio.Event()
+        self._poller = asyncio.get_running_loop().create_task(self._poll())
+
+    async def stop(self):
+        """In-flight tasks are abandoned; their leases expire and they rerun."""
+        if self._poller is None:
+            return
+        self._stopping.set()
+        await self._poller
+        for task in list(self._running):
+            task.cancel()
+        await asyncio.gather(*self._running, return_exceptions=True)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._poller = None
+
+    def _new_pool(self):
+        # spawn: children import only document_tasks, not the app's engines
+        return ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def stats(self) -> dict:
+        return {"name": self.name, "workers": self.workers, "running": len(self._running)}
+
+    async def _poll(self):
+        while not self._stopping.is_set():
+            free = self.workers - len(self._running)
+            if free > 0:
+                try:
+                    claimed = await self._claim(free)
+                except Exception:
+                    # whatever went wrong, keep polling: queued tasks would never run
+                    logger.exception("task_queue poll failed")
+                    claimed = []
+                for task_id in claimed:
+                    task = asyncio.create_task(self._run(task_id))
+                    self._running.add(task)
+                    task.add_done_callback(self._running.discard)
+            try:
+                await asyncio.wait_for(self._stopping.wait(), settings.TASK_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _claim(self, limit: int) -> list[int]:
+        now = utcnow()
+        due = or_(
+            and_(QueuedTask.status == "queued", QueuedTask.run_after <= now),
+            and_(
+                QueuedTask.status == "running",
+                QueuedTask.locked_at < now - timedelta(seconds=settings.TASK_LEASE_SECONDS),
+            ),
+        )
+        async with AsyncSessionLocal() as db:
+            candidates = (
+                await db.execute(
+                    select(QueuedTask.id)
+                    .where(due)
+                    .order_by(QueuedTask.run_after, QueuedTask.id)
+                    .limit(limit)
+                )
+            ).scalars().all()
+
+            claimed = []
+            for task_id in candidates:
+                # loses harmlessly if another worker claimed it first
+                result = await db.execute(
+                    update(QueuedTask)
+                    .where(QueuedTask.id == task_id, due)
+                    .values(
+                        status="running",
+                        locked_by=self.name,
+                        locked_at=now,
+                        attempts=QueuedTask.attempts + 1,
+                    )
+                )
+                if result.rowcount:
+                    claimed.append(task_id)
+
+            if claimed:
+                await db.execute(
+                    update(Application)
+                    .where(
+                        Application.id.in_(
+                            select(QueuedTask.application_id).where(QueuedTask.id.in_(claimed))
+                        ),
+                        Application.processing_status == "pending",
+                    )
+                    .values(processing_status="processing")
+                )
+            await db.commit()
+        return claimed
+
+    async def _run(self, task_id: int):
+        async with AsyncSessionLocal() as db:
+            task = await db.get(QueuedTask, task_id)
+            kind, payload, attempts = task.kind, json.loads(task.payload or "{}"), task.attempts
+
+        result = error = None
+        permanent = False
+        if attempts > settings.TASK_MAX_ATTEMPTS:
+            error, permanent = "lease expired on every attempt", True
+        else:
+            try:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._pool, document_tasks.run, kind, payload
+                )
+            except document_tasks.PermanentError as exc:
+                error, permanent = str(exc), True
+            except BrokenProcessPool:
+                # a child died (e.g. OOM on a hostile file): fresh pool, retry
+                self._pool = self._new_pool()
+                error = "worker process died"
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+
+        try:
+            await self._finish(task_id, result, error, permanent)
+        except Exception:
+            # the lease expires and the task runs again
+            logger.exception("task_queue could not record task %s", task_id)
+
+    async def _finish(self, task_id: int, result, error, permanent: bool):
+        async with AsyncSessionLocal() as db:
+            task = await db.get(QueuedTask, task_id)
+            if task is None or task.status != "running" or task.locked_by != self.name:
+                return  # lease lost to another worker
+
+            task.locked_by = task.locked_at = None
+            if error is None:
+                task.status, task.result, task.last_error = "done", json.dumps(result), None
+                application = await db.get(Application, task.application_id) if task.application_id else None
+                if application is not None:
+                    await RESULT_HANDLERS[task.kind](db, application, result)
+            elif permanent or task.attempts >= settings.TASK_MAX_ATTEMPTS:
+                task.status, task.last_error = "failed", error
+            else:
+                delay = settings.TASK_RETRY_BASE_SECONDS * 2 ** (task.attempts - 1)
+                task.status, task.last_error = "queued", error
+                task.run_after = utcnow() + timedelta(seconds=delay)
+
+            if error is not None:
+                logger.warning(json.dumps({
+                    "event": "task_failed",
+                    "task_id": task_id,
+                    "kind": task.kind,
+                    "application_id": task.application_id,
+                    "attempts": task.attempts,
+                    "status": task.status,
+                    "error": error,
+                }))
+
+            await db.flush()
+            if task.application_id:
+                await refresh_processing_status(db, task.application_id)
+            await db.commit()
+
+
+worker = TaskWorker(settings.TASK_WORKERS)
@@ -0,0 +1,125 @@
+"""
+Analytics benchmark: ad-hoc GROUP BY over job_applications vs the daily
+rollups (app/utils/application_rollups.py).
+
+For each size in --sizes, grows a SQLite file to that many applications
+(over 200 jobs and the last two years), rebuilds the rollups, then times
+the same report --repeat times both ways:
+
+  group by: applications per day and status over the range, straight from
+            job_applications (uses ix_job_applications_created)
+  rollups:  application_rollups.report(), what GET /admin/applications/analytics runs
+
+Reports the median, for all jobs and for one job, at day granularity over
+the last 90 days and month granularity over the last year.
+
+Run from the repo root:
+    python -m scripts.bench_analytics --sizes 100000,1000000
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "vf_bench_analytics.sqlite")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{DB_PATH}")
+os.environ.setdefault("SECRET_KEY", "bench")
+os.environ.setdefault("SMTP_HOST", "localhost")
+os.environ.setdefault("SMTP_PORT", "25")
+os.environ.setdefault("SMTP_EMAIL", "bench@example.com")
+os.environ.setdefault("SMTP_PASSWORD", "bench")
+os.environ.setdefault("DB_ECHO", "false")
+
+from sqlalchemy import func, insert, select
+
+from app.database import AsyncSessionLocal, Base, async_engine, engine
+from app.models.jobapplication import Application
+from app.utils import application_rollups
+
+STATUSES = ("Pending", "Shortlisted", "Maybe", "Rejected")
+JOBS = 200
+HISTORY_DAYS = 730
+
+
+def grow(rows: int):
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        have = conn.execute(select(func.count(Application.id))).scalar_one()
+        now = datetime.utcnow()
+        for start in range(have, rows, 50_000):
+            conn.execute(insert(Application), [
+                {
+                    "job_id": 1 + i % JOBS, "first_name": "A", "last_name": f"{i}", "full_name": f"A {i}",
+                    "status": STATUSES[(i * 7) % 4],
+                    "created_at": now - timedelta(minutes=(i * 7919) % (HISTORY_DAYS * 1440)),
+                }
+                for i in range(start, min(start + 50_000, rows))
+            ])
+        application_rollups.rebuild(conn)
+
+
+async def group_by(db, start: date, end: date, granularity: str, job_id):
+    day = func.date(Application.created_at)
+    query = (
+        select(day, Application.status, func.count())
+        .where(Application.created_at >= start, Application.created_at < end + timedelta(days=1))
+        .group_by(day, Application.status)
+    )
+    if job_id:
+        query = query.where(Application.job_id == job_id)
+    rows = (await db.execute(query)).all()
+    buckets = {}
+    for d, status, n in rows:
+        bucket = application_rollups.bucket_start(date.fromisoformat(d), granularity)
+        buckets.setdefault(bucket, {}).setdefault(status, 0)
+        buckets[bucket][status] += n
+    return buckets
+
+
+async def median_ms(fn, repeat: int) -> float:
+    timings = []
+    async with AsyncSessionLocal() as db:
+        await fn(db)  # warm up
+        for _ in range(repeat):
+            start = time.perf_counter()
+            await fn(db)
+            timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+async def measure(repeat: int):
+    today = date.today()
+    cases = [
+        ("day, 90 days, all jobs", today - timedelta(days=89), "day", None),
+        ("day, 90 days, one job", today - timedelta(days=89), "day", 17),
+        ("month, 1 year, all jobs", today - timedelta(days=364), "month", None),
+    ]
+    results = []
+    for label, start, granularity, job_id in cases:
+        before = await median_ms(lambda db: group_by(db, start, today, granularity, job_id), repeat)
+        after = await median_ms(
+            lambda db: application_rollups.report(db, start, today, granularity, job_id), repeat
+        )
+        results.append((label, before, after))
+    return results
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="100000,1000000")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'applications':>12}  {'report':<26} {'group by':>10} {'rollups':>10}")
+    for size in map(int, args.sizes.split(",")):
+        grow(size)
+        for label, before, after in await measure(args.repeat):
+            print(f"{size:>12}  {label:<26} {before:8.1f}ms {after:8.2f}ms")
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,117 @@
+"""
+Concurrent latency benchmark: sync Session vs AsyncSession inside `async def` routes.
+
+Fires N concurrent requests at two otherwise identical handlers. Each handler
+runs one query that takes --query-ms on the database side (a SQLite `sleep()`
+UDF standing in for a slow MySQL round-trip).
+
+  before: async def handler + sync Session (old jobapplication.py pattern),
+          the query blocks the event loop so requests are served one by one
+  after:  async def handler + AsyncSession (get_async_db)
+
+Keep --requests at or below pool_size + max_overflow (15 by default): past
+that the "before" handler blocks the loop on pool checkout while the
+connections it waits for can only be returned by the loop, so it stalls until
+pool_timeout.
+
+Run from the repo root (needs httpx):
+    python -m scripts.bench_async_db --requests 15 --query-ms 20
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+DB_FILE = os.path.join(tempfile.gettempdir(), "vf_bench_async_db.sqlite")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{DB_FILE}")
+os.environ.setdefault("SECRET_KEY", "bench")
+os.environ.setdefault("SMTP_HOST", "localhost")
+os.environ.setdefault("SMTP_PORT", "25")
+os.environ.setdefault("SMTP_EMAIL", "bench@example.com")
+os.environ.setdefault("SMTP_PASSWORD", "bench")
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database import async_engine, engine, get_async_db, get_db
+
+
+def _sleep_ms(ms):
+    time.sleep(ms / 1000)
+    return ms
+
+
+@event.listens_for(engine, "connect")
+def _register_sleep(dbapi_connection, connection_record):
+    dbapi_connection.create_function("sleep", 1, _sleep_ms)
+
+
+@event.listens_for(async_engine.sync_engine, "connect")
+def _register_async_sleep(dbapi_connection, connection_record):
+    dbapi_connection.run_async(
+        lambda conn: conn.create_function("sleep", 1, _sleep_ms)
+    )
+
+
+engine.echo = False
+async_engine.sync_engine.echo = False
+
+bench_app = FastAPI()
+QUERY = text("SELECT sleep(:ms)")
+
+
+@bench_app.get("/sync")
+async def sync_session_route(ms: int, db: Session = Depends(get_db)):
+    return {"slept": db.execute(QUERY, {"ms": ms}).scalar()}
+
+
+@bench_app.get("/async")
+async def async_session_route(ms: int, db: AsyncSession = Depends(get_async_db)):
+    return {"slept": (await db.execute(QUERY, {"ms": ms})).scalar()}
+
+
+async def run(path: str, requests: int, query_ms: int) -> dict:
+    transport = httpx.ASGITransport(app=bench_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one():
+            start = time.perf_counter()
+            response = await client.get(path, params={"ms": query_ms})
+            response.raise_for_status()
+            return (time.perf_counter() - start) * 1000
+
+        await one()  # warm the pool
+        wall = time.perf_counter()
+        latencies = sorted(await asyncio.gather(*(one() for _ in range(requests))))
+        wall = (time.perf_counter() - wall) * 1000
+
+    return {
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "wall": wall,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=15)
+    parser.add_argument("--query-ms", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{args.requests} concurrent requests, {args.query_ms} ms per query")
+    for label, path in (("sync Session (before)", "/sync"), ("AsyncSession (after)", "/async")):
+        r = await run(path, args.requests, args.query_ms)
+        print(
+            f"{label:<24} p50={r['p50']:8.1f} ms  p99={r['p99']:8.1f} ms  "
+            f"wall={r['wall']:8.1f} ms"
+        )
+
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,191 @@
+"""
+Export benchmark: peak server memory while exporting every application.
+
+Seeds --rows applications into a SQLite file (once; reused on later runs),
+then starts a uvicorn server per case (a separate process, so its memory
+can be measured) and downloads the whole export:
+
+  before: select(Application) ... .all(), every row validated through
+          ApplicationResponse and written to one in-memory CSV (what a
+          non-streaming export endpoint would do)
+  csv:    GET /admin/applications/export (server-side cursor, yield_per)
+  xlsx:   GET /admin/applications/export?format=xlsx
+
+Reports time to first byte, total time, bytes sent and the server's peak
+RSS (VmHWM) against its RSS before the request.
+
+Run from the repo root (Linux, needs httpx and uvicorn):
+    python -m scripts.bench_export --rows 500000
+"""
+import argparse
+import asyncio
+import csv
+import io
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "vf_bench_export.sqlite")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{DB_PATH}")
+os.environ.setdefault("SECRET_KEY", "bench")
+os.environ.setdefault("SMTP_HOST", "localhost")
+os.environ.setdefault("SMTP_PORT", "25")
+os.environ.setdefault("SMTP_EMAIL", "bench@example.com")
+os.environ.setdefault("SMTP_PASSWORD", "bench")
+os.environ.setdefault("TASK_WORKERS", "0")
+os.environ.setdefault("DB_ECHO", "false")
+
+import httpx
+from fastapi import Depends
+from fastapi.responses import Response
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import (
+    AsyncSessionLocal, Base, SessionLocal, async_engine, engine, get_async_read_db,
+)
+from app.main import app as bench_app
+from app.models.jobapplication import Application
+from app.schemas.jobapplication import ApplicationResponse
+from app.utils import status_counters
+from app.utils.jwt_dependency import get_current_admin
+
+bench_app.dependency_overrides[get_current_admin] = lambda: None
+
+
+@bench_app.get("/bench/export-before")
+async def export_before(db: AsyncSession = Depends(get_async_read_db)):
+    rows = (await db.execute(select(Application).order_by(Application.id))).scalars().all()
+    buffer = io.StringIO()
+    writer = None
+    for row in rows:
+        data = ApplicationResponse.model_validate(row).model_dump()
+        if writer is None:
+            writer = csv.DictWriter(buffer, fieldnames=list(data))
+            writer.writeheader()
+        writer.writerow(data)
+    return Response(buffer.getvalue(), media_type="text/csv")
+
+
+async def seed(rows: int):
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        have = db.execute(select(func.count(Application.id))).scalar_one()
+        if have >= rows:
+            return
+        print(f"seeding {rows - have} applications into {DB_PATH} ...")
+        batch = []
+        for i in range(have, rows):
+            batch.append({
+                "job_id": 1 + i % 50,
+                "first_name": f"First{i}", "last_name": f"Last{i}", "full_name": f"First{i} Last{i}",
+                "phone": f"9{i:09d}", "email": f"applicant{i}@example.com",
+                "date_of_birth": date(1990, 1, 1) + timedelta(days=i % 3650), "gender": "F" if i % 2 else "M", "location": "Pune",
+                "pan_number": "ABCDE1234F",
+                "pan_card_file": f"uploads/blobs/aa/{i:064x}.pdf",
+                "resume_file": f"uploads/blobs/bb/{i:064x}.pdf",
+                "photo_file": f"uploads/blobs/cc/{i:064x}.jpg",
+                "highest_qualification": "BTech", "specialization": "Computer Science",
+                "university": "University of Pune", "college": "College of Engineering",
+                "year_of_passing": 2010 + i % 14,
+                "position_applied": "Backend Developer", "preferred_work_mode": "Hybrid",
+                "key_skills": "Python, FastAPI, SQL, Docker, AWS",
+                "expected_salary": 500000 + i % 1000 * 1000,
+                "why_hire_me": "Five years of building and running web services. " * 3,
+                "experience_level": "experienced", "previous_company": "Acme",
+                "previous_role": "Developer", "captcha_verified": True,
+                "date_of_joining": date(2018, 6, 1), "relieving_date": date(2023, 5, 31),
+                "status": ("Pending", "Shortlisted", "Rejected")[i % 3],
+                "processing_status": "done",
+            })
+            if len(batch) == 10000:
+                db.execute(insert(Application), batch)
+                batch = []
+        if batch:
+            db.execute(insert(Application), batch)
+        db.commit()
+
+    async with AsyncSessionLocal() as db:
+        await status_counters.rebuild(db)
+        await db.commit()
+    await async_engine.dispose()
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def rss_mb(pid: int, field: str) -> float:
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+async def run(path: str, params: dict) -> dict:
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "scripts.bench_export:bench_app",
+         "--port", str(port), "--log-level", "warning"],
+    )
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=None) as client:
+            for _ in range(100):
+                try:
+                    await client.get("/")
+                    break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.1)
+            rss_before = rss_mb(server.pid, "VmRSS")
+
+            start = time.perf_counter()
+            first_byte, size = None, 0
+            async with client.stream("GET", path, params=params) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_raw():
+                    if first_byte is None:
+                        first_byte = time.perf_counter() - start
+                    size += len(chunk)
+            total = time.perf_counter() - start
+            rss_peak = rss_mb(server.pid, "VmHWM")
+    finally:
+        server.terminate()
+        server.wait()
+
+    return {"ttfb": first_byte, "total": total, "bytes": size, "rss_before": rss_before, "rss_peak": rss_peak}
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--skip-before", action="store_true", help="skip the in-memory baseline")
+    args = parser.parse_args()
+
+    await seed(args.rows)
+    cases = [
+        ("in-memory CSV (before)", "/bench/export-before", {}),
+        ("streamed CSV", "/admin/applications/export", {}),
+        ("streamed XLSX", "/admin/applications/export", {"format": "xlsx"}),
+    ]
+    if args.skip_before:
+        cases = cases[1:]
+
+    print(f"{args.rows} applications, all columns")
+    for label, path, params in cases:
+        r = await run(path, params)
+        print(
+            f"{label:<24} first byte={r['ttfb']:6.2f} s  total={r['total']:6.1f} s  "
+            f"size={r['bytes'] / 1e6:7.1f} MB  peak RSS={r['rss_peak']:7.1f} MB "
+            f"(+{r['rss_peak'] - r['rss_before']:.1f} MB over idle)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,158 @@
+"""
+Hot query benchmark for migration 2d6f8b0c4e71 (hot query indexes).
+
+Seeds a SQLite file once (--applications job applications over 200 jobs,
+--contacts contact messages, --admins admins), then times each hot query
+--repeat times without the migration's indexes (before) and with them
+(after). The queries are the ones the routes issue: the admin application
+listing by job + status, by status and unfiltered (newest first, one page),
+the contacts keyset listing (first and a later page) and the password reset
+token lookup. Admin.email and the active-jobs listing were already indexed
+(unique constraint, ix_jobs_active_created) and are timed as controls.
+
+Run from the repo root:
+    python -m scripts.bench_hot_indexes --applications 200000 --repeat 50
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "vf_bench_hot_indexes.sqlite")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{DB_PATH}")
+os.environ.setdefault("SECRET_KEY", "bench")
+os.environ.setdefault("SMTP_HOST", "localhost")
+os.environ.setdefault("SMTP_PORT", "25")
+os.environ.setdefault("SMTP_EMAIL", "bench@example.com")
+os.environ.setdefault("SMTP_PASSWORD", "bench")
+os.environ.setdefault("DB_ECHO", "false")
+
+from sqlalchemy import func, insert, select
+
+from app.database import Base, SessionLocal, engine
+from app.models.admin import Admin
+from app.models.contact import Contact
+from app.models.job import Job
+from app.models.jobapplication import Application
+from app.utils.pagination import encode_cursor, keyset
+
+STATUSES = ("Pending", "Shortlisted", "Maybe", "Rejected")
+
+# what 2d6f8b0c4e71 adds
+MIGRATION_INDEXES = (
+    "ix_job_applications_job_status_created",
+    "ix_job_applications_status_created",
+    "ix_job_applications_created",
+    "ix_admins_reset_token",
+    "ix_contacts_created",
+)
+
+PAGE = 20
+
+
+def seed(applications: int, contacts: int, admins: int):
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        if db.execute(select(func.count(Application.id))).scalar_one() >= applications:
+            return
+        now = datetime.utcnow()
+        db.execute(insert(Job), [
+            {"title": f"Job {i}", "department": "Engineering", "is_active": i % 4 != 0,
+             "created_at": now - timedelta(hours=i)}
+            for i in range(1, 201)
+        ])
+        for start in range(0, applications, 20_000):
+            db.execute(insert(Application), [
+                {
+                    "job_id": 1 + i % 200, "first_name": "A", "last_name": f"{i}", "full_name": f"A {i}",
+                    "email": f"a{i}@example.com", "status": STATUSES[(i * 7) % 4],
+                    "created_at": now - timedelta(seconds=applications - i),
+                }
+                for i in range(start, min(start + 20_000, applications))
+            ])
+        db.execute(insert(Contact), [
+            {"name": f"C {i}", "email": f"c{i}@example.com", "subject": "Hi", "message": "Hello",
+             "created_at": now - timedelta(seconds=contacts - i)}
+            for i in range(contacts)
+        ])
+        db.execute(insert(Admin), [
+            {"email": f"admin{i}@example.com", "password_hash": "x",
+             "reset_token": f"token-{i}" if i % 10 == 0 else None}
+            for i in range(admins)
+        ])
+        db.commit()
+
+
+def hot_queries(contacts: int) -> dict:
+    # the contacts route's own keyset query, with a cursor half way down the list
+    with SessionLocal() as db:
+        middle = db.execute(
+            select(Contact.created_at, Contact.id).order_by(Contact.id).offset(contacts // 2).limit(1)
+        ).one()
+    cursor = encode_cursor({"c": middle.created_at.isoformat(), "i": middle.id, "d": "next"})
+    return {
+        "applications by job + status": select(Application)
+            .where(Application.job_id == 17, Application.status == "Pending")
+            .order_by(Application.created_at.desc(), Application.id.desc()).limit(PAGE),
+        "applications by status": select(Application)
+            .where(Application.status == "Shortlisted")
+            .order_by(Application.created_at.desc(), Application.id.desc()).limit(PAGE),
+        "applications, newest": select(Application)
+            .order_by(Application.created_at.desc(), Application.id.desc()).limit(PAGE),
+        "contacts, first page": keyset(select(Contact), Contact, None, PAGE)[0],
+        "contacts, keyset page": keyset(select(Contact), Contact, cursor, PAGE)[0],
+        "admin by reset_token": select(Admin).where(Admin.reset_token == "token-1230"),
+        "admin by email (control)": select(Admin).where(Admin.email == "admin1234@example.com"),
+        "active jobs, newest (control)": select(Job)
+            .where(Job.is_active == True).order_by(Job.created_at.desc(), Job.id.desc()).limit(PAGE),
+    }
+
+
+def _indexes():
+    by_name = {ix.name: ix for table in Base.metadata.tables.values() for ix in table.indexes}
+    return [by_name[name] for name in MIGRATION_INDEXES]
+
+
+def time_queries(queries: dict, repeat: int) -> dict:
+    results = {}
+    with engine.connect() as conn:
+        for label, query in queries.items():
+            conn.execute(query).all()  # warm the page cache
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                conn.execute(query).all()
+                timings.append((time.perf_counter() - start) * 1000)
+            results[label] = statistics.median(timings)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--applications", type=int, default=200_000)
+    parser.add_argument("--contacts", type=int, default=50_000)
+    parser.add_argument("--admins", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    seed(args.applications, args.contacts, args.admins)
+    queries = hot_queries(args.contacts)
+
+    for index in _indexes():
+        index.drop(bind=engine, checkfirst=True)
+    before = time_queries(queries, args.repeat)
+    for index in _indexes():
+        index.create(bind=engine)
+    after = time_queries(queries, args.repeat)
+
+    print(f"{args.applications} applications, {args.contacts} contacts, {args.admins} admins; "
+          f"median of {args.repeat} runs")
+    print(f"{'query':<32} {'before':>10} {'after':>10}")
+    for label in queries:
+        print(f"{label:<32} {before[label]:8.3f}ms {after[label]:8.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
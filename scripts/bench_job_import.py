@@ -0,0 +1,150 @@
+"""
+Throughput benchmark: POST /jobs/ per row vs one streamed POST /jobs/import.
+
+Both paths go through the real app (ASGI, no network) against a throwaway
+SQLite database, with admin auth overridden:
+
+  before: one POST /jobs/ per row, each with its own commit, cache-version
+          bump and search-index update
+  after:  the same rows as a single CSV or NDJSON body to /jobs/import,
+          validated row by row and inserted in JOB_IMPORT_BATCH_SIZE
+          executemany batches in one transaction
+
+Run from the repo root (needs httpx):
+    python -m scripts.bench_job_import --rows 10000
+    python -m scripts.bench_job_import --rows 10000 --per-request-rows 1000
+
+--per-request-rows times only a sample of the slow path and extrapolates
+rows/s from it.
+"""
+import argparse
+import asyncio
+import csv
+import io
+import json
+import os
+import tempfile
+import time
+
+DB_FILE = os.path.join(tempfile.gettempdir(), "vf_bench_job_import.sqlite")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{DB_FILE}")
+os.environ.setdefault("SECRET_KEY", "bench")
+os.environ.setdefault("SMTP_HOST", "localhost")
+os.environ.setdefault("SMTP_PORT", "25")
+os.environ.setdefault("SMTP_EMAIL", "bench@example.com")
+os.environ.setdefault("SMTP_PASSWORD", "bench")
+os.environ.setdefault("DB_PROFILE", "bench")
+
+import httpx
+
+from app.database import Base, engine
+from app.main import app
+from app.models.job import Job
+from app.utils.jwt_dependency import get_current_admin
+
+DEPARTMENTS = ["Engineering", "Sales", "Finance", "Operations", "HR"]
+WORK_MODES = ["Remote", "Hybrid", "On-site"]
+LOCATIONS = ["Mumbai", "Pune", "Bengaluru", "Delhi"]
+
+
+def make_rows(count: int) -> list[dict]:
+    return [
+        {
+            "title": f"Role {i}",
+            "department": DEPARTMENTS[i % len(DEPARTMENTS)],
+            "work_mode": WORK_MODES[i % len(WORK_MODES)],
+            "roles_responsibilities": "Own delivery, write code, review designs",
+            "required_skills": "python, sql, fastapi",
+            "experience_min": i % 5,
+            "experience_max": i % 5 + 3,
+            "qualification_required": "B.Tech",
+            "salary_min": 400000 + i % 10 * 50000,
+            "salary_max": 900000 + i % 10 * 50000,
+            "perks_benefits": "Health insurance",
+            "job_location": LOCATIONS[i % len(LOCATIONS)],
+            "job_locality": None,
+            "openings": 1 + i % 4,
+            "application_deadline": "2030-12-31",
+        }
+        for i in range(count)
+    ]
+
+
+def as_csv(rows: list[dict]) -> bytes:
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=list(rows[0]))
+    writer.writeheader()
+    writer.writerows(rows)
+    return out.getvalue().encode("utf-8")
+
+
+def as_ndjson(rows: list[dict]) -> bytes:
+    return "".join(json.dumps(row) + "\n" for row in rows).encode("utf-8")
+
+
+def reset_jobs():
+    with engine.begin() as conn:
+        conn.execute(Job.__table__.delete())
+
+
+async def per_request(client, rows) -> float:
+    start = time.perf_counter()
+    for row in rows:
+        (await client.post("/jobs/", json=row)).raise_for_status()
+    return time.perf_counter() - start
+
+
+async def streamed(client, body: bytes, content_type: str) -> tuple[float, dict]:
+    async def chunks():
+        for offset in range(0, len(body), 64 * 1024):
+            yield body[offset:offset + 64 * 1024]
+
+    start = time.perf_counter()
+    response = await client.post(
+        "/jobs/import", content=chunks(), headers={"Content-Type": content_type}
+    )
+    response.raise_for_status()
+    return time.perf_counter() - start, response.json()
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--per-request-rows", type=int, help="sample size for POST /jobs/")
+    args = parser.parse_args()
+
+    if os.path.exists(DB_FILE):
+        os.remove(DB_FILE)
+    engine.echo = False
+    Base.metadata.create_all(bind=engine)
+    app.dependency_overrides[get_current_admin] = lambda: None
+
+    rows = make_rows(args.rows)
+    sample = rows[: args.per_request_rows or args.rows]
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        print(f"{args.rows} rows")
+
+        reset_jobs()
+        seconds = await per_request(client, sample)
+        print(
+            f"{'POST /jobs/ per row':<24} {len(sample) / seconds:10.0f} rows/s  "
+            f"({len(sample)} rows in {seconds:.2f} s)"
+        )
+
+        for label, body, content_type in (
+            ("POST /jobs/import csv", as_csv(rows), "text/csv"),
+            ("POST /jobs/import ndjson", as_ndjson(rows), "application/x-ndjson"),
+        ):
+            reset_jobs()
+            seconds, result = await streamed(client, body, content_type)
+            assert result["inserted"] == args.rows, result
+            print(
+                f"{label:<24} {args.rows / seconds:10.0f} rows/s  "
+                f"({args.rows} rows in {seconds:.2f} s)"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,129 @@
+"""
+Sparse fieldset benchmark: full ApplicationResponse rows vs ?fields=.
+
+Seeds --rows applications (with realistically long why_hire_me / key_skills
+text) into a SQLite file, then for each case requests one page of
+GET /admin/applications/getall (--limit rows) --repeat times in-process and
+reports response bytes, median request time and the median time spent
+validating + serializing the page alone (the ORM rows are loaded once,
+outside the timer).
+
+Run from the repo root:
+    python -m scripts.bench_sparse_fields --rows 2000 --limit 100 --repeat 200
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import date
+from typing import List
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "vf_bench_sparse.sqlite")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{DB_PATH}")
+os.environ.setdefault("SECRET_KEY", "bench")
+os.environ.setdefault("SMTP_HOST", "localhost")
+os.environ.setdefault("SMTP_PORT", "25")
+os.environ.setdefault("SMTP_EMAIL", "bench@example.com")
+os.environ.setdefault("SMTP_PASSWORD", "bench")
+os.environ.setdefault("TASK_WORKERS", "0")
+os.environ.setdefault("DB_ECHO", "false")
+
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+from sqlalchemy import func, insert, select
+
+from app.database import Base, SessionLocal, engine
+from app.main import app
+from app.models.jobapplication import Application
+from app.schemas.jobapplication import ApplicationResponse
+from app.utils import sparse_fields
+from app.utils.jwt_dependency import get_current_admin
+
+app.dependency_overrides[get_current_admin] = lambda: None
+
+CASES = [
+    ("all fields", None),
+    ("grid: name, job, status", "full_name,job_id,status,created_at"),
+    ("contact: name, email, phone", "full_name,email,phone"),
+]
+
+
+def seed(rows: int):
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        have = db.execute(select(func.count(Application.id))).scalar_one()
+        if have >= rows:
+            return
+        db.execute(insert(Application), [
+            {
+                "job_id": 1 + i % 20,
+                "first_name": f"First{i}", "last_name": f"Last{i}", "full_name": f"First{i} Last{i}",
+                "phone": f"9{i:09d}", "email": f"applicant{i}@example.com",
+                "date_of_birth": date(1995, 1, 1), "gender": "F", "location": "Pune",
+                "pan_number": "ABCDE1234F",
+                "pan_card_file": f"uploads/blobs/aa/{i:064x}.pdf",
+                "resume_file": f"uploads/blobs/bb/{i:064x}.pdf",
+                "photo_file": f"uploads/blobs/cc/{i:064x}.jpg",
+                "highest_qualification": "BTech", "specialization": "Computer Science",
+                "university": "University of Pune", "college": "College of Engineering",
+                "year_of_passing": 2018, "position_applied": "Backend Developer",
+                "preferred_work_mode": "Hybrid",
+                "key_skills": "Python, FastAPI, Django, SQL, PostgreSQL, MySQL, Redis, Docker, "
+                              "Kubernetes, AWS, GCP, Terraform, CI/CD, Git, Linux, REST, GraphQL",
+                "expected_salary": 900000,
+                "why_hire_me": "I have built and operated production web services end to end. " * 30,
+                "experience_level": "fresher", "captcha_verified": True,
+                "status": "Pending", "processing_status": "done",
+            }
+            for i in range(have, rows)
+        ])
+        db.commit()
+
+
+def serialize_ms(rows, names) -> float:
+    if names is None:
+        adapter = TypeAdapter(List[ApplicationResponse])
+        start = time.perf_counter()
+        adapter.dump_json([ApplicationResponse.model_validate(r) for r in rows])
+    else:
+        start = time.perf_counter()
+        sparse_fields.json_response(rows, ApplicationResponse, names)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    seed(args.rows)
+    with SessionLocal() as db:
+        rows = db.execute(
+            select(Application).order_by(Application.id.desc()).limit(args.limit)
+        ).scalars().all()
+
+    print(f"GET /admin/applications/getall?limit={args.limit}, {args.repeat} requests per case")
+    with TestClient(app) as client:
+        for label, fields in CASES:
+            params = {"limit": args.limit, **({"fields": fields} if fields else {})}
+            client.get("/admin/applications/getall", params=params)  # warm up
+            timings, size = [], 0
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                response = client.get("/admin/applications/getall", params=params)
+                timings.append((time.perf_counter() - start) * 1000)
+                size = len(response.content)
+
+            names = sparse_fields.parse_fields(fields, ApplicationResponse)
+            serialize = statistics.median(serialize_ms(rows, names) for _ in range(args.repeat))
+            print(
+                f"{label:<30} {size / 1024:8.1f} KiB  request p50={statistics.median(timings):6.2f} ms  "
+                f"validate+serialize p50={serialize:6.3f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
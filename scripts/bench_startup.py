@@ -0,0 +1,123 @@
+"""
+Import-time and startup-time benchmark for app.main.
+
+Each sample runs in a fresh interpreter against a throwaway SQLite database
+and measures:
+  import   - `import app.main`
+  startup  - the FastAPI startup handlers, once per SCHEMA_STARTUP_MODE
+             (create_all vs fingerprint)
+
+It also lists the slowest imports (python -X importtime). Pass --max-import-ms
+/ --max-startup-ms to make it exit non-zero on a regression (e.g. in CI).
+
+Run from the repo root:
+    python -m scripts.bench_startup --runs 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+DB_FILE = os.path.join(tempfile.gettempdir(), "vf_bench_startup.sqlite")
+
+ENV = {
+    **os.environ,
+    "DATABASE_URL": f"sqlite:///{DB_FILE}",
+    "SECRET_KEY": "bench",
+    "SMTP_HOST": "localhost",
+    "SMTP_PORT": "25",
+    "SMTP_EMAIL": "bench@example.com",
+    "SMTP_PASSWORD": "bench",
+    "DB_PROFILE": "bench",
+}
+
+PREPARE = """
+from app.database import engine, Base
+from app import models
+from app.utils.schema_fingerprint import store_fingerprint
+Base.metadata.create_all(bind=engine)
+with engine.begin() as conn:
+    store_fingerprint(conn, Base.metadata)
+"""
+
+MEASURE = """
+import asyncio, time
+t = time.perf_counter()
+import app.main
+t_import = time.perf_counter() - t
+t = time.perf_counter()
+asyncio.run(app.main.app.router.startup())
+t_startup = time.perf_counter() - t
+print(t_import * 1000, t_startup * 1000)
+"""
+
+
+def run(code: str, **env) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env={**ENV, **env},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip().splitlines()[-1]
+
+
+def slowest_imports(limit: int) -> list[tuple[int, str]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        env=ENV,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--max-import-ms", type=float)
+    parser.add_argument("--max-startup-ms", type=float)
+    args = parser.parse_args()
+
+    if os.path.exists(DB_FILE):
+        os.remove(DB_FILE)
+    run(PREPARE + "\nprint('ok')")
+
+    failed = False
+    for mode in ("create_all", "fingerprint"):
+        samples = [
+            tuple(map(float, run(MEASURE, SCHEMA_STARTUP_MODE=mode).split()))
+            for _ in range(args.runs)
+        ]
+        import_ms = statistics.median(s[0] for s in samples)
+        startup_ms = statistics.median(s[1] for s in samples)
+        print(f"{mode:<12} import={import_ms:8.1f} ms  startup={startup_ms:8.1f} ms")
+
+        if mode == "fingerprint":
+            if args.max_import_ms and import_ms > args.max_import_ms:
+                print(f"FAIL: import {import_ms:.1f} ms > {args.max_import_ms} ms")
+                failed = True
+            if args.max_startup_ms and startup_ms > args.max_startup_ms:
+                print(f"FAIL: startup {startup_ms:.1f} ms > {args.max_startup_ms} ms")
+                failed = True
+
+    print(f"\nslowest imports (cumulative us):")
+    for cumulative, name in slowest_imports(args.top):
+        print(f"{cumulative:>10}  {name}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Upload benchmark: whole-file reads vs the streaming upload engine.
+
+Starts a uvicorn server (a separate process, so its memory can be measured)
+with one of two handlers that store the three application files:
+
+  before: file.file.read() + write() for each file in turn, on the event
+          loop (the old save_upload_file in apply_job)
+  after:  save_uploads(): chunked, hashed and sniffed in worker threads,
+          the three files written concurrently
+
+Then fires --requests multipart requests, --concurrency at a time, each
+carrying three --file-mb files, while a probe requests GET /ping every
+10 ms. Reports upload p50/p99, probe p99 (how long the event loop was
+blocked) and the server's peak RSS (VmHWM).
+
+Run from the repo root (Linux, needs httpx and uvicorn):
+    python -m scripts.bench_uploads --file-mb 10 --concurrency 16 --requests 64
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+UPLOAD_DIR = os.path.join(tempfile.gettempdir(), "vf_bench_uploads")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{UPLOAD_DIR}.sqlite")
+os.environ.setdefault("SECRET_KEY", "bench")
+os.environ.setdefault("SMTP_HOST", "localhost")
+os.environ.setdefault("SMTP_PORT", "25")
+os.environ.setdefault("SMTP_EMAIL", "bench@example.com")
+os.environ.setdefault("SMTP_PASSWORD", "bench")
+os.environ.setdefault("UPLOAD_MAX_FILE_BYTES", str(64 * 1024 * 1024))
+os.environ.setdefault("UPLOAD_MAX_REQUEST_BYTES", str(192 * 1024 * 1024))
+
+import httpx
+from fastapi import FastAPI, File, UploadFile
+
+from app.utils.file_upload import DOCUMENT_TYPES, IMAGE_TYPES, save_uploads
+
+bench_app = FastAPI()
+
+
+@bench_app.get("/ping")
+async def ping():
+    return {}
+
+
+@bench_app.post("/before")
+async def before(pan_card: UploadFile = File(...), resume: UploadFile = File(...), photo: UploadFile = File(...)):
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    for file in (pan_card, resume, photo):
+        path = os.path.join(UPLOAD_DIR, f"{time.perf_counter_ns()}_{file.filename}")
+        with open(path, "wb") as f:
+            f.write(file.file.read())
+    return {}
+
+
+@bench_app.post("/after")
+async def after(pan_card: UploadFile = File(...), resume: UploadFile = File(...), photo: UploadFile = File(...)):
+    await save_uploads(UPLOAD_DIR, {
+        "pan_card": (pan_card, IMAGE_TYPES | {"application/pdf"}),
+        "resume": (resume, DOCUMENT_TYPES),
+        "photo": (photo, IMAGE_TYPES),
+    })
+    return {}
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def peak_rss_mb(pid: int) -> float:
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+async def wait_ready(client: httpx.AsyncClient):
+    for _ in range(100):
+        try:
+            await client.get("/ping")
+            return
+        except httpx.TransportError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError("server did not start")
+
+
+async def run(path: str, files: dict, concurrency: int, requests: int) -> dict:
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "scripts.bench_uploads:bench_app",
+         "--port", str(port), "--log-level", "warning"],
+    )
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=None) as client:
+            await wait_ready(client)
+            rss_idle = peak_rss_mb(server.pid)
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def one():
+                async with semaphore:
+                    start = time.perf_counter()
+                    response = await client.post(path, files=files)
+                    response.raise_for_status()
+                    return (time.perf_counter() - start) * 1000
+
+            probes = []
+            done = asyncio.Event()
+
+            async def probe():
+                while not done.is_set():
+                    start = time.perf_counter()
+                    await client.get("/ping")
+                    probes.append((time.perf_counter() - start) * 1000)
+                    await asyncio.sleep(0.01)
+
+            prober = asyncio.create_task(probe())
+            wall = time.perf_counter()
+            latencies = sorted(await asyncio.gather(*(one() for _ in range(requests))))
+            wall = time.perf_counter() - wall
+            done.set()
+            await prober
+            rss_peak = peak_rss_mb(server.pid)
+    finally:
+        server.terminate()
+        server.wait()
+        shutil.rmtree(UPLOAD_DIR, ignore_errors=True)
+
+    return {
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "wall": wall,
+        "probe_p99": sorted(probes)[min(len(probes) - 1, int(len(probes) * 0.99))],
+        "rss_idle": rss_idle,
+        "rss_peak": rss_peak,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--file-mb", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=64)
+    args = parser.parse_args()
+
+    body = os.urandom(args.file_mb * 1024 * 1024)
+    files = {
+        "pan_card": ("pan.pdf", b"%PDF-" + body, "application/pdf"),
+        "resume": ("resume.pdf", b"%PDF-" + body, "application/pdf"),
+        "photo": ("photo.jpg", b"\xff\xd8\xff" + body, "image/jpeg"),
+    }
+
+    print(
+        f"{args.requests} requests x 3 files x {args.file_mb} MB, "
+        f"{args.concurrency} concurrent"
+    )
+    for label, path in (("read() on loop (before)", "/before"), ("streamed (after)", "/after")):
+        r = await run(path, files, args.concurrency, args.requests)
+        print(
+            f"{label:<24} p50={r['p50']:8.1f} ms  p99={r['p99']:8.1f} ms  "
+            f"ping p99={r['probe_p99']:7.1f} ms  wall={r['wall']:6.2f} s  peak RSS={r['rss_peak']:7.1f} MB "
+            f"(idle {r['rss_idle']:.1f} MB)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,172 @@
+"""
+Index advisor: drive the hot admin / public routes against a test database,
+record every statement shape they issue, EXPLAIN each and print the
+composite indexes the plans are missing (app/utils/index_advisor.py).
+
+Without DATABASE_URL a fresh SQLite file is created from the models and
+seeded; with it, that (already migrated and seeded) test database is used
+as is. --drop-index replays the schema from before a migration, e.g. to
+see what was recommended for 2d6f8b0c4e71:
+
+    python -m scripts.index_advisor \\
+        --drop-index ix_job_applications_job_status_created \\
+        --drop-index ix_job_applications_status_created \\
+        --drop-index ix_job_applications_created \\
+        --drop-index ix_admins_reset_token --drop-index ix_contacts_created
+
+Run from the repo root (needs httpx). --alembic prints the proposals as
+op.create_index() lines.
+"""
+import argparse
+import os
+import tempfile
+from datetime import date, datetime, timedelta
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "vf_index_advisor.sqlite")
+SEED = "DATABASE_URL" not in os.environ
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{DB_PATH}")
+os.environ.setdefault("SECRET_KEY", "advisor")
+os.environ.setdefault("SMTP_HOST", "localhost")
+os.environ.setdefault("SMTP_PORT", "25")
+os.environ.setdefault("SMTP_EMAIL", "advisor@example.com")
+os.environ.setdefault("SMTP_PASSWORD", "advisor")
+os.environ.setdefault("TASK_WORKERS", "0")
+os.environ.setdefault("DB_ECHO", "false")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, text
+
+from app.database import Base, SessionLocal, async_engine, engine
+from app.main import app
+from app.models.admin import Admin
+from app.models.contact import Contact
+from app.models.csr import CSR
+from app.models.job import Job
+from app.models.jobapplication import Application
+from app.models.otp import OTP
+from app.utils import index_advisor
+from app.utils.auth import hash_password
+
+ADMIN_EMAIL, ADMIN_PASSWORD = "advisor@example.com", "advisor-password"
+
+STATUSES = ("Pending", "Shortlisted", "Maybe", "Rejected")
+
+# (method, path, params): what an admin session and the public site do
+WORKLOAD = [
+    ("GET", "/admin/applications/", {}),
+    ("GET", "/admin/applications/", {"job_id": 3}),
+    ("GET", "/admin/applications/", {"job_id": 3, "status": "Pending"}),
+    ("GET", "/admin/applications/", {"status": "Shortlisted"}),
+    ("GET", "/admin/applications/", {"job_id": 3, "status": "Pending", "page": 2}),
+    ("GET", "/admin/applications/getall", {"limit": 50}),
+    ("GET", "/admin/applications/export", {"job_id": 3, "status": "Pending"}),
+    ("GET", "/admin/applications/search", {"q": "python", "job_id": 3}),
+    ("GET", "/admin/applications/42", {}),
+    ("GET", "/contact/admin/contacts", {"limit": 20}),
+    ("GET", "/csr", {}),
+    ("GET", "/jobs/", {}),
+    ("GET", "/jobs/", {"department": "Engineering"}),
+    ("GET", "/jobs/7", {}),
+    ("POST", "/admin/reset-password", {"token": "no-such-token", "new_password": "x"}),
+]
+
+
+def seed(applications: int = 2000):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    now = datetime.utcnow()
+    with SessionLocal() as db:
+        db.execute(insert(Admin), [{
+            "email": ADMIN_EMAIL, "password_hash": hash_password(ADMIN_PASSWORD), "is_active": True,
+        }])
+        db.execute(insert(Job), [
+            {
+                "title": f"Job {i}", "department": ("Engineering", "Sales", "HR")[i % 3],
+                "work_mode": "Hybrid", "job_location": "Pune", "is_active": i % 5 != 0,
+                "experience_min": 0, "experience_max": 5, "salary_min": 1, "salary_max": 9,
+                "created_at": now - timedelta(days=i),
+            }
+            for i in range(1, 41)
+        ])
+        db.execute(insert(Application), [
+            {
+                "job_id": 1 + i % 40, "first_name": "A", "last_name": f"{i}", "full_name": f"A {i}",
+                "email": f"a{i}@example.com", "phone": f"9{i:09d}", "date_of_birth": date(1995, 1, 1),
+                "gender": "F", "location": "Pune", "pan_number": "ABCDE1234F",
+                "highest_qualification": "BTech", "specialization": "CS", "university": "U",
+                "college": "C", "year_of_passing": 2018, "position_applied": "Developer",
+                "preferred_work_mode": "Hybrid", "key_skills": "Python, SQL", "expected_salary": 1,
+                "why_hire_me": "...", "experience_level": "fresher", "status": STATUSES[i % 4],
+                "processing_status": "done", "created_at": now - timedelta(minutes=i),
+            }
+            for i in range(applications)
+        ])
+        db.execute(insert(Contact), [
+            {"name": f"C {i}", "email": f"c{i}@example.com", "subject": "Hi", "message": "Hello",
+             "created_at": now - timedelta(minutes=i)}
+            for i in range(500)
+        ])
+        db.execute(insert(CSR), [
+            {"title": f"CSR {i}", "description": "...", "is_active": True} for i in range(20)
+        ])
+        db.execute(insert(OTP), [
+            {"email": f"c{i}@example.com", "otp_code": "123456", "expires_at": now} for i in range(200)
+        ])
+        db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--drop-index", action="append", default=[], metavar="NAME")
+    parser.add_argument("--alembic", action="store_true", help="print op.create_index() lines")
+    args = parser.parse_args()
+
+    if SEED:
+        seed()
+    with engine.begin() as conn:
+        for name in args.drop_index:
+            on = f" ON {_index_table(conn, name)}" if conn.dialect.name == "mysql" else ""
+            conn.execute(text(f"DROP INDEX {name}{on}"))
+
+    recorder = index_advisor.ShapeRecorder()
+    with TestClient(app, raise_server_exceptions=False) as client:
+        token = client.post(
+            "/admin/login", data={"username": ADMIN_EMAIL, "password": ADMIN_PASSWORD}
+        ).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        with recorder.recording(engine, async_engine.sync_engine):
+            for method, path, params in WORKLOAD:
+                client.request(method, path, params=params, headers=headers)
+            # second contacts page: the keyset range predicate
+            cursor = client.get(
+                "/contact/admin/contacts", params={"limit": 20}, headers=headers
+            ).headers.get("X-Next-Cursor")
+            client.get("/contact/admin/contacts", params={"limit": 20, "cursor": cursor}, headers=headers)
+            client.post("/auth/verify-otp", json={"email": "c7@example.com", "otp": "000000"})
+
+    samples = recorder.samples()
+    with engine.connect() as conn:
+        advice = index_advisor.advise(conn, samples)
+
+    print(f"{len(samples)} statement shapes recorded, {len(advice)} index(es) proposed\n")
+    for entry in advice:
+        print(entry)
+        for shape in entry.shapes:
+            print(f"    {shape[:160]}")
+    if args.alembic:
+        print()
+        for entry in advice:
+            print(f"    op.create_index('{entry.name}', '{entry.table}', {list(entry.columns)!r}, unique=False)")
+
+
+def _index_table(conn, name: str) -> str:
+    return conn.execute(
+        text("SELECT table_name FROM information_schema.statistics "
+             "WHERE table_schema = DATABASE() AND index_name = :name LIMIT 1"),
+        {"name": name},
+    ).scalar_one()
+
+
+if __name__ == "__main__":
+    main()
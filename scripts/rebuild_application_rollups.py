@@ -0,0 +1,27 @@
+"""
+Recompute application_daily_rollups from job_applications and the status
+audit trail (application_status_changes).
+
+The migration backfills the rollups and every write keeps them current;
+run this only to repair them (e.g. after editing job_applications by hand).
+Status changes made before the audit trail existed are not known, so their
+days show no transitions. Run it while nothing is writing applications.
+
+Run from the repo root:
+    python -m scripts.rebuild_application_rollups
+"""
+import time
+
+from app.database import engine
+from app.utils.application_rollups import rebuild
+
+
+def main():
+    start = time.perf_counter()
+    with engine.begin() as connection:
+        rows = rebuild(connection)
+    print(f"{rows} rollup rows written in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""
+Recount application_status_counts from job_applications.
+
+The migration backfills the counters and every write keeps them current;
+run this only to repair them (e.g. after editing job_applications by hand).
+Run it while nothing is writing applications: writes racing the recount
+are not counted.
+
+Run from the repo root:
+    python -m scripts.rebuild_status_counts
+"""
+import asyncio
+
+from app.database import AsyncSessionLocal, async_engine
+from app.utils import status_counters
+
+
+async def main():
+    async with AsyncSessionLocal() as db:
+        await status_counters.rebuild(db)
+        await db.commit()
+        print(await status_counters.counts(db))
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,57 @@
+"""
+Rebuild the application search postings (application_terms) from scratch.
+
+Needed once after deploying the search index, or after changing the
+normalization rules in app/utils/application_search.py. New and deleted
+applications keep the index current on their own.
+
+Run from the repo root:
+    python -m scripts.reindex_applications --batch 500
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import delete, select
+
+from app.database import AsyncSessionLocal, async_engine
+from app.models.application_term import ApplicationTerm
+from app.models.jobapplication import Application
+from app.utils.application_search import index_application
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch", type=int, default=500)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(ApplicationTerm))
+        await db.commit()
+
+        last_id, done = 0, 0
+        while True:
+            batch = (
+                await db.execute(
+                    select(Application)
+                    .where(Application.id > last_id)
+                    .order_by(Application.id)
+                    .limit(args.batch)
+                )
+            ).scalars().all()
+            if not batch:
+                break
+            for application in batch:
+                await index_application(db, application)
+            await db.commit()
+            db.expunge_all()
+            last_id, done = batch[-1].id, done + len(batch)
+            print(f"{done} applications indexed")
+
+    await async_engine.dispose()
+    print(f"done in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,27 @@
+"""
+Recompute the duplicate-detection keys (email_key, phone_key, pan_key) of
+every application.
+
+Needed after changing DEDUP_HASH_KEY or the normalization rules in
+app/utils/application_dedup.py. Runs in one transaction; new applications
+racing the rekey may be keyed with either secret, so run it while
+submissions are paused.
+
+Run from the repo root:
+    python -m scripts.rekey_applications
+"""
+import time
+
+from app.database import engine
+from app.utils.application_dedup import rekey
+
+
+def main():
+    start = time.perf_counter()
+    with engine.begin() as connection:
+        done = rekey(connection)
+    print(f"{done} applications rekeyed in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
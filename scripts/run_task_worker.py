@@ -0,0 +1,46 @@
+"""
+Run the background document tasks (app/utils/task_queue.py) in a process of
+their own, next to the web workers.
+
+The web process runs no tasks by default (TASK_WORKERS=0): under gunicorn
+every app worker would otherwise start its own process pool and poller.
+Run one of these per host instead; several can poll the same task_queue
+table, and tasks left behind by a stopped worker are re-claimed once their
+lease expires.
+
+Run from the repo root:
+    python -m scripts.run_task_worker --workers 4
+"""
+import argparse
+import asyncio
+import signal
+
+from app.database import async_engine
+from app.utils.task_queue import TaskWorker
+
+
+async def main(workers: int):
+    worker = TaskWorker(workers)
+    worker.start()
+    print(f"task worker {worker.name}: {workers} process(es), Ctrl+C to stop")
+
+    stopping = asyncio.Event()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stopping.set)
+    except NotImplementedError:
+        pass  # Windows: Ctrl+C only
+    try:
+        await stopping.wait()
+    finally:
+        await worker.stop()
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=2, help="process-pool size")
+    args = parser.parse_args()
+    try:
+        asyncio.run(main(args.workers))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,104 @@
+import asyncio
+import os
+import tempfile
+
+# app.config reads these at import time: tests get throwaway values and their own
+# SQLite database, never whatever DATABASE_URL the shell happens to point at
+_DB_PATH = os.path.join(tempfile.mkdtemp(prefix="tests-"), "app.sqlite")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_PATH}"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ.pop("REPLICA_DATABASE_URL", None)
+for _name, _value in {
+    "SECRET_KEY": "test-secret",
+    "SMTP_HOST": "localhost",
+    "SMTP_PORT": "25",
+    "SMTP_EMAIL": "noreply@example.com",
+    "SMTP_PASSWORD": "test",
+    "DB_ECHO": "false",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture
+def schema():
+    """A freshly created schema, dropped again after the test."""
+    from app.database import Base, engine
+    import app.main  # noqa: F401  (registers every table on Base.metadata)
+
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def db(schema):
+    """A sync Session on the test database."""
+    from app.database import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def run_async(schema):
+    """Run `fn(AsyncSession)` to completion and return its result."""
+    from app.database import AsyncSessionLocal, async_engine
+
+    def run(fn):
+        async def main():
+            try:
+                async with AsyncSessionLocal() as session:
+                    return await fn(session)
+            finally:
+                # pooled aiosqlite connections belong to this event loop
+                await async_engine.dispose()
+
+        return asyncio.run(main())
+
+    return run
+
+
+@pytest.fixture
+def client(schema, tmp_path, monkeypatch):
+    """A TestClient signed in as admin, writing uploads under tmp_path."""
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.utils.jwt_dependency import get_current_admin
+
+    monkeypatch.chdir(tmp_path)
+    app.dependency_overrides[get_current_admin] = lambda: None
+    try:
+        with TestClient(app) as test_client:
+            yield test_client
+    finally:
+        app.dependency_overrides.pop(get_current_admin, None)
+
+
+APPLICATION_FORM = {
+    "job_id": 1, "first_name": "Asha", "last_name": "Rao", "phone": "9876543210",
+    "email": "asha@example.com", "date_of_birth": "1995-04-01", "gender": "F", "location": "Pune",
+    "pan_number": "ABCDE1234F", "highest_qualification": "BTech", "specialization": "CS",
+    "university": "SPPU", "college": "COEP", "year_of_passing": 2017, "position_applied": "Developer",
+    "preferred_work_mode": "Remote", "key_skills": "python", "expected_salary": 1200000,
+    "why_hire_me": "Ships things", "experience_level": "fresher", "captcha_token": "test",
+}
+
+
+@pytest.fixture
+def apply(client):
+    """POST an application (APPLICATION_FORM overridden by **fields) with small files."""
+    def post(content=b"resume", **fields):
+        files = {
+            "pan_card": ("pan.pdf", b"%PDF-1.4 pan " + content, "application/pdf"),
+            "resume": ("resume.pdf", b"%PDF-1.4 resume " + content, "application/pdf"),
+            "photo": ("photo.jpg", b"\xff\xd8\xff photo " + content, "image/jpeg"),
+        }
+        return client.post("/admin/applications/", data={**APPLICATION_FORM, **fields}, files=files)
+
+    return post
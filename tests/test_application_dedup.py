@@ -0,0 +1,55 @@
+import pytest
+
+from app.utils.application_dedup import lookup_keys, normalize_email, normalize_pan, normalize_phone
+
+
+@pytest.mark.parametrize("email, expected", [
+    ("Asha.Rao+jobs@GMail.com ", "asharao@gmail.com"),
+    ("a.s.h.a@googlemail.com", "asha@gmail.com"),
+    ("asha.rao+x@example.com", "asha.rao@example.com"),
+    ("not-an-email", None),
+    (None, None),
+])
+def test_normalize_email(email, expected):
+    assert normalize_email(email) == expected
+
+
+@pytest.mark.parametrize("phone, expected", [
+    ("+91 98765-43210", "9876543210"),
+    ("09876543210", "9876543210"),
+    ("12345", None),
+    ("", None),
+])
+def test_normalize_phone(phone, expected):
+    assert normalize_phone(phone) == expected
+
+
+def test_normalize_pan():
+    assert normalize_pan(" abcde 1234f ") == "ABCDE1234F"
+    assert normalize_pan("  ") is None
+
+
+def test_lookup_keys_are_keyed_hashes_of_the_normalized_values():
+    keys = lookup_keys("Asha+x@example.com", "+91 9876543210", "abcde1234f")
+    assert keys == lookup_keys("asha@example.com", "9876543210", "ABCDE1234F")
+    assert all(len(key) == 64 and "asha" not in key for key in keys.values())
+    assert lookup_keys(None, None, None) == {"email_key": None, "phone_key": None, "pan_key": None}
+
+
+@pytest.mark.parametrize("shared", ["email", "phone", "pan_number"])
+def test_any_shared_key_is_a_duplicate(apply, shared):
+    first = apply()
+    assert first.status_code == 201
+
+    others = {"email": "someone@else.com", "phone": "9123456780", "pan_number": "ZZZZZ9999Z"}
+    del others[shared]
+    repeat = apply(content=b"other", **others)
+
+    assert repeat.status_code == 200
+    assert repeat.json()["application_id"] == first.json()["id"]
+
+
+def test_same_person_may_apply_to_another_job(apply):
+    assert apply().status_code == 201
+    assert apply(job_id=2).status_code == 201
+    assert apply(content=b"other", email="Asha+again@example.com").status_code == 200
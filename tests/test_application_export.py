@@ -0,0 +1,43 @@
+import csv
+import io
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.utils.application_export import EXPORT_COLUMNS, CsvEncoder, parse_columns
+
+
+def _read(data: bytes):
+    return list(csv.reader(io.StringIO(data.decode("utf-8"))))
+
+
+@pytest.mark.parametrize("value", ["=HYPERLINK(\"http://x\")", "+1+1", "-2+3", "@SUM(A1)", "\tx", "\r=1"])
+def test_csv_quotes_formula_cells(value):
+    encoder = CsvEncoder(["why_hire_me"])
+    rows = _read(encoder.rows([(value,)]))
+    assert rows[1] == ["'" + value]
+
+
+def test_csv_leaves_other_cells_alone():
+    encoder = CsvEncoder(["full_name", "expected_salary", "created_at", "linkedin_url"])
+    rows = _read(encoder.rows([("Asha Rao", -5, datetime(2026, 1, 2, 3, 4), None)]))
+    # numbers are not applicant text: a negative one stays a number
+    assert rows[1] == ["Asha Rao", "-5", "2026-01-02T03:04:00", ""]
+
+
+def test_csv_bom_only_on_the_first_chunk():
+    encoder = CsvEncoder(["id"])
+    first, second = encoder.rows([(1,)]), encoder.rows([(2,)])
+    assert first.startswith("\ufeff".encode("utf-8"))
+    assert not second.startswith("\ufeff".encode("utf-8"))
+    assert second == b"2\r\n"
+    assert encoder.close() == b""
+
+
+def test_parse_columns():
+    assert parse_columns(None) == list(EXPORT_COLUMNS)
+    assert parse_columns(" email,full_name,email ") == ["email", "full_name"]
+    with pytest.raises(HTTPException) as raised:
+        parse_columns("email,resume_text")
+    assert raised.value.status_code == 400
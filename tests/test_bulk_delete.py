@@ -0,0 +1,63 @@
+import os
+
+from sqlalchemy import event, select
+
+from app.database import async_engine
+from app.models.application_status_count import ApplicationStatusCount
+from app.models.jobapplication import Application
+from app.routes import jobapplication
+from app.routes.jobapplication import FILE_FIELDS
+from app.utils.status_counters import all_jobs_shard
+
+
+def _apply_five(apply):
+    ids = []
+    for n in range(5):
+        response = apply(
+            content=str(n).encode(),
+            email=f"applicant{n}@example.com", phone=f"98765432{n:02d}", pan_number=f"ABCDE{n:04d}F",
+        )
+        assert response.status_code == 201
+        ids.append(response.json()["id"])
+    return ids
+
+
+def test_bulk_delete_runs_in_chunks(apply, client, db, monkeypatch):
+    monkeypatch.setattr(jobapplication, "BULK_DELETE_CHUNK", 2)
+    ids = _apply_five(apply)
+    files = {
+        row.id: [getattr(row, field) for field in FILE_FIELDS]
+        for row in db.execute(select(Application)).scalars()
+    }
+    assert all(os.path.exists(path) for paths in files.values() for path in paths)
+
+    deletes = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("DELETE FROM job_applications"):
+            deletes.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        response = client.request("DELETE", "/admin/applications/bulk", json=ids[:4] + [9999, ids[0]])
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["deleted"] == 4
+    assert body["missing"] == [9999]
+    assert body["file_errors"] == []
+    assert len(deletes) == 2  # 4 ids, 2 per chunk
+
+    db.expire_all()
+    assert db.execute(select(Application.id)).scalars().all() == [ids[4]]
+    assert not any(os.path.exists(path) for app_id in ids[:4] for path in files[app_id])
+    assert all(os.path.exists(path) for path in files[ids[4]])
+
+    counts = {
+        (row.job_id, row.status): row.count
+        for row in db.execute(select(ApplicationStatusCount)).scalars()
+    }
+    assert counts[(1, "Pending")] == 1
+    assert counts[(all_jobs_shard(1), "Pending")] == 1
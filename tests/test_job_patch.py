@@ -0,0 +1,32 @@
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.job import JobBatchUpdate, JobPatch
+
+# not Optional in JobBase / JobResponse: a null would break every later GET /jobs/
+REQUIRED = [
+    "title", "department", "work_mode", "roles_responsibilities", "required_skills",
+    "experience_min", "experience_max", "qualification_required", "salary_min", "salary_max",
+    "job_location", "openings", "application_deadline", "is_active",
+]
+
+
+@pytest.mark.parametrize("field", REQUIRED)
+def test_patch_rejects_null_for_required_fields(field):
+    with pytest.raises(ValidationError, match=f"{field} cannot be null"):
+        JobPatch(**{field: None})
+
+
+def test_batch_update_rejects_null_work_mode():
+    with pytest.raises(ValidationError, match="work_mode cannot be null"):
+        JobBatchUpdate(updates=[{"id": 1, "fields": {"work_mode": None}}])
+
+
+@pytest.mark.parametrize("field", ["perks_benefits", "job_locality"])
+def test_patch_allows_null_for_optional_fields(field):
+    assert JobPatch(**{field: None}).model_dump(exclude_unset=True) == {field: None}
+
+
+def test_patch_requires_a_field():
+    with pytest.raises(ValidationError, match="no fields to update"):
+        JobPatch()
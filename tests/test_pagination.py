@@ -0,0 +1,86 @@
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import literal_column
+
+from app.models.job import Job
+from app.utils.pagination import decode_cursor, encode_cursor, offset_from_cursor
+
+
+def test_cursor_round_trip():
+    payload = {"c": "2026-01-02T03:04:05", "i": 42, "d": "next"}
+    cursor = encode_cursor(payload)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == payload
+
+
+@pytest.mark.parametrize("cursor", ["%%%", encode_cursor({"o": 1})[:-1] + "!", "WzFd"])  # WzFd is "[1]"
+def test_invalid_cursor_is_a_400(cursor):
+    with pytest.raises(HTTPException) as raised:
+        decode_cursor(cursor)
+    assert raised.value.status_code == 400
+
+
+def test_offset_cursor_never_goes_negative():
+    assert offset_from_cursor(None) == 0
+    assert offset_from_cursor(encode_cursor({"o": -5})) == 0
+
+
+JOB = {
+    "department": "Engineering", "work_mode": "Remote", "roles_responsibilities": "Build things",
+    "required_skills": "python", "experience_min": 0, "experience_max": 3,
+    "qualification_required": "BTech", "salary_min": 600000, "salary_max": 1200000,
+    "job_location": "Pune", "openings": 2, "application_deadline": date(2026, 12, 31),
+}
+
+
+@pytest.fixture
+def jobs(db):
+    # three pairs share a created_at: the id breaks the tie. Stamped in SQL,
+    # in the format the func.now() default stores on SQLite
+    rows = [
+        Job(title=f"Job {n}", **JOB, created_at=literal_column(f"'2026-01-01 09:0{n // 2}:00'"))
+        for n in range(7)
+    ]
+    db.add_all(rows)
+    db.commit()
+    return sorted(rows, key=lambda job: (job.created_at, job.id), reverse=True)
+
+
+def _page(client, **params):
+    response = client.get("/jobs/admin", params=params)
+    assert response.status_code == 200
+    return [job["id"] for job in response.json()], response.headers
+
+
+def test_admin_jobs_walk_forward_and_back(client, jobs):
+    newest_first = [job.id for job in jobs]
+
+    first, headers = _page(client, limit=3, include_total=True)
+    assert first == newest_first[:3]
+    assert headers["X-Total-Count"] == "7"
+    assert "X-Prev-Cursor" not in headers
+
+    second, headers = _page(client, limit=3, cursor=headers["X-Next-Cursor"])
+    assert second == newest_first[3:6]
+
+    third, last_headers = _page(client, limit=3, cursor=headers["X-Next-Cursor"])
+    assert third == newest_first[6:]
+    assert "X-Next-Cursor" not in last_headers
+
+    back, headers = _page(client, limit=3, cursor=last_headers["X-Prev-Cursor"])
+    assert back == second
+    back, headers = _page(client, limit=3, cursor=headers["X-Prev-Cursor"])
+    assert back == first
+    assert "X-Prev-Cursor" not in headers
+
+
+def test_admin_jobs_skip_still_pages(client, jobs):
+    ids, headers = _page(client, limit=2, skip=5)
+    assert ids == [job.id for job in jobs][5:7]
+    assert "X-Next-Cursor" not in headers and "X-Prev-Cursor" in headers
+
+
+def test_admin_jobs_rejects_a_bad_cursor(client, jobs):
+    assert client.get("/jobs/admin", params={"cursor": "not-a-cursor"}).status_code == 400
@@ -0,0 +1,108 @@
+from collections import Counter
+
+from sqlalchemy import event, select
+
+from app.database import async_engine
+from app.models.application_status_count import ApplicationStatusCount
+from app.utils import status_counters
+from app.utils.status_counters import ALL_JOBS_SHARDS, all_jobs_shard
+
+
+def _rows(db):
+    return {
+        (row.job_id, row.status): row.count
+        for row in db.execute(select(ApplicationStatusCount)).scalars()
+    }
+
+
+def test_all_jobs_shard_covers_minus_one_to_minus_shards():
+    shards = {all_jobs_shard(job_id) for job_id in range(1, 1000)}
+    assert shards == set(range(-ALL_JOBS_SHARDS, 0))
+    assert all_jobs_shard(1) == all_jobs_shard(1 + ALL_JOBS_SHARDS)
+
+
+def test_adjust_spreads_all_jobs_totals_over_shards(run_async, db):
+    deltas = Counter({(1, "Pending"): 2, (1 + ALL_JOBS_SHARDS, "Pending"): 1, (2, "Pending"): 4, (2, "Rejected"): 1})
+
+    async def apply(session):
+        await status_counters.adjust(session, deltas)
+        await session.commit()
+
+    run_async(apply)
+
+    rows = _rows(db)
+    assert rows[(1, "Pending")] == 2
+    assert rows[(all_jobs_shard(1), "Pending")] == 3  # jobs 1 and 17 share a shard
+    assert rows[(all_jobs_shard(2), "Pending")] == 4
+    assert rows[(all_jobs_shard(2), "Rejected")] == 1
+    assert not any(job_id == 0 for job_id, _ in rows)
+
+
+def test_counts_sums_the_shards(run_async):
+    async def apply_and_count(session):
+        await status_counters.adjust(session, Counter({(1, "Pending"): 2, (2, "Pending"): 3, (2, "Shortlisted"): 1}))
+        await status_counters.adjust(session, Counter({(2, "Pending"): -1}))
+        await session.commit()
+        return await status_counters.counts(session), await status_counters.counts(session, 2)
+
+    all_jobs, job_2 = run_async(apply_and_count)
+    assert all_jobs == {"Pending": 4, "Shortlisted": 1}
+    assert job_2 == {"Pending": 2, "Shortlisted": 1}
+
+
+def _statements(fn):
+    """Run fn() and return the SQL verbs it sent through the async engine."""
+    verbs = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        verbs.append(statement.split(None, 1)[0].upper())
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        fn()
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+    return verbs
+
+
+def test_bump_rows_updates_existing_keys_in_one_statement(run_async, db):
+    keys = Counter({(job_id, "Pending"): 1 for job_id in range(1, 9)})
+
+    async def seed(session):
+        await status_counters.adjust(session, keys)
+        await session.commit()
+
+    async def bump(session):
+        await status_counters.adjust(session, keys + Counter({(3, "Pending"): 2}))
+        await session.commit()
+
+    run_async(seed)
+    verbs = _statements(lambda: run_async(bump))
+
+    assert verbs.count("UPDATE") == 1
+    assert "INSERT" not in verbs and "SELECT" not in verbs
+    rows = _rows(db)
+    assert rows[(3, "Pending")] == 4 and rows[(4, "Pending")] == 2
+
+
+def test_bump_rows_inserts_only_the_missing_keys(run_async, db):
+    async def seed(session):
+        await status_counters.adjust(session, Counter({(1, "Pending"): 1}))
+        await session.commit()
+
+    async def bump(session):
+        await status_counters.adjust(session, Counter({(1, "Pending"): 1, (2, "Pending"): 5, (2, "Rejected"): 1}))
+        await session.commit()
+
+    run_async(seed)
+    verbs = _statements(lambda: run_async(bump))
+
+    assert verbs.count("UPDATE") == 1 and verbs.count("INSERT") == 1
+    assert _rows(db) == {
+        (1, "Pending"): 2,
+        (all_jobs_shard(1), "Pending"): 2,
+        (2, "Pending"): 5,
+        (2, "Rejected"): 1,
+        (all_jobs_shard(2), "Pending"): 5,
+        (all_jobs_shard(2), "Rejected"): 1,
+    }